@@ -0,0 +1,40 @@
+import json
+import timeit
+
+from search_crawl.crawl.utils import URL, Navigation, Readable, prune_html
+
+ARTICLE = "".join(
+    f'<p>Paragraph {i} of the article with <a href="/post/{i}">a link</a>.</p>'
+    for i in range(200)
+)
+HYDRATION = json.dumps({"props": [{"id": i, "text": "x" * 200} for i in range(2000)]})
+ICONS = "".join(
+    f'<symbol id="i{i}"><path d="{"M0 0L24 24 " * 20}"/></symbol>' for i in range(300)
+)
+HTML = f"""<!DOCTYPE html><html><head><title>Post</title>
+<style>{"body { margin: 0 } " * 2000}</style>
+<script id="__NEXT_DATA__" type="application/json">{HYDRATION}</script>
+</head><body><svg style="display: none">{ICONS}</svg>
+<article>{ARTICLE}</article><script>{"track(); " * 5000}</script></body></html>"""
+
+
+def parse(raw_html: str) -> None:
+    readable = Readable(raw_html)
+    _ = readable.md, readable.summary_md
+    Navigation(raw_html, URL("https://example.com/post"))
+
+
+def main() -> None:
+    pruned = prune_html(HTML)
+    print(f"size: {len(HTML) / 1e3:.0f} kB -> {len(pruned) / 1e3:.0f} kB")
+    for name, func in [
+        ("prune_html", lambda: prune_html(HTML)),
+        ("parse full DOM", lambda: parse(HTML)),
+        ("parse pruned", lambda: parse(pruned)),
+    ]:
+        seconds = timeit.timeit(func, number=10) / 10
+        print(f"{name:<20} {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
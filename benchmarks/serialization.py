@@ -0,0 +1,88 @@
+import asyncio
+import json
+import math
+import timeit
+from collections.abc import Callable
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from fastapi.routing import APIRoute, serialize_response
+
+from search_crawl.cache.codec import CacheCodec, CompressionConfig, ValueFormat
+from search_crawl.crawl.schemas import ScrapeResult
+
+PAGES = 20
+URLS = 10
+MARKDOWN = "## Überschrift\n\n" + "Lorem ipsum dolor sit amet, 日本語. " * 3000
+
+results = [
+    [
+        ScrapeResult(
+            requested_url=f"https://example.com/{i}",
+            url=f"https://example.com/{i}/{j}",
+            content=MARKDOWN,
+        )
+        for j in range(PAGES)
+    ]
+    for i in range(URLS)
+]
+content = jsonable_encoder(results)
+search_results = [
+    {"url": f"https://example.com/{i}", "title": "日本語", "content": MARKDOWN[:300]}
+    for i in range(100)
+]
+
+
+async def crawl_many() -> list[list[ScrapeResult]]:
+    return results
+
+
+# the response model is validated and serialized before the response class renders
+route = APIRoute("/crawl-many", crawl_many, response_model=list[list[ScrapeResult]])
+loop = asyncio.new_event_loop()
+
+
+def route_response(response_class: type[Response]) -> Response:
+    serialized = loop.run_until_complete(
+        serialize_response(field=route.response_field, response_content=results)
+    )
+    return response_class(serialized)
+
+
+def bench(name: str, func: Callable[[], object], number: int) -> None:
+    seconds = timeit.timeit(func, number=number) / number
+    print(f"{name:<40} {seconds * 1000:9.3f} ms")
+
+
+def stdlib_dumps() -> bytes:
+    return json.dumps(search_results, ensure_ascii=False).encode()
+
+
+def main() -> None:
+    size = len(orjson.dumps(content))
+    print(f"/crawl-many response: {URLS}x{PAGES} pages, {size / 1e6:.1f} MB")
+    bench("route with JSONResponse", lambda: route_response(JSONResponse), 10)
+    bench("route with ORJSONResponse", lambda: route_response(ORJSONResponse), 10)
+    bench("JSONResponse render only", lambda: JSONResponse(content), 10)
+    bench("ORJSONResponse render only", lambda: ORJSONResponse(content), 10)
+
+    print(f"search cache value: {len(stdlib_dumps()) / 1e3:.1f} kB")
+    bench("json.dumps", stdlib_dumps, 1000)
+    bench("orjson.dumps", lambda: orjson.dumps(search_results), 1000)
+    raw = stdlib_dumps()
+    bench("json.loads", lambda: json.loads(raw), 1000)
+    bench("orjson.loads", lambda: orjson.loads(raw), 1000)
+
+    codec = CacheCodec(CompressionConfig())
+    encoded = codec.encode(search_results, ValueFormat.JSON, 0, math.inf)
+    bench(
+        "codec.encode",
+        lambda: codec.encode(search_results, ValueFormat.JSON, 0, math.inf),
+        1000,
+    )
+    bench("codec.decode", lambda: codec.decode(encoded), 1000)
+
+
+if __name__ == "__main__":
+    main()
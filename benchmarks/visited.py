@@ -0,0 +1,51 @@
+import timeit
+from functools import partial
+
+from search_crawl.crawl.utils import URL
+
+SIZES = [100, 200, 400, 2000]
+# the list is quadratic, so the largest crawls would take minutes
+LIST_MAX_PAGES = 400
+# every page links to the pages around it, as listings and navigation do
+LINKS_PER_PAGE = 5
+
+
+def discovered_links(pages: int) -> list[str]:
+    return [
+        f"https://example.com/docs/{(i + offset) % pages}?page=1&lang=en"
+        for i in range(pages)
+        for offset in range(LINKS_PER_PAGE)
+    ]
+
+
+def visit_list(links: list[str]) -> int:
+    visited: list[URL] = []
+    for link in links:
+        if link not in visited:
+            visited.append(URL(link))
+    return len(visited)
+
+
+def visit_set(links: list[str]) -> int:
+    visited: set[str] = set()
+    for link in links:
+        visited.add(URL(link).canonical)
+    return len(visited)
+
+
+def timed(visit: partial[int]) -> str:
+    return f"{timeit.timeit(visit, number=1) * 1000:.1f}ms"
+
+
+def main() -> None:
+    print(f"{'pages':>6} {'list':>10} {'set':>10}")
+    for pages in SIZES:
+        links = discovered_links(pages)
+        list_time = (
+            timed(partial(visit_list, links)) if pages <= LIST_MAX_PAGES else "-"
+        )
+        print(f"{pages:>6} {list_time:>10} {timed(partial(visit_set, links)):>10}")
+
+
+if __name__ == "__main__":
+    main()
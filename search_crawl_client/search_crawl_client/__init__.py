@@ -29,6 +29,10 @@ __all__ = [
     "ApiAttributeError",
     "ApiException",
     "CacheConfig",
+    "CacheNamespace",
+    "CacheOutcome",
+    "CacheStats",
+    "CacheTier",
     "CrawlConfig",
     "CrawlExtractRequest",
     "CrawlRequest",
@@ -39,7 +43,14 @@ __all__ = [
     "Engines",
     "ExtractRequest",
     "HTTPValidationError",
+    "Histogram",
+    "InvalidationRequest",
+    "InvalidationResult",
+    "MemoryTierStats",
+    "NamespaceStats",
     "OutputFormat",
+    "ScrapeError",
+    "ScrapeErrorKind",
     "ScrapeResult",
     "SearchCrawlExtractRequest",
     "SearchCrawlRequest",
@@ -48,6 +59,10 @@ __all__ = [
     "SearchResult",
     "ValidationError",
     "ValidationErrorLocInner",
+    "WarcImportResult",
+    "WarmJob",
+    "WarmJobStatus",
+    "WarmRequest",
 ]
 
 # import apis into sdk package
@@ -66,6 +81,10 @@ from search_crawl_client.exceptions import ApiException as ApiException
 
 # import models into sdk package
 from search_crawl_client.models.cache_config import CacheConfig as CacheConfig
+from search_crawl_client.models.cache_namespace import CacheNamespace as CacheNamespace
+from search_crawl_client.models.cache_outcome import CacheOutcome as CacheOutcome
+from search_crawl_client.models.cache_stats import CacheStats as CacheStats
+from search_crawl_client.models.cache_tier import CacheTier as CacheTier
 from search_crawl_client.models.crawl_config import CrawlConfig as CrawlConfig
 from search_crawl_client.models.crawl_extract_request import CrawlExtractRequest as CrawlExtractRequest
 from search_crawl_client.models.crawl_request import CrawlRequest as CrawlRequest
@@ -76,7 +95,14 @@ from search_crawl_client.models.engine_preset_key import EnginePresetKey as Engi
 from search_crawl_client.models.engines import Engines as Engines
 from search_crawl_client.models.extract_request import ExtractRequest as ExtractRequest
 from search_crawl_client.models.http_validation_error import HTTPValidationError as HTTPValidationError
+from search_crawl_client.models.histogram import Histogram as Histogram
+from search_crawl_client.models.invalidation_request import InvalidationRequest as InvalidationRequest
+from search_crawl_client.models.invalidation_result import InvalidationResult as InvalidationResult
+from search_crawl_client.models.memory_tier_stats import MemoryTierStats as MemoryTierStats
+from search_crawl_client.models.namespace_stats import NamespaceStats as NamespaceStats
 from search_crawl_client.models.output_format import OutputFormat as OutputFormat
+from search_crawl_client.models.scrape_error import ScrapeError as ScrapeError
+from search_crawl_client.models.scrape_error_kind import ScrapeErrorKind as ScrapeErrorKind
 from search_crawl_client.models.scrape_result import ScrapeResult as ScrapeResult
 from search_crawl_client.models.search_crawl_extract_request import SearchCrawlExtractRequest as SearchCrawlExtractRequest
 from search_crawl_client.models.search_crawl_request import SearchCrawlRequest as SearchCrawlRequest
@@ -85,3 +111,7 @@ from search_crawl_client.models.search_request import SearchRequest as SearchReq
 from search_crawl_client.models.search_result import SearchResult as SearchResult
 from search_crawl_client.models.validation_error import ValidationError as ValidationError
 from search_crawl_client.models.validation_error_loc_inner import ValidationErrorLocInner as ValidationErrorLocInner
+from search_crawl_client.models.warc_import_result import WarcImportResult as WarcImportResult
+from search_crawl_client.models.warm_job import WarmJob as WarmJob
+from search_crawl_client.models.warm_job_status import WarmJobStatus as WarmJobStatus
+from search_crawl_client.models.warm_request import WarmRequest as WarmRequest
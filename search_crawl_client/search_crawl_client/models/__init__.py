@@ -15,6 +15,10 @@
 
 # import models into model package
 from search_crawl_client.models.cache_config import CacheConfig
+from search_crawl_client.models.cache_namespace import CacheNamespace
+from search_crawl_client.models.cache_outcome import CacheOutcome
+from search_crawl_client.models.cache_stats import CacheStats
+from search_crawl_client.models.cache_tier import CacheTier
 from search_crawl_client.models.crawl_config import CrawlConfig
 from search_crawl_client.models.crawl_extract_request import CrawlExtractRequest
 from search_crawl_client.models.crawl_request import CrawlRequest
@@ -25,7 +29,14 @@ from search_crawl_client.models.engine_preset_key import EnginePresetKey
 from search_crawl_client.models.engines import Engines
 from search_crawl_client.models.extract_request import ExtractRequest
 from search_crawl_client.models.http_validation_error import HTTPValidationError
+from search_crawl_client.models.histogram import Histogram
+from search_crawl_client.models.invalidation_request import InvalidationRequest
+from search_crawl_client.models.invalidation_result import InvalidationResult
+from search_crawl_client.models.memory_tier_stats import MemoryTierStats
+from search_crawl_client.models.namespace_stats import NamespaceStats
 from search_crawl_client.models.output_format import OutputFormat
+from search_crawl_client.models.scrape_error import ScrapeError
+from search_crawl_client.models.scrape_error_kind import ScrapeErrorKind
 from search_crawl_client.models.scrape_result import ScrapeResult
 from search_crawl_client.models.search_crawl_extract_request import SearchCrawlExtractRequest
 from search_crawl_client.models.search_crawl_request import SearchCrawlRequest
@@ -34,3 +45,7 @@ from search_crawl_client.models.search_request import SearchRequest
 from search_crawl_client.models.search_result import SearchResult
 from search_crawl_client.models.validation_error import ValidationError
 from search_crawl_client.models.validation_error_loc_inner import ValidationErrorLocInner
+from search_crawl_client.models.warc_import_result import WarcImportResult
+from search_crawl_client.models.warm_job import WarmJob
+from search_crawl_client.models.warm_job_status import WarmJobStatus
+from search_crawl_client.models.warm_request import WarmRequest
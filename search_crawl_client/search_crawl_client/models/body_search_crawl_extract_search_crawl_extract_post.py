@@ -1,103 +0,0 @@
-# coding: utf-8
-
-"""
-    FastAPI
-
-    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
-
-    The version of the OpenAPI document: 0.1.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
-"""  # noqa: E501
-
-
-from __future__ import annotations
-import pprint
-import re  # noqa: F401
-import json
-
-from pydantic import BaseModel, ConfigDict
-from typing import Any, ClassVar, Dict, List
-from search_crawl_client.models.base_crawl_request import BaseCrawlRequest
-from search_crawl_client.models.extract_request import ExtractRequest
-from search_crawl_client.models.search_request import SearchRequest
-from typing import Optional, Set
-from typing_extensions import Self
-
-class BodySearchCrawlExtractSearchCrawlExtractPost(BaseModel):
-    """
-    BodySearchCrawlExtractSearchCrawlExtractPost
-    """ # noqa: E501
-    search_request: SearchRequest
-    crawl_request: BaseCrawlRequest
-    extract_request: ExtractRequest
-    __properties: ClassVar[List[str]] = ["search_request", "crawl_request", "extract_request"]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of BodySearchCrawlExtractSearchCrawlExtractPost from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([
-        ])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of search_request
-        if self.search_request:
-            _dict['search_request'] = self.search_request.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of crawl_request
-        if self.crawl_request:
-            _dict['crawl_request'] = self.crawl_request.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of extract_request
-        if self.extract_request:
-            _dict['extract_request'] = self.extract_request.to_dict()
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of BodySearchCrawlExtractSearchCrawlExtractPost from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate({
-            "search_request": SearchRequest.from_dict(obj["search_request"]) if obj.get("search_request") is not None else None,
-            "crawl_request": BaseCrawlRequest.from_dict(obj["crawl_request"]) if obj.get("crawl_request") is not None else None,
-            "extract_request": ExtractRequest.from_dict(obj["extract_request"]) if obj.get("extract_request") is not None else None
-        })
-        return _obj
-
-
@@ -17,8 +17,9 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt
-from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, StrictBool, StrictFloat, StrictInt
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from search_crawl_client.models.cache_namespace import CacheNamespace
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -29,7 +30,15 @@ class CacheConfig(BaseModel):
     readable: Optional[StrictBool] = True
     writable: Optional[StrictBool] = True
     ttl: Optional[StrictInt] = None
-    __properties: ClassVar[List[str]] = ["readable", "writable", "ttl"]
+    ttl_jitter: Optional[Union[StrictFloat, StrictInt]] = 0.1
+    stale_while_revalidate: Optional[StrictInt] = None
+    revalidation_window: Optional[StrictInt] = None
+    memory_namespaces: Optional[List[CacheNamespace]] = None
+    redirect_aliases: Optional[StrictBool] = True
+    negative_cache: Optional[StrictBool] = True
+    response_cache: Optional[StrictBool] = True
+    only_if_cached: Optional[StrictBool] = False
+    __properties: ClassVar[List[str]] = ["readable", "writable", "ttl", "ttl_jitter", "stale_while_revalidate", "revalidation_window", "memory_namespaces", "redirect_aliases", "negative_cache", "response_cache", "only_if_cached"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -75,6 +84,16 @@ class CacheConfig(BaseModel):
         if self.ttl is None and "ttl" in self.model_fields_set:
             _dict['ttl'] = None
 
+        # set to None if stale_while_revalidate (nullable) is None
+        # and model_fields_set contains the field
+        if self.stale_while_revalidate is None and "stale_while_revalidate" in self.model_fields_set:
+            _dict['stale_while_revalidate'] = None
+
+        # set to None if revalidation_window (nullable) is None
+        # and model_fields_set contains the field
+        if self.revalidation_window is None and "revalidation_window" in self.model_fields_set:
+            _dict['revalidation_window'] = None
+
         return _dict
 
     @classmethod
@@ -89,7 +108,15 @@ class CacheConfig(BaseModel):
         _obj = cls.model_validate({
             "readable": obj.get("readable") if obj.get("readable") is not None else True,
             "writable": obj.get("writable") if obj.get("writable") is not None else True,
-            "ttl": obj.get("ttl")
+            "ttl": obj.get("ttl"),
+            "ttl_jitter": obj.get("ttl_jitter") if obj.get("ttl_jitter") is not None else 0.1,
+            "stale_while_revalidate": obj.get("stale_while_revalidate"),
+            "revalidation_window": obj.get("revalidation_window"),
+            "memory_namespaces": obj.get("memory_namespaces"),
+            "redirect_aliases": obj.get("redirect_aliases") if obj.get("redirect_aliases") is not None else True,
+            "negative_cache": obj.get("negative_cache") if obj.get("negative_cache") is not None else True,
+            "response_cache": obj.get("response_cache") if obj.get("response_cache") is not None else True,
+            "only_if_cached": obj.get("only_if_cached") if obj.get("only_if_cached") is not None else False
         })
         return _obj
 
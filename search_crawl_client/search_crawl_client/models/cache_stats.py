@@ -19,18 +19,18 @@ import json
 
 from pydantic import BaseModel, ConfigDict
 from typing import Any, ClassVar, Dict, List, Optional
-from search_crawl_client.models.base_crawl_request import BaseCrawlRequest
-from search_crawl_client.models.general_search_request import GeneralSearchRequest
+from search_crawl_client.models.memory_tier_stats import MemoryTierStats
+from search_crawl_client.models.namespace_stats import NamespaceStats
 from typing import Optional, Set
 from typing_extensions import Self
 
-class GeneralSearchCrawlRequest(BaseModel):
+class CacheStats(BaseModel):
     """
-    GeneralSearchCrawlRequest
+    CacheStats
     """ # noqa: E501
-    crawl: Optional[BaseCrawlRequest] = None
-    search: GeneralSearchRequest
-    __properties: ClassVar[List[str]] = ["crawl", "search"]
+    namespaces: Optional[Dict[str, NamespaceStats]] = None
+    memory: Optional[MemoryTierStats] = None
+    __properties: ClassVar[List[str]] = ["namespaces", "memory"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +50,7 @@ class GeneralSearchCrawlRequest(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of GeneralSearchCrawlRequest from a JSON string"""
+        """Create an instance of CacheStats from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,17 +71,26 @@ class GeneralSearchCrawlRequest(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of crawl
-        if self.crawl:
-            _dict['crawl'] = self.crawl.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of search
-        if self.search:
-            _dict['search'] = self.search.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of each value in namespaces (dict)
+        _field_dict = {}
+        if self.namespaces:
+            for _key_namespaces in self.namespaces:
+                if self.namespaces[_key_namespaces]:
+                    _field_dict[_key_namespaces] = self.namespaces[_key_namespaces].to_dict()
+            _dict['namespaces'] = _field_dict
+        # override the default output from pydantic by calling `to_dict()` of memory
+        if self.memory:
+            _dict['memory'] = self.memory.to_dict()
+        # set to None if memory (nullable) is None
+        # and model_fields_set contains the field
+        if self.memory is None and "memory" in self.model_fields_set:
+            _dict['memory'] = None
+
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of GeneralSearchCrawlRequest from a dict"""
+        """Create an instance of CacheStats from a dict"""
         if obj is None:
             return None
 
@@ -89,8 +98,13 @@ class GeneralSearchCrawlRequest(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "crawl": BaseCrawlRequest.from_dict(obj["crawl"]) if obj.get("crawl") is not None else None,
-            "search": GeneralSearchRequest.from_dict(obj["search"]) if obj.get("search") is not None else None
+            "namespaces": dict(
+                (_k, NamespaceStats.from_dict(_v))
+                for _k, _v in obj["namespaces"].items()
+            )
+            if obj.get("namespaces") is not None
+            else None,
+            "memory": MemoryTierStats.from_dict(obj["memory"]) if obj.get("memory") is not None else None
         })
         return _obj
 
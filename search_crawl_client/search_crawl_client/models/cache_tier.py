@@ -18,21 +18,21 @@ from enum import Enum
 from typing_extensions import Self
 
 
-class ModelName(str, Enum):
+class CacheTier(str, Enum):
     """
-    ModelName
+    CacheTier
     """
 
     """
     allowed enum values
     """
-    GENERALENGINEPRESET = 'GeneralEnginePreset'
-    IMAGEENGINEPRESET = 'ImageEnginePreset'
-    LEFT_SQUARE_BRACKET_A_COMMA__B_RIGHT_SQUARE_BRACKET = '[a, b]'
+    PREFETCH = 'prefetch'
+    MEMORY = 'memory'
+    BACKEND = 'backend'
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
-        """Create an instance of ModelName from a JSON string"""
+        """Create an instance of CacheTier from a JSON string"""
         return cls(json.loads(json_str))
 
 
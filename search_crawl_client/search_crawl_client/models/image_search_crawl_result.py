@@ -1,101 +0,0 @@
-# coding: utf-8
-
-"""
-    FastAPI
-
-    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
-
-    The version of the OpenAPI document: 0.1.0
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-    Do not edit the class manually.
-"""  # noqa: E501
-
-
-from __future__ import annotations
-import pprint
-import re  # noqa: F401
-import json
-
-from pydantic import BaseModel, ConfigDict
-from typing import Any, ClassVar, Dict, List
-from search_crawl_client.models.image_search_result import ImageSearchResult
-from search_crawl_client.models.scrape_result import ScrapeResult
-from typing import Optional, Set
-from typing_extensions import Self
-
-class ImageSearchCrawlResult(BaseModel):
-    """
-    ImageSearchCrawlResult
-    """ # noqa: E501
-    search: ImageSearchResult
-    crawl: List[ScrapeResult]
-    __properties: ClassVar[List[str]] = ["search", "crawl"]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of ImageSearchCrawlResult from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([
-        ])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of search
-        if self.search:
-            _dict['search'] = self.search.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of each item in crawl (list)
-        _items = []
-        if self.crawl:
-            for _item_crawl in self.crawl:
-                if _item_crawl:
-                    _items.append(_item_crawl.to_dict())
-            _dict['crawl'] = _items
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of ImageSearchCrawlResult from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate({
-            "search": ImageSearchResult.from_dict(obj["search"]) if obj.get("search") is not None else None,
-            "crawl": [ScrapeResult.from_dict(_item) for _item in obj["crawl"]] if obj.get("crawl") is not None else None
-        })
-        return _obj
-
-
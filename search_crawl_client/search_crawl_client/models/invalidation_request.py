@@ -17,20 +17,21 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictBool
-from typing import Any, ClassVar, Dict, List, Optional
-from search_crawl_client.models.ttl import Ttl
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from search_crawl_client.models.cache_namespace import CacheNamespace
 from typing import Optional, Set
 from typing_extensions import Self
 
-class CacheStrategy(BaseModel):
+class InvalidationRequest(BaseModel):
     """
-    CacheStrategy
+    InvalidationRequest
     """ # noqa: E501
-    readable: Optional[StrictBool] = True
-    writable: Optional[StrictBool] = True
-    ttl: Optional[Ttl] = None
-    __properties: ClassVar[List[str]] = ["readable", "writable", "ttl"]
+    namespaces: Optional[List[CacheNamespace]] = None
+    prefix: Optional[StrictStr] = None
+    domain: Optional[StrictStr] = None
+    older_than: Optional[Union[StrictFloat, StrictInt]] = None
+    __properties: ClassVar[List[str]] = ["namespaces", "prefix", "domain", "older_than"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +51,7 @@ class CacheStrategy(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of CacheStrategy from a JSON string"""
+        """Create an instance of InvalidationRequest from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,19 +72,26 @@ class CacheStrategy(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of ttl
-        if self.ttl:
-            _dict['ttl'] = self.ttl.to_dict()
-        # set to None if ttl (nullable) is None
+        # set to None if prefix (nullable) is None
         # and model_fields_set contains the field
-        if self.ttl is None and "ttl" in self.model_fields_set:
-            _dict['ttl'] = None
+        if self.prefix is None and "prefix" in self.model_fields_set:
+            _dict['prefix'] = None
+
+        # set to None if domain (nullable) is None
+        # and model_fields_set contains the field
+        if self.domain is None and "domain" in self.model_fields_set:
+            _dict['domain'] = None
+
+        # set to None if older_than (nullable) is None
+        # and model_fields_set contains the field
+        if self.older_than is None and "older_than" in self.model_fields_set:
+            _dict['older_than'] = None
 
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of CacheStrategy from a dict"""
+        """Create an instance of InvalidationRequest from a dict"""
         if obj is None:
             return None
 
@@ -91,9 +99,10 @@ class CacheStrategy(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "readable": obj.get("readable") if obj.get("readable") is not None else True,
-            "writable": obj.get("writable") if obj.get("writable") is not None else True,
-            "ttl": Ttl.from_dict(obj["ttl"]) if obj.get("ttl") is not None else None
+            "namespaces": obj.get("namespaces"),
+            "prefix": obj.get("prefix"),
+            "domain": obj.get("domain"),
+            "older_than": obj.get("older_than")
         })
         return _obj
 
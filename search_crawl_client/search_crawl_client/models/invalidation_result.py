@@ -17,19 +17,18 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
-from search_crawl_client.models.cache_strategy import CacheStrategy
 from typing import Optional, Set
 from typing_extensions import Self
 
-class BodyCrawlManyCrawlManyPost(BaseModel):
+class InvalidationResult(BaseModel):
     """
-    BodyCrawlManyCrawlManyPost
+    InvalidationResult
     """ # noqa: E501
-    urls: List[StrictStr]
-    cache_strategy: Optional[CacheStrategy] = None
-    __properties: ClassVar[List[str]] = ["urls", "cache_strategy"]
+    scanned: Optional[StrictInt] = 0
+    deleted: Optional[StrictInt] = 0
+    __properties: ClassVar[List[str]] = ["scanned", "deleted"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -49,7 +48,7 @@ class BodyCrawlManyCrawlManyPost(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of BodyCrawlManyCrawlManyPost from a JSON string"""
+        """Create an instance of InvalidationResult from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -70,14 +69,11 @@ class BodyCrawlManyCrawlManyPost(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of cache_strategy
-        if self.cache_strategy:
-            _dict['cache_strategy'] = self.cache_strategy.to_dict()
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of BodyCrawlManyCrawlManyPost from a dict"""
+        """Create an instance of InvalidationResult from a dict"""
         if obj is None:
             return None
 
@@ -85,8 +81,8 @@ class BodyCrawlManyCrawlManyPost(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "urls": obj.get("urls"),
-            "cache_strategy": CacheStrategy.from_dict(obj["cache_strategy"]) if obj.get("cache_strategy") is not None else None
+            "scanned": obj.get("scanned") if obj.get("scanned") is not None else 0,
+            "deleted": obj.get("deleted") if obj.get("deleted") is not None else 0
         })
         return _obj
 
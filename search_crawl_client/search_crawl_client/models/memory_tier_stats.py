@@ -17,20 +17,19 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictInt
 from typing import Any, ClassVar, Dict, List
 from typing import Optional, Set
 from typing_extensions import Self
 
-class ImageSearchResult(BaseModel):
+class MemoryTierStats(BaseModel):
     """
-    ImageSearchResult
+    MemoryTierStats
     """ # noqa: E501
-    url: StrictStr
-    title: StrictStr
-    content: StrictStr
-    img_src: StrictStr
-    __properties: ClassVar[List[str]] = ["url", "title", "content", "img_src"]
+    entries: StrictInt
+    total_bytes: StrictInt
+    max_bytes: StrictInt
+    __properties: ClassVar[List[str]] = ["entries", "total_bytes", "max_bytes"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +49,7 @@ class ImageSearchResult(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of ImageSearchResult from a JSON string"""
+        """Create an instance of MemoryTierStats from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -75,7 +74,7 @@ class ImageSearchResult(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of ImageSearchResult from a dict"""
+        """Create an instance of MemoryTierStats from a dict"""
         if obj is None:
             return None
 
@@ -83,10 +82,9 @@ class ImageSearchResult(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "url": obj.get("url"),
-            "title": obj.get("title"),
-            "content": obj.get("content"),
-            "img_src": obj.get("img_src")
+            "entries": obj.get("entries"),
+            "total_bytes": obj.get("total_bytes"),
+            "max_bytes": obj.get("max_bytes")
         })
         return _obj
 
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+"""
+    FastAPI
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+    The version of the OpenAPI document: 0.1.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from search_crawl_client.models.histogram import Histogram
+from typing import Optional, Set
+from typing_extensions import Self
+
+class NamespaceStats(BaseModel):
+    """
+    NamespaceStats
+    """ # noqa: E501
+    outcomes: Optional[Dict[str, StrictInt]] = None
+    tier_hits: Optional[Dict[str, StrictInt]] = None
+    revalidations: Optional[StrictInt] = 0
+    rejected_writes: Optional[StrictInt] = 0
+    read_latency: Optional[Histogram] = None
+    write_latency: Optional[Histogram] = None
+    read_bytes: Optional[Histogram] = None
+    written_bytes: Optional[Histogram] = None
+    hit_ratio: Optional[Union[StrictFloat, StrictInt]]
+    __properties: ClassVar[List[str]] = ["outcomes", "tier_hits", "revalidations", "rejected_writes", "read_latency", "write_latency", "read_bytes", "written_bytes", "hit_ratio"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of NamespaceStats from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([
+        ])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of read_latency
+        if self.read_latency:
+            _dict['read_latency'] = self.read_latency.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of write_latency
+        if self.write_latency:
+            _dict['write_latency'] = self.write_latency.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of read_bytes
+        if self.read_bytes:
+            _dict['read_bytes'] = self.read_bytes.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of written_bytes
+        if self.written_bytes:
+            _dict['written_bytes'] = self.written_bytes.to_dict()
+        # set to None if hit_ratio (nullable) is None
+        # and model_fields_set contains the field
+        if self.hit_ratio is None and "hit_ratio" in self.model_fields_set:
+            _dict['hit_ratio'] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of NamespaceStats from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "outcomes": obj.get("outcomes"),
+            "tier_hits": obj.get("tier_hits"),
+            "revalidations": obj.get("revalidations") if obj.get("revalidations") is not None else 0,
+            "rejected_writes": obj.get("rejected_writes") if obj.get("rejected_writes") is not None else 0,
+            "read_latency": Histogram.from_dict(obj["read_latency"]) if obj.get("read_latency") is not None else None,
+            "write_latency": Histogram.from_dict(obj["write_latency"]) if obj.get("write_latency") is not None else None,
+            "read_bytes": Histogram.from_dict(obj["read_bytes"]) if obj.get("read_bytes") is not None else None,
+            "written_bytes": Histogram.from_dict(obj["written_bytes"]) if obj.get("written_bytes") is not None else None,
+            "hit_ratio": obj.get("hit_ratio")
+        })
+        return _obj
+
+
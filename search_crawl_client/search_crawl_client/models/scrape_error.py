@@ -17,20 +17,20 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from search_crawl_client.models.scrape_error_kind import ScrapeErrorKind
 from typing import Optional, Set
 from typing_extensions import Self
 
-class GeneralSearchResult(BaseModel):
+class ScrapeError(BaseModel):
     """
-    GeneralSearchResult
+    ScrapeError
     """ # noqa: E501
-    url: StrictStr
-    title: StrictStr
-    content: StrictStr
-    thumbnail: Optional[StrictStr]
-    __properties: ClassVar[List[str]] = ["url", "title", "content", "thumbnail"]
+    kind: ScrapeErrorKind
+    status: Optional[StrictInt] = None
+    message: Optional[StrictStr] = ''
+    __properties: ClassVar[List[str]] = ["kind", "status", "message"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +50,7 @@ class GeneralSearchResult(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of GeneralSearchResult from a JSON string"""
+        """Create an instance of ScrapeError from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,16 +71,16 @@ class GeneralSearchResult(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # set to None if thumbnail (nullable) is None
+        # set to None if status (nullable) is None
         # and model_fields_set contains the field
-        if self.thumbnail is None and "thumbnail" in self.model_fields_set:
-            _dict['thumbnail'] = None
+        if self.status is None and "status" in self.model_fields_set:
+            _dict['status'] = None
 
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of GeneralSearchResult from a dict"""
+        """Create an instance of ScrapeError from a dict"""
         if obj is None:
             return None
 
@@ -88,10 +88,9 @@ class GeneralSearchResult(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "url": obj.get("url"),
-            "title": obj.get("title"),
-            "content": obj.get("content"),
-            "thumbnail": obj.get("thumbnail")
+            "kind": obj.get("kind"),
+            "status": obj.get("status"),
+            "message": obj.get("message") if obj.get("message") is not None else ''
         })
         return _obj
 
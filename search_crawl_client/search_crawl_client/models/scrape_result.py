@@ -18,7 +18,8 @@ import re  # noqa: F401
 import json
 
 from pydantic import BaseModel, ConfigDict, StrictStr
-from typing import Any, ClassVar, Dict, List
+from typing import Any, ClassVar, Dict, List, Optional
+from search_crawl_client.models.scrape_error import ScrapeError
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -28,14 +29,15 @@ class ScrapeResult(BaseModel):
     """ # noqa: E501
     requested_url: StrictStr
     url: StrictStr
-    title: StrictStr
-    short_title: StrictStr
-    author: StrictStr
-    content: StrictStr
-    links: List[StrictStr]
-    internal_links: List[StrictStr]
-    pagination_links: List[StrictStr]
-    __properties: ClassVar[List[str]] = ["requested_url", "url", "title", "short_title", "author", "content", "links", "internal_links", "pagination_links"]
+    title: Optional[StrictStr] = ''
+    short_title: Optional[StrictStr] = ''
+    author: Optional[StrictStr] = ''
+    content: Optional[StrictStr] = ''
+    links: Optional[List[StrictStr]] = None
+    internal_links: Optional[List[StrictStr]] = None
+    pagination_links: Optional[List[StrictStr]] = None
+    error: Optional[ScrapeError] = None
+    __properties: ClassVar[List[str]] = ["requested_url", "url", "title", "short_title", "author", "content", "links", "internal_links", "pagination_links", "error"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -76,6 +78,14 @@ class ScrapeResult(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
+        # override the default output from pydantic by calling `to_dict()` of error
+        if self.error:
+            _dict['error'] = self.error.to_dict()
+        # set to None if error (nullable) is None
+        # and model_fields_set contains the field
+        if self.error is None and "error" in self.model_fields_set:
+            _dict['error'] = None
+
         return _dict
 
     @classmethod
@@ -90,13 +100,14 @@ class ScrapeResult(BaseModel):
         _obj = cls.model_validate({
             "requested_url": obj.get("requested_url"),
             "url": obj.get("url"),
-            "title": obj.get("title"),
-            "short_title": obj.get("short_title"),
-            "author": obj.get("author"),
-            "content": obj.get("content"),
+            "title": obj.get("title") if obj.get("title") is not None else '',
+            "short_title": obj.get("short_title") if obj.get("short_title") is not None else '',
+            "author": obj.get("author") if obj.get("author") is not None else '',
+            "content": obj.get("content") if obj.get("content") is not None else '',
             "links": obj.get("links"),
             "internal_links": obj.get("internal_links"),
-            "pagination_links": obj.get("pagination_links")
+            "pagination_links": obj.get("pagination_links"),
+            "error": ScrapeError.from_dict(obj["error"]) if obj.get("error") is not None else None
         })
         return _obj
 
@@ -19,17 +19,16 @@ import json
 
 from pydantic import BaseModel, ConfigDict, StrictInt
 from typing import Any, ClassVar, Dict, List, Optional
-from search_crawl_client.models.cache_config import CacheConfig
 from typing import Optional, Set
 from typing_extensions import Self
 
-class BaseCrawlRequest(BaseModel):
+class WarcImportResult(BaseModel):
     """
-    BaseCrawlRequest
+    WarcImportResult
     """ # noqa: E501
-    cache_config: Optional[CacheConfig] = None
-    concurrently: Optional[StrictInt] = 2
-    __properties: ClassVar[List[str]] = ["cache_config", "concurrently"]
+    imported: Optional[StrictInt] = 0
+    skipped: Optional[StrictInt] = 0
+    __properties: ClassVar[List[str]] = ["imported", "skipped"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -49,7 +48,7 @@ class BaseCrawlRequest(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of BaseCrawlRequest from a JSON string"""
+        """Create an instance of WarcImportResult from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -70,14 +69,11 @@ class BaseCrawlRequest(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of cache_config
-        if self.cache_config:
-            _dict['cache_config'] = self.cache_config.to_dict()
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of BaseCrawlRequest from a dict"""
+        """Create an instance of WarcImportResult from a dict"""
         if obj is None:
             return None
 
@@ -85,8 +81,8 @@ class BaseCrawlRequest(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "cache_config": CacheConfig.from_dict(obj["cache_config"]) if obj.get("cache_config") is not None else None,
-            "concurrently": obj.get("concurrently") if obj.get("concurrently") is not None else 2
+            "imported": obj.get("imported") if obj.get("imported") is not None else 0,
+            "skipped": obj.get("skipped") if obj.get("skipped") is not None else 0
         })
         return _obj
 
@@ -19,18 +19,21 @@ import json
 
 from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
-from search_crawl_client.models.cache_strategy import CacheStrategy
+from search_crawl_client.models.warm_job_status import WarmJobStatus
 from typing import Optional, Set
 from typing_extensions import Self
 
-class CrawlManyApiArg(BaseModel):
+class WarmJob(BaseModel):
     """
-    CrawlManyApiArg
+    WarmJob
     """ # noqa: E501
-    cache_strategy: Optional[CacheStrategy] = None
-    concurrently: Optional[StrictInt] = 2
-    urls: List[StrictStr]
-    __properties: ClassVar[List[str]] = ["cache_strategy", "concurrently", "urls"]
+    id: Optional[StrictStr] = None
+    status: Optional[WarmJobStatus] = None
+    total: Optional[StrictInt] = 0
+    completed: Optional[StrictInt] = 0
+    failed: Optional[StrictInt] = 0
+    error: Optional[StrictStr] = None
+    __properties: ClassVar[List[str]] = ["id", "status", "total", "completed", "failed", "error"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +53,7 @@ class CrawlManyApiArg(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of CrawlManyApiArg from a JSON string"""
+        """Create an instance of WarmJob from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,14 +74,16 @@ class CrawlManyApiArg(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of cache_strategy
-        if self.cache_strategy:
-            _dict['cache_strategy'] = self.cache_strategy.to_dict()
+        # set to None if error (nullable) is None
+        # and model_fields_set contains the field
+        if self.error is None and "error" in self.model_fields_set:
+            _dict['error'] = None
+
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of CrawlManyApiArg from a dict"""
+        """Create an instance of WarmJob from a dict"""
         if obj is None:
             return None
 
@@ -86,9 +91,12 @@ class CrawlManyApiArg(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "cache_strategy": CacheStrategy.from_dict(obj["cache_strategy"]) if obj.get("cache_strategy") is not None else None,
-            "concurrently": obj.get("concurrently") if obj.get("concurrently") is not None else 2,
-            "urls": obj.get("urls")
+            "id": obj.get("id"),
+            "status": obj.get("status"),
+            "total": obj.get("total") if obj.get("total") is not None else 0,
+            "completed": obj.get("completed") if obj.get("completed") is not None else 0,
+            "failed": obj.get("failed") if obj.get("failed") is not None else 0,
+            "error": obj.get("error")
         })
         return _obj
 
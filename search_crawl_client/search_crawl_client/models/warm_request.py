@@ -20,17 +20,20 @@ import json
 from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from search_crawl_client.models.cache_config import CacheConfig
+from search_crawl_client.models.crawl_config import CrawlConfig
 from typing import Optional, Set
 from typing_extensions import Self
 
-class CrawlManyRequest(BaseModel):
+class WarmRequest(BaseModel):
     """
-    CrawlManyRequest
+    WarmRequest
     """ # noqa: E501
+    urls: Optional[List[StrictStr]] = None
+    sitemap_url: Optional[StrictStr] = None
+    max_urls: Optional[StrictInt] = None
+    crawl_config: Optional[CrawlConfig] = None
     cache_config: Optional[CacheConfig] = None
-    concurrently: Optional[StrictInt] = 2
-    urls: List[StrictStr]
-    __properties: ClassVar[List[str]] = ["cache_config", "concurrently", "urls"]
+    __properties: ClassVar[List[str]] = ["urls", "sitemap_url", "max_urls", "crawl_config", "cache_config"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -50,7 +53,7 @@ class CrawlManyRequest(BaseModel):
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of CrawlManyRequest from a JSON string"""
+        """Create an instance of WarmRequest from a JSON string"""
         return cls.from_dict(json.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,14 +74,27 @@ class CrawlManyRequest(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
+        # override the default output from pydantic by calling `to_dict()` of crawl_config
+        if self.crawl_config:
+            _dict['crawl_config'] = self.crawl_config.to_dict()
         # override the default output from pydantic by calling `to_dict()` of cache_config
         if self.cache_config:
             _dict['cache_config'] = self.cache_config.to_dict()
+        # set to None if sitemap_url (nullable) is None
+        # and model_fields_set contains the field
+        if self.sitemap_url is None and "sitemap_url" in self.model_fields_set:
+            _dict['sitemap_url'] = None
+
+        # set to None if max_urls (nullable) is None
+        # and model_fields_set contains the field
+        if self.max_urls is None and "max_urls" in self.model_fields_set:
+            _dict['max_urls'] = None
+
         return _dict
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of CrawlManyRequest from a dict"""
+        """Create an instance of WarmRequest from a dict"""
         if obj is None:
             return None
 
@@ -86,9 +102,11 @@ class CrawlManyRequest(BaseModel):
             return cls.model_validate(obj)
 
         _obj = cls.model_validate({
-            "cache_config": CacheConfig.from_dict(obj["cache_config"]) if obj.get("cache_config") is not None else None,
-            "concurrently": obj.get("concurrently") if obj.get("concurrently") is not None else 2,
-            "urls": obj.get("urls")
+            "urls": obj.get("urls"),
+            "sitemap_url": obj.get("sitemap_url"),
+            "max_urls": obj.get("max_urls"),
+            "crawl_config": CrawlConfig.from_dict(obj["crawl_config"]) if obj.get("crawl_config") is not None else None,
+            "cache_config": CacheConfig.from_dict(obj["cache_config"]) if obj.get("cache_config") is not None else None
         })
         return _obj
 
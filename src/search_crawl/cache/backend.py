@@ -0,0 +1,53 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from enum import StrEnum, auto
+
+from fastapi import FastAPI
+
+from search_crawl.env_config import EnvConfig
+
+from .backends.base import CacheBackend
+from .backends.memory import MemoryBackend, MemoryBackendConfig
+from .backends.redis import RedisBackend, RedisPoolConfig
+from .backends.sqlite import SQLiteBackend, SQLiteCacheConfig
+
+
+class BackendKind(StrEnum):
+    REDIS = auto()
+    SQLITE = auto()
+    MEMORY = auto()
+
+
+class CacheBackendConfig(EnvConfig):
+    env_prefix = "CACHE_"
+
+    backend: BackendKind = BackendKind.REDIS
+
+    def create_backend(self) -> CacheBackend:
+        match self.backend:
+            case BackendKind.REDIS:
+                return RedisBackend(RedisPoolConfig.from_env().create_client())
+            case BackendKind.SQLITE:
+                return SQLiteBackend(SQLiteCacheConfig.from_env())
+            case BackendKind.MEMORY:
+                return MemoryBackend(MemoryBackendConfig.from_env())
+
+
+backend: CacheBackend | None = None
+
+
+def get_backend() -> CacheBackend:
+    if backend is None:
+        raise RuntimeError("Cache backend is not initialized outside of app lifespan")
+    return backend
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
+    global backend  # noqa: PLW0603
+    backend = CacheBackendConfig.from_env().create_backend()
+    try:
+        yield
+    finally:
+        await backend.aclose()
+        backend = None
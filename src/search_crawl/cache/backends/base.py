@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from enum import StrEnum, auto
+
+# ttl() follows the Redis TTL command
+NO_EXPIRY = -1
+MISSING = -2
+SCAN_BATCH = 1000
+# eviction frees a little more than needed so it does not run on every write
+LOW_WATERMARK = 0.9
+
+
+class Eviction(StrEnum):
+    LRU = auto()
+    LFU = auto()
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]: ...
+
+    @abstractmethod
+    async def mget(self, keys: list[str]) -> list[bytes | None]: ...
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, *, nx: bool = False
+    ) -> bool: ...
+
+    @abstractmethod
+    async def set_many(
+        self, items: Sequence[tuple[str, bytes, float | None]]
+    ) -> None: ...
+
+    # sets the missing keys and extends the others to at least the given ttl
+    @abstractmethod
+    async def set_many_nx_or_extend(
+        self, items: Sequence[tuple[str, bytes, float | None]]
+    ) -> None: ...
+
+    @abstractmethod
+    async def ttl(self, key: str) -> int: ...
+
+    @abstractmethod
+    async def expire(self, key: str, ttl: float | None) -> None: ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def delete_many(self, keys: Sequence[str]) -> None: ...
+
+    @abstractmethod
+    def scan(self, prefix: str) -> AsyncIterator[list[str]]: ...
+
+    async def aclose(self) -> None:
+        return
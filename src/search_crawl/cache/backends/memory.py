@@ -0,0 +1,141 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+
+from search_crawl.env_config import EnvConfig
+
+from .base import (
+    LOW_WATERMARK,
+    MISSING,
+    NO_EXPIRY,
+    SCAN_BATCH,
+    CacheBackend,
+    Eviction,
+)
+
+
+class MemoryBackendConfig(EnvConfig):
+    env_prefix = "MEMORY_BACKEND_"
+
+    max_bytes: int | None = None
+    eviction: Eviction = Eviction.LRU
+
+
+class MemoryBackend(CacheBackend):
+    config: MemoryBackendConfig
+    entries: OrderedDict[str, tuple[bytes, float]]
+    hits: dict[str, int]
+    total_bytes: int
+
+    def __init__(self, config: MemoryBackendConfig) -> None:
+        self.config = config
+        self.entries = OrderedDict()
+        self.hits = {}
+        self.total_bytes = 0
+
+    def _get(self, key: str) -> tuple[bytes, float] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            self._delete(key)
+            return None
+        return entry
+
+    def _delete(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= len(entry[0])
+            del self.hits[key]
+
+    def _set(self, key: str, value: bytes, expires_at: float) -> None:
+        self._delete(key)
+        self.entries[key] = (value, expires_at)
+        self.hits[key] = 0
+        self.total_bytes += len(value)
+        if (
+            self.config.max_bytes is not None
+            and self.total_bytes > self.config.max_bytes
+        ):
+            self.evict(keep=key)
+
+    def evict(self, keep: str) -> None:
+        if self.config.max_bytes is None:
+            return
+        # entries are in least recently used order, which also breaks LFU ties
+        victims = [key for key in self.entries if key != keep]
+        if self.config.eviction == Eviction.LFU:
+            victims.sort(key=self.hits.__getitem__)
+        target = self.config.max_bytes * LOW_WATERMARK
+        for key in victims:
+            if self.total_bytes <= target:
+                return
+            self._delete(key)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        self.hits[key] += 1
+        return entry[0]
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        return await self.get(key), await self.ttl(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, *, nx: bool = False
+    ) -> bool:
+        if nx and self._get(key) is not None:
+            return False
+        self._set(key, value, expires_at(ttl))
+        return True
+
+    async def set_many(self, items: Sequence[tuple[str, bytes, float | None]]) -> None:
+        for key, value, ttl in items:
+            self._set(key, value, expires_at(ttl))
+
+    async def set_many_nx_or_extend(
+        self, items: Sequence[tuple[str, bytes, float | None]]
+    ) -> None:
+        for key, value, ttl in items:
+            entry = self._get(key)
+            if entry is None:
+                self._set(key, value, expires_at(ttl))
+            elif expires_at(ttl) > entry[1]:
+                self.entries[key] = (entry[0], expires_at(ttl))
+
+    async def ttl(self, key: str) -> int:
+        entry = self._get(key)
+        if entry is None:
+            return MISSING
+        if entry[1] == math.inf:
+            return NO_EXPIRY
+        return math.ceil(entry[1] - time.time())
+
+    async def expire(self, key: str, ttl: float | None) -> None:
+        if (entry := self._get(key)) is not None:
+            self.entries[key] = (entry[0], expires_at(ttl))
+
+    async def exists(self, key: str) -> bool:
+        return self._get(key) is not None
+
+    async def delete(self, key: str) -> None:
+        self._delete(key)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._delete(key)
+
+    async def scan(self, prefix: str) -> AsyncIterator[list[str]]:
+        keys = [key for key in self.entries if key.startswith(prefix)]
+        for i in range(0, len(keys), SCAN_BATCH):
+            yield [key for key in keys[i : i + SCAN_BATCH] if self._get(key)]
+
+
+def expires_at(ttl: float | None) -> float:
+    return math.inf if ttl is None else time.time() + ttl
@@ -0,0 +1,110 @@
+import re
+from collections.abc import AsyncIterator, Sequence
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from search_crawl.env_config import EnvConfig
+
+from .base import SCAN_BATCH, CacheBackend
+
+
+class RedisPoolConfig(EnvConfig):
+    env_prefix = "REDIS_"
+
+    url: str
+    max_connections: int = 64
+    pool_timeout: float | None = 10
+    socket_timeout: float | None = 10
+    socket_connect_timeout: float | None = 5
+    health_check_interval: int = 30
+
+    def create_client(self) -> Redis:
+        pool = BlockingConnectionPool.from_url(
+            self.url,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            health_check_interval=self.health_check_interval,
+        )
+        return Redis.from_pool(pool)
+
+
+def to_px(ttl: float | None) -> int | None:
+    return None if ttl is None else max(1, int(ttl * 1000))
+
+
+class RedisBackend(CacheBackend):
+    r: Redis
+
+    def __init__(self, r: Redis) -> None:
+        self.r = r
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.r.get(key)
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        async with self.r.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            value, ttl = await pipe.execute()
+        return value, ttl
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self.r.mget(keys)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, *, nx: bool = False
+    ) -> bool:
+        return bool(await self.r.set(key, value, px=to_px(ttl), nx=nx))
+
+    async def set_many(self, items: Sequence[tuple[str, bytes, float | None]]) -> None:
+        async with self.r.pipeline(transaction=False) as pipe:
+            for key, value, ttl in items:
+                pipe.set(key, value, px=to_px(ttl))
+            await pipe.execute()
+
+    async def set_many_nx_or_extend(
+        self, items: Sequence[tuple[str, bytes, float | None]]
+    ) -> None:
+        async with self.r.pipeline(transaction=False) as pipe:
+            for key, value, ttl in items:
+                pipe.set(key, value, px=to_px(ttl), nx=True)
+                if ttl is None:
+                    pipe.persist(key)
+                else:
+                    # GT never shortens a key, and treats keys without a ttl as longer
+                    pipe.pexpire(key, to_px(ttl) or 1, gt=True)
+            await pipe.execute()
+
+    async def ttl(self, key: str) -> int:
+        return await self.r.ttl(key)
+
+    async def expire(self, key: str, ttl: float | None) -> None:
+        if ttl is None:
+            await self.r.persist(key)
+        else:
+            await self.r.pexpire(key, to_px(ttl) or 1)
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.r.exists(key))
+
+    async def delete(self, key: str) -> None:
+        await self.r.delete(key)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self.r.delete(*keys)
+
+    async def scan(self, prefix: str) -> AsyncIterator[list[str]]:
+        match = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        cursor = None
+        while cursor != 0:
+            cursor, keys = await self.r.scan(cursor or 0, match=match, count=SCAN_BATCH)
+            if keys:
+                yield [key.decode() for key in keys]
+
+    async def aclose(self) -> None:
+        await self.r.aclose()
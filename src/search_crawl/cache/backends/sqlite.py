@@ -0,0 +1,372 @@
+import asyncio
+import contextlib
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from search_crawl.env_config import EnvConfig
+
+from .base import (
+    LOW_WATERMARK,
+    MISSING,
+    NO_EXPIRY,
+    SCAN_BATCH,
+    CacheBackend,
+    Eviction,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)
+    WHERE expires_at IS NOT NULL;
+"""
+EVICTION_INDEXES = {
+    Eviction.LRU: "CREATE INDEX IF NOT EXISTS cache_lru ON cache (accessed_at)",
+    Eviction.LFU: "CREATE INDEX IF NOT EXISTS cache_lfu ON cache (hits, accessed_at)",
+}
+EVICTION_ORDERS = {
+    Eviction.LRU: "accessed_at",
+    Eviction.LFU: "hits, accessed_at",
+}
+ROW = "cache (key, value, expires_at, size, accessed_at) VALUES (?, ?, ?, ?, ?)"
+LIVE = "(expires_at IS NULL OR expires_at > ?)"
+# replaces expired rows only, as accessed_at is the time of the write
+INSERT_NX = (
+    f"INSERT INTO {ROW} ON CONFLICT (key) DO UPDATE"
+    " SET value = excluded.value, expires_at = excluded.expires_at,"
+    " size = excluded.size, accessed_at = excluded.accessed_at, hits = 0"
+    " WHERE cache.expires_at IS NOT NULL AND cache.expires_at <= excluded.accessed_at"
+)
+# stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds
+MAX_VARIABLES = 900
+
+type Row = tuple[str, bytes, float | None, int, float]
+
+
+class SQLiteCacheConfig(EnvConfig):
+    env_prefix = "SQLITE_CACHE_"
+
+    path: str = "cache.sqlite3"
+    read_workers: int = 4
+    busy_timeout: float = 5
+    sweep_interval: float = 60
+    sweep_batch: int = 1000
+    max_bytes: int | None = None
+    eviction: Eviction = Eviction.LRU
+
+
+class SQLiteBackend(CacheBackend):
+    config: SQLiteCacheConfig
+    local: threading.local
+    connections: list[sqlite3.Connection]
+    reader: ThreadPoolExecutor
+    writer: ThreadPoolExecutor
+    pending_rows: list[Row]
+    touched: dict[str, int]
+    flush_task: asyncio.Task[None] | None
+    sweeper: asyncio.Task[None] | None
+
+    def __init__(self, config: SQLiteCacheConfig) -> None:
+        self.config = config
+        self.local = threading.local()
+        self.connections = []
+        self.reader = ThreadPoolExecutor(config.read_workers, "sqlite-cache-reader")
+        # a single writer thread serializes writes instead of contending on locks
+        self.writer = ThreadPoolExecutor(1, "sqlite-cache-writer")
+        self.pending_rows = []
+        self.touched = {}
+        self.flush_task = None
+
+        Path(config.path).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(sqlite3.connect(config.path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            if config.max_bytes is not None:
+                conn.execute(EVICTION_INDEXES[config.eviction])
+
+        self.sweeper = None
+        if config.sweep_interval > 0:
+            self.sweeper = asyncio.create_task(self.sweep_forever())
+
+    def connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.config.path,
+                timeout=self.config.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.connections.append(conn)
+        return conn
+
+    async def read[R](self, func: Callable[[sqlite3.Connection], R]) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.reader, lambda: func(self.connection()))
+
+    async def write[R](self, func: Callable[[sqlite3.Connection], R]) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.writer, lambda: func(self.connection()))
+
+    async def get(self, key: str) -> bytes | None:
+        value, _ = await self.get_with_ttl(key)
+        return value
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        now = time.time()
+        row = await self.read(
+            lambda conn: conn.execute(
+                f"SELECT value, expires_at FROM cache WHERE key = ? AND {LIVE}",  # noqa: S608
+                (key, now),
+            ).fetchone()
+        )
+        if row is None:
+            return None, MISSING
+        self.touch(key)
+        value, expires_at = row
+        return value, remaining_ttl(expires_at, now)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        now = time.time()
+
+        def select(conn: sqlite3.Connection) -> dict[str, bytes]:
+            values: dict[str, bytes] = {}
+            for i in range(0, len(keys), MAX_VARIABLES):
+                chunk = keys[i : i + MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                values.update(
+                    conn.execute(
+                        f"SELECT key, value FROM cache WHERE key IN ({placeholders}) AND {LIVE}",  # noqa: E501, S608
+                        (*chunk, now),
+                    ).fetchall()
+                )
+            return values
+
+        values = await self.read(select) if keys else {}
+        for key in values:
+            self.touch(key)
+        return [values.get(key) for key in keys]
+
+    def touch(self, key: str) -> None:
+        # access stats are written in bulk by the sweeper rather than on every read
+        if self.config.max_bytes is not None:
+            self.touched[key] = self.touched.get(key, 0) + 1
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, *, nx: bool = False
+    ) -> bool:
+        if not nx:
+            await self.set_many([(key, value, ttl)])
+            return True
+
+        now = time.time()
+        cursor = await self.write(
+            lambda conn: conn.execute(
+                INSERT_NX, (key, value, expires_at(ttl, now), len(value), now)
+            )
+        )
+        return cursor.rowcount > 0
+
+    async def set_many(self, items: Sequence[tuple[str, bytes, float | None]]) -> None:
+        now = time.time()
+        self.pending_rows.extend(
+            (key, value, expires_at(ttl, now), len(value), now)
+            for key, value, ttl in items
+        )
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush())
+        await asyncio.shield(self.flush_task)
+
+    async def flush(self) -> None:
+        # let writers of the same event loop turn join this transaction
+        await asyncio.sleep(0)
+        rows, self.pending_rows = self.pending_rows, []
+        self.flush_task = None
+
+        def upsert(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(f"INSERT OR REPLACE INTO {ROW}", rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        await self.write(upsert)
+
+    async def set_many_nx_or_extend(
+        self, items: Sequence[tuple[str, bytes, float | None]]
+    ) -> None:
+        now = time.time()
+        rows = [
+            (key, value, expires_at(ttl, now), len(value), now)
+            for key, value, ttl in items
+        ]
+
+        def upsert(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(INSERT_NX, rows)
+                conn.executemany(
+                    "UPDATE cache SET expires_at = ? WHERE key = ?"
+                    " AND expires_at IS NOT NULL AND (? IS NULL OR expires_at < ?)",
+                    [(expires, key, expires, expires) for key, _, expires, *_ in rows],
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        if rows:
+            await self.write(upsert)
+
+    async def ttl(self, key: str) -> int:
+        _, ttl = await self.get_with_ttl(key)
+        return ttl
+
+    async def expire(self, key: str, ttl: float | None) -> None:
+        now = time.time()
+        await self.write(
+            lambda conn: conn.execute(
+                f"UPDATE cache SET expires_at = ? WHERE key = ? AND {LIVE}",  # noqa: S608
+                (expires_at(ttl, now), key, now),
+            )
+        )
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def delete(self, key: str) -> None:
+        await self.write(
+            lambda conn: conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        )
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        def delete(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+            conn.execute("COMMIT")
+
+        if keys:
+            await self.write(delete)
+
+    async def scan(self, prefix: str) -> AsyncIterator[list[str]]:
+        after = ""
+        while True:
+            keys = await self.read(partial(scan_batch, prefix, after))
+            if keys:
+                yield keys
+            if len(keys) < SCAN_BATCH:
+                return
+            after = keys[-1]
+
+    async def sweep(self) -> int:
+        now = time.time()
+        deleted = 0
+        while True:
+            cursor = await self.write(
+                lambda conn: conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache"
+                    " WHERE expires_at <= ? LIMIT ?)",
+                    (now, self.config.sweep_batch),
+                )
+            )
+            deleted += cursor.rowcount
+            if cursor.rowcount < self.config.sweep_batch:
+                return deleted
+
+    async def flush_touches(self) -> None:
+        touched, self.touched = self.touched, {}
+        if not touched:
+            return
+        now = time.time()
+
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "UPDATE cache SET accessed_at = ?, hits = hits + ? WHERE key = ?",
+                [(now, hits, key) for key, hits in touched.items()],
+            )
+            conn.execute("COMMIT")
+
+        await self.write(update)
+
+    async def evict(self) -> int:
+        max_bytes = self.config.max_bytes
+        if max_bytes is None:
+            return 0
+        order = EVICTION_ORDERS[self.config.eviction]
+
+        def delete_victims(conn: sqlite3.Connection) -> int:
+            (total_bytes,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+            if total_bytes <= max_bytes:
+                return 0
+            excess = total_bytes - max_bytes * LOW_WATERMARK
+            victims: list[tuple[str]] = []
+            for key, size in conn.execute(
+                f"SELECT key, size FROM cache ORDER BY {order}"  # noqa: S608
+            ):
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= size
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+            conn.execute("COMMIT")
+            return len(victims)
+
+        return await self.write(delete_victims)
+
+    async def sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.sweep_interval)
+            with contextlib.suppress(sqlite3.Error):
+                await self.sweep()
+                await self.flush_touches()
+                await self.evict()
+
+    async def aclose(self) -> None:
+        if self.sweeper is not None:
+            self.sweeper.cancel()
+        if self.flush_task is not None:
+            await self.flush_task
+        self.reader.shutdown()
+        self.writer.shutdown()
+        for conn in self.connections:
+            conn.close()
+
+
+def scan_batch(prefix: str, after: str, conn: sqlite3.Connection) -> list[str]:
+    # keyset pagination, so each batch is a range scan of the primary key
+    rows = conn.execute(
+        f"SELECT key FROM cache WHERE key >= ? AND key > ? AND {LIVE}"  # noqa: S608
+        " ORDER BY key LIMIT ?",
+        (prefix, after, time.time(), SCAN_BATCH),
+    )
+    return [key for (key,) in rows if key.startswith(prefix)]
+
+
+def expires_at(ttl: float | None, now: float) -> float | None:
+    return None if ttl is None else now + ttl
+
+
+def remaining_ttl(expires_at: float | None, now: float) -> int:
+    if expires_at is None:
+        return NO_EXPIRY
+    return math.ceil(expires_at - now)
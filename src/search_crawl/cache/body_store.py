@@ -0,0 +1,60 @@
+import hashlib
+import math
+import time
+from collections.abc import Sequence
+
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.codec import CacheEntry, ValueFormat, get_codec
+from search_crawl.cache.namespace import VALUE_FORMATS, CacheNamespace
+
+
+def digest(html: str) -> str:
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+async def put_bodies(bodies: Sequence[tuple[str, int | None]]) -> list[str]:
+    codec = get_codec()
+    stored_at = time.time()
+    digests = [digest(html) for html, _ in bodies]
+    items = [
+        (
+            CacheNamespace.BODY.cache_key(body_digest),
+            codec.encode(html, VALUE_FORMATS[CacheNamespace.BODY], stored_at, math.inf),
+            ttl,
+        )
+        for body_digest, (html, ttl) in zip(digests, bodies, strict=True)
+    ]
+    # shared bodies must outlive the longest-lived entry referring to them
+    if items:
+        await get_backend().set_many_nx_or_extend(items)
+    return digests
+
+
+def attach_body(entry: CacheEntry, html: str) -> CacheEntry:
+    url, _ = entry.value
+    return entry._replace(
+        value=[url, html],
+        size=entry.size + len(html),
+        value_format=ValueFormat.PAIR,
+    )
+
+
+async def resolve_bodies(entries: dict[str, CacheEntry]) -> dict[str, CacheEntry]:
+    refs = {
+        cache_key: entry
+        for cache_key, entry in entries.items()
+        if entry.value_format == ValueFormat.PAIR_REF
+    }
+    if not refs:
+        return entries
+
+    codec = get_codec()
+    raws = await get_backend().mget(
+        [CacheNamespace.BODY.cache_key(entry.value[1]) for entry in refs.values()]
+    )
+    # entries whose body has been evicted are dropped and read as misses
+    resolved = {k: v for k, v in entries.items() if k not in refs}
+    for (cache_key, entry), raw in zip(refs.items(), raws, strict=True):
+        if raw:
+            resolved[cache_key] = attach_body(entry, codec.decode(raw).value)
+    return resolved
@@ -0,0 +1,128 @@
+import math
+import struct
+import time
+import zlib
+from enum import Enum
+from typing import Any, NamedTuple
+
+import orjson
+
+from search_crawl.env_config import EnvConfig
+
+# legacy entries are JSON text, which never starts with a NUL byte
+MAGIC = b"\x00sc"
+VERSION = b"\x02"
+TIMESTAMPS = struct.Struct(">dd")
+URL_LENGTH = struct.Struct(">I")
+
+
+class CompressionConfig(EnvConfig):
+    env_prefix = "CACHE_COMPRESSION_"
+
+    level: int = 6
+    min_bytes: int = 1024
+
+
+class ValueFormat(Enum):
+    JSON = b"j"
+    PAIR = b"p"  # (url, html) without JSON escaping of the html
+    PAIR_REF = b"r"  # (url, digest of the html stored as TEXT)
+    TEXT = b"t"
+
+
+class Compression(Enum):
+    NONE = b"-"
+    ZLIB = b"z"
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    stored_at: float = 0
+    fresh_until: float = math.inf
+    value_format: ValueFormat = ValueFormat.JSON
+
+    @property
+    def is_stale(self) -> bool:
+        return self.fresh_until <= time.time()
+
+
+class CacheCodec:
+    config: CompressionConfig
+
+    def __init__(self, config: CompressionConfig) -> None:
+        self.config = config
+
+    def encode(
+        self,
+        value: Any,  # noqa: ANN401
+        value_format: ValueFormat,
+        stored_at: float,
+        fresh_until: float,
+    ) -> bytes:
+        match value_format:
+            case ValueFormat.JSON:
+                payload = orjson.dumps(value)
+            case ValueFormat.PAIR | ValueFormat.PAIR_REF:
+                url, html = (e.encode() for e in value)
+                payload = URL_LENGTH.pack(len(url)) + url + html
+            case ValueFormat.TEXT:
+                payload = value.encode()
+
+        if len(payload) >= self.config.min_bytes:
+            compression = Compression.ZLIB
+            payload = zlib.compress(payload, self.config.level)
+        else:
+            compression = Compression.NONE
+        return (
+            MAGIC
+            + VERSION
+            + value_format.value
+            + compression.value
+            + TIMESTAMPS.pack(stored_at, fresh_until)
+            + payload
+        )
+
+    def decode(self, raw: bytes) -> CacheEntry:
+        if not raw.startswith(MAGIC):
+            return CacheEntry(orjson.loads(raw), len(raw))
+
+        header = raw[len(MAGIC) + len(VERSION) :]
+        value_format = ValueFormat(header[0:1])
+        compression = Compression(header[1:2])
+        stored_at, fresh_until = TIMESTAMPS.unpack_from(header, 2)
+        payload = header[2 + TIMESTAMPS.size :]
+
+        if compression == Compression.ZLIB:
+            payload = zlib.decompress(payload)
+
+        match value_format:
+            case ValueFormat.JSON:
+                value = orjson.loads(payload)
+            case ValueFormat.PAIR | ValueFormat.PAIR_REF:
+                (url_length,) = URL_LENGTH.unpack_from(payload)
+                url_end = URL_LENGTH.size + url_length
+                value = [
+                    payload[URL_LENGTH.size : url_end].decode(),
+                    payload[url_end:].decode(),
+                ]
+            case ValueFormat.TEXT:
+                value = payload.decode()
+        return CacheEntry(value, len(payload), stored_at, fresh_until, value_format)
+
+
+def read_timestamps(raw: bytes) -> tuple[float, float]:
+    # reads the header only, so large values are not decompressed
+    if not raw.startswith(MAGIC):
+        return 0, math.inf
+    return TIMESTAMPS.unpack_from(raw, len(MAGIC) + len(VERSION) + 2)
+
+
+codec: CacheCodec | None = None
+
+
+def get_codec() -> CacheCodec:
+    global codec  # noqa: PLW0603
+    if codec is None:
+        codec = CacheCodec(CompressionConfig.from_env())
+    return codec
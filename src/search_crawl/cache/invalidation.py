@@ -0,0 +1,77 @@
+import time
+from urllib.parse import urlsplit
+
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.codec import read_timestamps
+from search_crawl.cache.memory import get_memory_cache
+from search_crawl.cache.namespace import CacheNamespace
+
+from .schemas import InvalidationRequest, InvalidationResult
+
+# namespaces keyed by the canonical url of a page
+URL_NAMESPACES = {
+    CacheNamespace.SCRAPE,
+    CacheNamespace.ALIAS,
+    CacheNamespace.VALIDATORS,
+    CacheNamespace.NEGATIVE,
+}
+
+
+def key_url(namespace: CacheNamespace, key: str) -> str | None:
+    if namespace in URL_NAMESPACES:
+        return key
+    if namespace == CacheNamespace.ARTIFACT:
+        # "{output_format}:{canonical url}"
+        return key.partition(":")[2]
+    if namespace == CacheNamespace.CRAWL:
+        # "{scope}:{max_depth}:{max_pages}:{output_format}:{canonical url}"
+        return key.split(":", 4)[-1]
+    return None
+
+
+def matches_domain(url: str, domain: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return host == domain or host.endswith(f".{domain}")
+
+
+class Invalidator:
+    req: InvalidationRequest
+    domain: str | None
+    cutoff: float | None
+
+    def __init__(self, req: InvalidationRequest) -> None:
+        self.req = req
+        self.domain = req.domain.lower().strip(".") if req.domain else None
+        self.cutoff = None if req.older_than is None else time.time() - req.older_than
+
+    async def run(self) -> InvalidationResult:
+        result = InvalidationResult()
+        backend = get_backend()
+        memory = get_memory_cache()
+        for namespace in self.req.namespaces:
+            # scanning in batches keeps the server and the event loop responsive
+            async for keys in backend.scan(namespace.cache_key(self.req.prefix or "")):
+                result.scanned += len(keys)
+                matched = await self.select(namespace, keys)
+                await backend.delete_many(matched)
+                for key in matched:
+                    memory.delete(key)
+                result.deleted += len(matched)
+        return result
+
+    async def select(self, namespace: CacheNamespace, keys: list[str]) -> list[str]:
+        if (domain := self.domain) is not None:
+            keys = [
+                key
+                for key in keys
+                if (url := key_url(namespace, namespace.strip_prefix(key)))
+                and matches_domain(url, domain)
+            ]
+        if self.cutoff is None or not keys:
+            return keys
+        raws = await get_backend().mget(keys)
+        return [
+            key
+            for key, raw in zip(keys, raws, strict=True)
+            if raw and read_timestamps(raw)[0] < self.cutoff
+        ]
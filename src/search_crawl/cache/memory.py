@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from search_crawl.env_config import EnvConfig
+
+
+class MemoryCacheConfig(EnvConfig):
+    env_prefix = "MEMORY_CACHE_"
+
+    max_bytes: int = 256 * 1024 * 1024
+    max_ttl: int = 60 * 5
+
+
+class MemoryCacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float
+
+
+class MemoryCache:
+    max_bytes: int
+    max_ttl: int
+    total_bytes: int
+    entries: OrderedDict[str, MemoryCacheEntry]
+
+    def __init__(self, max_bytes: int, max_ttl: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_ttl = max_ttl
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: str, value: Any, size: int, ttl: float | None) -> None:  # noqa: ANN401
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+
+        lifetime = self.max_ttl if ttl is None else min(ttl, self.max_ttl)
+        if lifetime <= 0:
+            return
+
+        self.entries[key] = MemoryCacheEntry(value, size, time.monotonic() + lifetime)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+
+    def delete(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+
+memory_cache: MemoryCache | None = None
+
+
+def get_memory_cache() -> MemoryCache:
+    global memory_cache  # noqa: PLW0603
+    if memory_cache is None:
+        config = MemoryCacheConfig.from_env()
+        memory_cache = MemoryCache(config.max_bytes, config.max_ttl)
+    return memory_cache
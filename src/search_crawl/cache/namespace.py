@@ -0,0 +1,78 @@
+import hashlib
+from enum import StrEnum, auto
+from importlib.metadata import version
+
+from search_crawl.cache.codec import ValueFormat
+from search_crawl.crawl.utils import get_pruning_config
+
+
+class CacheNamespace(StrEnum):
+    SEARCH = auto()
+    SCRAPE = auto()
+    ARTIFACT = auto()
+    BODY = auto()
+    ALIAS = auto()
+    VALIDATORS = auto()
+    NEGATIVE = auto()
+    RESPONSE = auto()
+    CRAWL = auto()
+
+    def cache_key(self, key: str) -> str:
+        if version := NAMESPACE_VERSIONS[self]:
+            return f"{self}@{version}:{key}"
+        return f"{self}:{key}"
+
+    def strip_prefix(self, cache_key: str) -> str:
+        return cache_key.removeprefix(self.cache_key(""))
+
+
+# bump when parsing changes so that cached artifacts are not reused
+PARSER_VERSION = 2
+# libraries whose upgrades change the parsed artifacts
+PARSER_DISTRIBUTIONS = ["lxml", "markitdown", "readability-lxml"]
+
+
+def parser_fingerprint() -> str:
+    versions = [str(PARSER_VERSION)]
+    versions += [version(name) for name in PARSER_DISTRIBUTIONS]
+    # pruned pages parse into different artifacts, full_html above all
+    if get_pruning_config().enabled:
+        versions.append("pruned")
+    return hashlib.sha256(" ".join(versions).encode()).hexdigest()[:8]
+
+
+# cached artifacts, responses and crawled links are outputs of the parser
+PARSER_FINGERPRINT = parser_fingerprint()
+
+# part of every key, so entries written by another version are never read;
+# namespaces without a version keep their unversioned keys
+NAMESPACE_VERSIONS = {
+    CacheNamespace.SEARCH: "",
+    CacheNamespace.SCRAPE: "",
+    CacheNamespace.ARTIFACT: PARSER_FINGERPRINT,
+    CacheNamespace.BODY: "",
+    CacheNamespace.ALIAS: "",
+    CacheNamespace.VALIDATORS: "",
+    CacheNamespace.NEGATIVE: "",
+    CacheNamespace.RESPONSE: PARSER_FINGERPRINT,
+    CacheNamespace.CRAWL: PARSER_FINGERPRINT,
+}
+
+
+VALUE_FORMATS = {
+    CacheNamespace.SEARCH: ValueFormat.JSON,
+    CacheNamespace.SCRAPE: ValueFormat.PAIR_REF,
+    CacheNamespace.ARTIFACT: ValueFormat.JSON,
+    CacheNamespace.BODY: ValueFormat.TEXT,
+    CacheNamespace.ALIAS: ValueFormat.TEXT,
+    CacheNamespace.VALIDATORS: ValueFormat.JSON,
+    CacheNamespace.NEGATIVE: ValueFormat.JSON,
+    CacheNamespace.RESPONSE: ValueFormat.PAIR,  # (etag, serialized response)
+    CacheNamespace.CRAWL: ValueFormat.JSON,
+}
+
+# kept past their TTL for the revalidation window
+REVALIDATED_NAMESPACES = {
+    CacheNamespace.SCRAPE,
+    CacheNamespace.VALIDATORS,
+}
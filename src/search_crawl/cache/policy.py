@@ -0,0 +1,64 @@
+from enum import StrEnum, auto
+
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.env_config import EnvConfig
+
+
+class TTLClass(StrEnum):
+    SEARCH = auto()
+    RECENT_SEARCH = auto()
+    PAGE = auto()
+    FAILURE = auto()
+    RESPONSE = auto()
+
+
+TTL_CLASSES = {
+    CacheNamespace.SEARCH: TTLClass.SEARCH,
+    CacheNamespace.SCRAPE: TTLClass.PAGE,
+    CacheNamespace.ARTIFACT: TTLClass.PAGE,
+    CacheNamespace.BODY: TTLClass.PAGE,
+    CacheNamespace.ALIAS: TTLClass.PAGE,
+    CacheNamespace.VALIDATORS: TTLClass.PAGE,
+    CacheNamespace.NEGATIVE: TTLClass.FAILURE,
+    CacheNamespace.RESPONSE: TTLClass.RESPONSE,
+    CacheNamespace.CRAWL: TTLClass.PAGE,
+}
+
+
+class CachePolicyConfig(EnvConfig):
+    env_prefix = "CACHE_POLICY_"
+
+    search_ttl: int | None = 60 * 60 * 24
+    recent_search_ttl: int | None = 60 * 60
+    page_ttl: int | None = 60 * 60 * 24
+    failure_ttl: int = 60 * 5
+    response_ttl: int | None = 60 * 5
+    stale_while_revalidate: int | None = 60 * 5
+    revalidation_window: int | None = 60 * 60 * 24 * 7
+    max_value_bytes: int | None = 8 * 1024 * 1024
+
+    def ttl(self, ttl_class: TTLClass) -> int | None:
+        match ttl_class:
+            case TTLClass.SEARCH:
+                return self.search_ttl
+            case TTLClass.RECENT_SEARCH:
+                return self.recent_search_ttl
+            case TTLClass.PAGE:
+                return self.page_ttl
+            case TTLClass.FAILURE:
+                return self.failure_ttl
+            case TTLClass.RESPONSE:
+                return self.response_ttl
+
+    def admits(self, size: int) -> bool:
+        return self.max_value_bytes is None or size <= self.max_value_bytes
+
+
+policy: CachePolicyConfig | None = None
+
+
+def get_policy() -> CachePolicyConfig:
+    global policy  # noqa: PLW0603
+    if policy is None:
+        policy = CachePolicyConfig.from_env()
+    return policy
@@ -0,0 +1,39 @@
+import heapq
+from operator import itemgetter
+
+from search_crawl.cache.namespace import CacheNamespace
+
+type PopularKey = tuple[CacheNamespace, str]
+
+
+class Popularity:
+    max_keys: int
+    hits: dict[PopularKey, float]
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self.hits = {}
+
+    def record(self, namespace: CacheNamespace, key: str) -> None:
+        popular_key = (namespace, key)
+        self.hits[popular_key] = self.hits.get(popular_key, 0) + 1
+
+    def hottest(self, n: int, min_hits: float) -> list[PopularKey]:
+        return [
+            key
+            for key, hits in heapq.nlargest(n, self.hits.items(), key=itemgetter(1))
+            if hits >= min_hits
+        ]
+
+    def decay(self, factor: float) -> None:
+        # older accesses weigh less, and rarely accessed keys are forgotten
+        kept = heapq.nlargest(self.max_keys, self.hits.items(), key=itemgetter(1))
+        self.hits = {key: hits * factor for key, hits in kept if hits * factor >= 1}
+
+
+popularity: Popularity | None = None
+
+
+def record_access(namespace: CacheNamespace, key: str) -> None:
+    if popularity is not None:
+        popularity.record(namespace, key)
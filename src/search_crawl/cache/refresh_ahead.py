@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from search_crawl.cache import popularity as cache_popularity
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.codec import read_timestamps
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.popularity import Popularity, PopularKey
+from search_crawl.cache.stats import recording_outcomes
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl import router as crawl_router
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig
+from search_crawl.env_config import EnvConfig
+from search_crawl.search.router import search_with_cache
+from search_crawl.search.schemas import SearchRequest
+
+
+class RefreshAheadConfig(EnvConfig):
+    env_prefix = "CACHE_REFRESH_AHEAD_"
+
+    enabled: bool = False
+    interval: float = 60
+    lead_time: float = 60 * 10
+    hot_keys: int = 500
+    min_hits: float = 3
+    max_refreshes: int = 50
+    browser_budget: int = 2
+    decay: float = 0.5
+    max_tracked_keys: int = 100_000
+
+
+class RefreshAhead:
+    config: RefreshAheadConfig
+    popularity: Popularity
+    browser_sem: asyncio.Semaphore
+    scheduler: asyncio.Task[None]
+
+    def __init__(self, config: RefreshAheadConfig, popularity: Popularity) -> None:
+        self.config = config
+        self.popularity = popularity
+        self.browser_sem = asyncio.Semaphore(config.browser_budget)
+        self.scheduler = asyncio.create_task(self.refresh_forever())
+
+    async def refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.interval)
+            with contextlib.suppress(Exception):
+                due = await self.due()
+                await asyncio.gather(
+                    *(self.refresh(*key) for key in due), return_exceptions=True
+                )
+            self.popularity.decay(self.config.decay)
+
+    async def due(self) -> list[PopularKey]:
+        hot = self.popularity.hottest(self.config.hot_keys, self.config.min_hits)
+        if not hot:
+            return []
+        # only scraped pages have negative entries, other keys never match one
+        raws = await get_backend().mget(
+            [namespace.cache_key(key) for namespace, key in hot]
+            + [CacheNamespace.NEGATIVE.cache_key(key) for _, key in hot]
+        )
+        entries, failures = raws[: len(hot)], raws[len(hot) :]
+        now = time.time()
+        refresh_before = now + self.config.lead_time
+        # hot keys that already expired are refreshed too, unless they recently
+        # failed, as hits on the negative cache would keep them hot forever
+        return [
+            key
+            for key, raw, failure in zip(hot, entries, failures, strict=True)
+            if (failure is None or read_timestamps(failure)[1] <= now)
+            and (raw is None or read_timestamps(raw)[1] <= refresh_before)
+        ][: self.config.max_refreshes]
+
+    async def refresh(self, namespace: CacheNamespace, key: str) -> None:
+        cache_config = CacheConfig(readable=False)
+        token = recording_outcomes.set(False)
+        try:
+            match namespace:
+                case CacheNamespace.SEARCH:
+                    params = json.loads(key)
+                    req = SearchRequest.model_validate(
+                        {
+                            **params,
+                            "engines": params["engines"].split(","),
+                            "cache_config": cache_config,
+                        }
+                    )
+                    await search_with_cache(req)
+                case CacheNamespace.SCRAPE:
+                    crawler = Crawler(crawl_router.browser, CrawlConfig(), cache_config)
+                    async with self.browser_sem:
+                        await crawler.scrape_raw_with_cache(key)
+        finally:
+            recording_outcomes.reset(token)
+
+    async def aclose(self) -> None:
+        self.scheduler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
+    config = RefreshAheadConfig.from_env()
+    if not config.enabled:
+        yield
+        return
+
+    cache_popularity.popularity = Popularity(config.max_tracked_keys)
+    refresh_ahead = RefreshAhead(config, cache_popularity.popularity)
+    try:
+        yield
+    finally:
+        await refresh_ahead.aclose()
+        cache_popularity.popularity = None
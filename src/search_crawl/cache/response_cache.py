@@ -0,0 +1,95 @@
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+
+from search_crawl.cache.body_store import digest
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.stats import CacheOutcome, cache_stats
+from search_crawl.cache_config import CacheConfig
+
+type Handler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+def find_cache_configs(req: BaseModel) -> list[CacheConfig]:
+    # requests combining several steps carry the cache config of each step
+    return [
+        config
+        for model in [req, *vars(req).values()]
+        if isinstance(config := getattr(model, "cache_config", None), CacheConfig)
+    ] or [CacheConfig()]
+
+
+def response_cache_config(req: BaseModel) -> CacheConfig | None:
+    configs = find_cache_configs(req)
+    if all(
+        config.readable
+        and config.writable
+        and config.response_cache
+        # cache misses of these requests must not outlive the misses
+        and not config.only_if_cached
+        for config in configs
+    ):
+        return configs[0]
+    return None
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def cached_response(
+    handler: Handler, request: Request, config: CacheConfig, cache_key: str
+) -> tuple[Response, str | None]:
+    namespace = CacheNamespace.RESPONSE
+    entry = await config.read(namespace, cache_key)
+    if entry is not None and not entry.is_stale:
+        cache_stats.record_outcome(namespace, CacheOutcome.HIT)
+        etag, content = entry.value
+        return Response(content, media_type="application/json"), etag
+
+    cache_stats.record_outcome(namespace, CacheOutcome.MISS)
+    response = await handler(request)
+    if response.status_code != 200:  # noqa: PLR2004
+        return response, None
+    content = bytes(response.body).decode()
+    etag = f'"{digest(content)}"'
+    await config.write(namespace, cache_key, (etag, content))
+    return response, etag
+
+
+class CachedResponseRoute(APIRoute):
+    async def parse_body(self, request: Request) -> BaseModel | None:
+        model = self.body_field.type_ if self.body_field is not None else None
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            return None
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError:
+            return None
+
+    def get_route_handler(self) -> Handler:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            req = await self.parse_body(request)
+            config = response_cache_config(req) if req is not None else None
+            if req is None or config is None:
+                return await handler(request)
+
+            # keyed by the validated body, so defaults and key order do not matter
+            cache_key = CacheNamespace.RESPONSE.cache_key(
+                f"{request.url.path}:{digest(req.model_dump_json())}"
+            )
+            response, etag = await cached_response(handler, request, config, cache_key)
+            if etag is None:
+                return response
+            if etag_matches(etag, request.headers.get("If-None-Match", "")):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            return response
+
+        return cached_handler
@@ -0,0 +1,96 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from .invalidation import Invalidator
+from .memory import get_memory_cache
+from .refresh_ahead import lifespan as refresh_ahead_lifespan
+from .schemas import (
+    InvalidationRequest,
+    InvalidationResult,
+    WarcImportResult,
+    WarmJob,
+    WarmRequest,
+)
+from .stats import CacheStats, MemoryTierStats, cache_stats
+from .warc import export_scrape, import_scrape
+from .warming import get_warmer
+from .write_behind import lifespan as write_behind_lifespan
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    # refreshes stop before queued writes are flushed
+    async with write_behind_lifespan(app), refresh_ahead_lifespan(app):
+        yield
+
+
+router = APIRouter(lifespan=lifespan)
+
+
+@router.get("/cache/stats")
+def get_cache_stats() -> CacheStats:
+    memory = get_memory_cache()
+    return cache_stats.model_copy(
+        update={
+            "memory": MemoryTierStats(
+                entries=len(memory.entries),
+                total_bytes=memory.total_bytes,
+                max_bytes=memory.max_bytes,
+            )
+        }
+    )
+
+
+@router.post("/cache/warm")
+async def warm_cache(req: WarmRequest) -> WarmJob:
+    return get_warmer().start(req)
+
+
+@router.get("/cache/warm/{job_id}")
+def get_warm_job(job_id: str) -> WarmJob:
+    job = get_warmer().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown warm job: {job_id}")
+    return job
+
+
+@router.get("/cache/warc", response_class=StreamingResponse)
+def export_warc(*, gzip: bool = True) -> StreamingResponse:
+    filename = "scrape.warc.gz" if gzip else "scrape.warc"
+    return StreamingResponse(
+        export_scrape(compress=gzip),
+        media_type="application/warc",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/cache/warc",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/warc": {"schema": {"type": "string", "format": "binary"}}
+            },
+        }
+    },
+)
+async def import_warc(request: Request) -> WarcImportResult:
+    try:
+        return await import_scrape(request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.post("/cache/invalidate")
+async def invalidate_cache(req: InvalidationRequest) -> InvalidationResult:
+    criteria = (req.prefix, req.domain, req.older_than)
+    if all(c is None for c in criteria) and "namespaces" not in req.model_fields_set:
+        raise HTTPException(
+            status_code=400,
+            detail="Give namespaces, a prefix, a domain or older_than to invalidate",
+        )
+    return await Invalidator(req).run()
@@ -0,0 +1,49 @@
+import uuid
+from enum import StrEnum, auto
+
+from pydantic import BaseModel, Field
+
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.schemas import CrawlConfig
+
+
+class WarmRequest(BaseModel):
+    urls: list[str] = []
+    sitemap_url: str | None = None
+    max_urls: int | None = None
+    crawl_config: CrawlConfig = CrawlConfig(max_depth=0)
+    cache_config: CacheConfig = CacheConfig()
+
+
+class WarmJobStatus(StrEnum):
+    PENDING = auto()
+    RUNNING = auto()
+    DONE = auto()
+    FAILED = auto()
+
+
+class WarmJob(BaseModel):
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    status: WarmJobStatus = WarmJobStatus.PENDING
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    error: str | None = None
+
+
+class WarcImportResult(BaseModel):
+    imported: int = 0
+    skipped: int = 0
+
+
+class InvalidationRequest(BaseModel):
+    namespaces: list[CacheNamespace] = list(CacheNamespace)
+    prefix: str | None = None
+    domain: str | None = None
+    older_than: float | None = None
+
+
+class InvalidationResult(BaseModel):
+    scanned: int = 0
+    deleted: int = 0
@@ -0,0 +1,113 @@
+import asyncio
+import math
+import uuid
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from search_crawl.cache.backend import get_backend
+from search_crawl.env_config import EnvConfig
+
+
+class SingleFlightConfig(EnvConfig):
+    env_prefix = "SINGLE_FLIGHT_"
+
+    distributed: bool = False
+    lock_ttl: float = 30
+    poll_interval: float = 0.2
+
+
+class SingleFlight:
+    config: SingleFlightConfig
+    inflight: dict[str, asyncio.Task[Any]]
+
+    def __init__(self, config: SingleFlightConfig) -> None:
+        self.config = config
+        self.inflight = {}
+
+    async def do[R](
+        self,
+        key: str,
+        func: Callable[[], Awaitable[R]],
+        lookup: Callable[[], Awaitable[R | None]],
+    ) -> R:
+        # shield so that a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(self.start(key, func, lookup))
+
+    def start[R](
+        self,
+        key: str,
+        func: Callable[[], Awaitable[R]],
+        lookup: Callable[[], Awaitable[R | None]],
+    ) -> asyncio.Future[R]:
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, func, lookup))
+            self.inflight[key] = task
+            task.add_done_callback(partial(self.done, key))
+        return task
+
+    def done(self, key: str, task: asyncio.Task[Any]) -> None:
+        self.inflight.pop(key, None)
+        # background refreshes have nobody awaiting them to see their errors
+        if not task.cancelled():
+            task.exception()
+
+    async def _run[R](
+        self,
+        key: str,
+        func: Callable[[], Awaitable[R]],
+        lookup: Callable[[], Awaitable[R | None]],
+    ) -> R:
+        if not self.config.distributed:
+            return await func()
+
+        lock = DistributedLock(key, self.config.lock_ttl, self.config.poll_interval)
+        if await lock.acquire():
+            try:
+                return await func()
+            finally:
+                await lock.release()
+
+        await lock.wait_released()
+        if (value := await lookup()) is not None:
+            return value
+        return await func()
+
+
+class DistributedLock:
+    key: str
+    ttl: float
+    poll_interval: float
+    token: str
+
+    def __init__(self, key: str, ttl: float, poll_interval: float) -> None:
+        self.key = f"lock:{key}"
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.token = uuid.uuid4().hex
+
+    async def acquire(self) -> bool:
+        return await get_backend().set(self.key, self.token.encode(), self.ttl, nx=True)
+
+    async def release(self) -> None:
+        backend = get_backend()
+        if await backend.get(self.key) == self.token.encode():
+            await backend.delete(self.key)
+
+    async def wait_released(self) -> None:
+        backend = get_backend()
+        for _ in range(math.ceil(self.ttl / self.poll_interval)):
+            if not await backend.exists(self.key):
+                return
+            await asyncio.sleep(self.poll_interval)
+
+
+single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    global single_flight  # noqa: PLW0603
+    if single_flight is None:
+        single_flight = SingleFlight(SingleFlightConfig.from_env())
+    return single_flight
@@ -0,0 +1,150 @@
+import bisect
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from enum import StrEnum, auto
+from typing import Self
+
+from fastapi import Request, Response
+from pydantic import BaseModel, Field, computed_field
+
+from search_crawl.cache.namespace import CacheNamespace
+
+LATENCY_BOUNDS: list[float] = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5]
+SIZE_BOUNDS: list[float] = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+class CacheOutcome(StrEnum):
+    HIT = auto()
+    STALE = auto()
+    MISS = auto()
+
+
+class CacheTier(StrEnum):
+    PREFETCH = auto()
+    MEMORY = auto()
+    BACKEND = auto()
+
+
+class Histogram(BaseModel):
+    bounds: list[float]
+    counts: list[int]  # the last count is for values above every bound
+    count: int = 0
+    sum: float = 0
+
+    @classmethod
+    def with_bounds(cls, bounds: list[float]) -> Self:
+        return cls(bounds=bounds, counts=[0] * (len(bounds) + 1))
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class NamespaceStats(BaseModel):
+    outcomes: dict[CacheOutcome, int] = Field(
+        default_factory=lambda: dict.fromkeys(CacheOutcome, 0)
+    )
+    tier_hits: dict[CacheTier, int] = Field(
+        default_factory=lambda: dict.fromkeys(CacheTier, 0)
+    )
+    revalidations: int = 0
+    rejected_writes: int = 0
+    read_latency: Histogram = Field(
+        default_factory=lambda: Histogram.with_bounds(LATENCY_BOUNDS)
+    )
+    write_latency: Histogram = Field(
+        default_factory=lambda: Histogram.with_bounds(LATENCY_BOUNDS)
+    )
+    read_bytes: Histogram = Field(
+        default_factory=lambda: Histogram.with_bounds(SIZE_BOUNDS)
+    )
+    written_bytes: Histogram = Field(
+        default_factory=lambda: Histogram.with_bounds(SIZE_BOUNDS)
+    )
+
+    @computed_field
+    @property
+    def hit_ratio(self) -> float | None:
+        total = sum(self.outcomes.values())
+        if total == 0:
+            return None
+        return (total - self.outcomes[CacheOutcome.MISS]) / total
+
+
+class MemoryTierStats(BaseModel):
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+
+class CacheStats(BaseModel):
+    namespaces: dict[CacheNamespace, NamespaceStats] = Field(
+        default_factory=lambda: {
+            namespace: NamespaceStats() for namespace in CacheNamespace
+        }
+    )
+    memory: MemoryTierStats | None = None
+
+    def record_outcome(self, namespace: CacheNamespace, outcome: CacheOutcome) -> None:
+        if not recording_outcomes.get():
+            return
+        self.namespaces[namespace].outcomes[outcome] += 1
+        if (request_stats := request_cache_stats.get()) is not None:
+            request_stats[outcome] += 1
+
+    def record_revalidation(self, namespace: CacheNamespace) -> None:
+        self.namespaces[namespace].revalidations += 1
+
+    def record_rejected_write(self, namespace: CacheNamespace) -> None:
+        self.namespaces[namespace].rejected_writes += 1
+
+    def record_read(
+        self,
+        namespace: CacheNamespace,
+        tier: CacheTier,
+        latency: float,
+        size: int,
+    ) -> None:
+        stats = self.namespaces[namespace]
+        stats.tier_hits[tier] += 1
+        stats.read_bytes.observe(size)
+        if tier == CacheTier.BACKEND:
+            stats.read_latency.observe(latency)
+
+    def record_write(
+        self, namespace: CacheNamespace, latency: float, size: int
+    ) -> None:
+        stats = self.namespaces[namespace]
+        stats.write_latency.observe(latency)
+        stats.written_bytes.observe(size)
+
+
+cache_stats = CacheStats()
+
+request_cache_stats: ContextVar[dict[CacheOutcome, int] | None] = ContextVar(
+    "request_cache_stats", default=None
+)
+# off for background refreshes, which no client is waiting on
+recording_outcomes: ContextVar[bool] = ContextVar("recording_outcomes", default=True)
+
+
+async def cache_stats_headers(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    outcomes = dict.fromkeys(CacheOutcome, 0)
+    token = request_cache_stats.set(outcomes)
+    try:
+        response = await call_next(request)
+    finally:
+        request_cache_stats.reset(token)
+
+    misses = outcomes[CacheOutcome.MISS]
+    hits = sum(outcomes.values()) - misses
+    if hits or misses:
+        response.headers["X-Cache"] = (
+            "MISS" if hits == 0 else "HIT" if misses == 0 else "PARTIAL"
+        )
+        for outcome, count in outcomes.items():
+            response.headers[f"X-Cache-{outcome.capitalize()}"] = str(count)
+    return response
@@ -0,0 +1,288 @@
+import gzip
+import re
+import time
+import uuid
+import zlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.body_store import resolve_bodies
+from search_crawl.cache.codec import CacheEntry, get_codec
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import VALIDATOR_HEADERS
+from search_crawl.crawl.utils import URL
+
+from .schemas import WarcImportResult
+
+WARC_VERSION = "WARC/1.1"
+# records written by the export carry the cache key they were read from
+CACHE_KEY_FIELD = "Search-Crawl-Cache-Key"
+GZIP_MAGIC = b"\x1f\x8b"
+# bounds how many pages are held in memory at once
+BATCH_SIZE = 100
+
+
+def warc_record(fields: dict[str, str], block: bytes) -> bytes:
+    header = "".join(
+        f"{name}: {value}\r\n"
+        for name, value in {**fields, "Content-Length": str(len(block))}.items()
+    )
+    return f"{WARC_VERSION}\r\n{header}\r\n".encode() + block + b"\r\n\r\n"
+
+
+def warc_date(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def warcinfo_record() -> bytes:
+    return warc_record(
+        {
+            "WARC-Type": "warcinfo",
+            "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+            "WARC-Date": warc_date(time.time()),
+            "Content-Type": "application/warc-fields",
+        },
+        b"software: search-crawl\r\nformat: WARC File Format 1.1\r\n",
+    )
+
+
+def response_record(
+    cache_key: str, entry: CacheEntry, validators: dict[str, str]
+) -> bytes:
+    url, html = entry.value
+    body = html.encode()
+    http_header = "".join(
+        f"{name}: {value}\r\n"
+        for name, value in {
+            "Content-Type": "text/html; charset=utf-8",
+            "Content-Length": str(len(body)),
+            **validators,
+        }.items()
+    )
+    return warc_record(
+        {
+            "WARC-Type": "response",
+            "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+            "WARC-Date": warc_date(entry.stored_at or time.time()),
+            "WARC-Target-URI": url,
+            CACHE_KEY_FIELD: cache_key,
+            "Content-Type": "application/http; msgtype=response",
+        },
+        f"HTTP/1.1 200 OK\r\n{http_header}\r\n".encode() + body,
+    )
+
+
+async def export_scrape(*, compress: bool) -> AsyncIterator[bytes]:
+    # each record is its own gzip member, as in .warc.gz files
+    encode = gzip.compress if compress else bytes
+    yield encode(warcinfo_record())
+
+    backend = get_backend()
+    codec = get_codec()
+    async for keys in backend.scan(CacheNamespace.SCRAPE.cache_key("")):
+        for i in range(0, len(keys), BATCH_SIZE):
+            batch = keys[i : i + BATCH_SIZE]
+            raws = await backend.mget(batch)
+            entries = await resolve_bodies(
+                {
+                    key: codec.decode(raw)
+                    for key, raw in zip(batch, raws, strict=True)
+                    if raw
+                }
+            )
+
+            validator_keys = [
+                CacheNamespace.VALIDATORS.cache_key(URL(entry.value[0]).canonical)
+                for entry in entries.values()
+            ]
+            validator_raws = await backend.mget(validator_keys)
+            for (key, entry), validators_raw in zip(
+                entries.items(), validator_raws, strict=True
+            ):
+                validators = (
+                    codec.decode(validators_raw).value if validators_raw else {}
+                )
+                yield encode(response_record(key, entry, validators))
+
+
+class AsyncReader:
+    chunks: AsyncIterator[bytes]
+    buffer: bytearray
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self.chunks = chunks
+        self.buffer = bytearray()
+
+    async def fill(self) -> bool:
+        async for chunk in self.chunks:
+            self.buffer += chunk
+            return True
+        return False
+
+    def take(self, size: int) -> bytes:
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    async def readline(self) -> bytes:
+        while (end := self.buffer.find(b"\n")) < 0:
+            if not await self.fill():
+                return self.take(len(self.buffer))
+        return self.take(end + 1)
+
+    async def readexactly(self, size: int) -> bytes:
+        while len(self.buffer) < size:
+            if not await self.fill():
+                raise ValueError("Truncated WARC record")
+        return self.take(size)
+
+
+async def gunzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    is_gzip: bool | None = None
+    decompressor = None
+    async for chunk in chunks:
+        if is_gzip is None:
+            if not chunk:
+                continue
+            is_gzip = chunk.startswith(GZIP_MAGIC)
+        if not is_gzip:
+            yield chunk
+            continue
+
+        data = chunk
+        while data:
+            # a .warc.gz is a series of gzip members, one per record
+            if decompressor is None or decompressor.eof:
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            try:
+                yield decompressor.decompress(data)
+            except zlib.error as e:
+                raise ValueError(f"Invalid gzip data: {e}") from e
+            data = decompressor.unused_data
+
+
+async def read_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[dict[str, str], bytes]]:
+    reader = AsyncReader(gunzip(chunks))
+    while line := await reader.readline():
+        if not line.strip():
+            continue
+        if not line.startswith(b"WARC/"):
+            raise ValueError(f"Expected a WARC record, got {line[:32]!r}")
+
+        fields: dict[str, str] = {}
+        while (line := await reader.readline()).strip():
+            name, _, value = line.decode().partition(":")
+            fields[name.strip().lower()] = value.strip()
+        if not fields.get("content-length", "").isdigit():
+            raise ValueError("WARC record without a valid Content-Length")
+        block = await reader.readexactly(int(fields["content-length"]))
+        yield fields, block
+
+
+def dechunk(body: bytes) -> bytes:
+    chunks = []
+    while body:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line.split(b";")[0], 16)
+        if size == 0:
+            break
+        chunks.append(body[:size])
+        body = body[size + 2 :]
+    return b"".join(chunks)
+
+
+def parse_html_response(block: bytes) -> tuple[str, dict[str, str]] | None:
+    head, _, body = block.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    if status_line.split(" ")[1:2] != ["200"]:
+        return None
+
+    headers: dict[str, str] = {}
+    for header_line in header_lines:
+        name, _, value = header_line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    content_type = headers.get("content-type", "text/html")
+    if "html" not in content_type:
+        return None
+
+    if "chunked" in headers.get("transfer-encoding", ""):
+        body = dechunk(body)
+    match headers.get("content-encoding", "identity"):
+        case "identity":
+            pass
+        case "gzip" | "x-gzip":
+            body = gzip.decompress(body)
+        case "deflate":
+            body = zlib.decompress(body)
+        case _:
+            return None
+
+    charset = re.search(r"charset=([\w-]+)", content_type)
+    try:
+        html = body.decode(charset.group(1) if charset else "utf-8", errors="replace")
+    except LookupError:
+        html = body.decode(errors="replace")
+    return html, headers
+
+
+type ImportedPage = tuple[str, str, str, dict[str, str]]
+
+
+def imported_page(fields: dict[str, str], block: bytes) -> ImportedPage | None:
+    url = fields.get("warc-target-uri", "").strip("<>")
+    if not url:
+        return None
+    try:
+        parsed = parse_html_response(block)
+    except (ValueError, OSError, zlib.error):
+        return None
+    if parsed is None:
+        return None
+
+    html, headers = parsed
+    cache_key = fields.get(CACHE_KEY_FIELD.lower(), "")
+    if not cache_key.startswith(CacheNamespace.SCRAPE.cache_key("")):
+        cache_key = CacheNamespace.SCRAPE.cache_key(URL(url).canonical)
+    validators = {name: headers[name] for name in VALIDATOR_HEADERS if name in headers}
+    return cache_key, url, html, validators
+
+
+async def write_pages(pages: list[ImportedPage]) -> None:
+    # a fresh config per batch so written pages are not kept around
+    cache_config = CacheConfig(memory_namespaces=[])
+    async with cache_config.batch_writes():
+        for cache_key, url, html, validators in pages:
+            await cache_config.write(CacheNamespace.SCRAPE, cache_key, (url, html))
+            if validators:
+                await cache_config.write(
+                    CacheNamespace.VALIDATORS,
+                    CacheNamespace.VALIDATORS.cache_key(URL(url).canonical),
+                    validators,
+                )
+
+
+async def import_scrape(chunks: AsyncIterator[bytes]) -> WarcImportResult:
+    result = WarcImportResult()
+    pending: list[ImportedPage] = []
+    async for fields, block in read_records(chunks):
+        if fields.get("warc-type") != "response":
+            continue
+        page = imported_page(fields, block)
+        if page is None:
+            result.skipped += 1
+            continue
+
+        pending.append(page)
+        if len(pending) >= BATCH_SIZE:
+            await write_pages(pending)
+            result.imported += len(pending)
+            pending = []
+
+    if pending:
+        await write_pages(pending)
+        result.imported += len(pending)
+    return result
@@ -0,0 +1,111 @@
+import asyncio
+from collections import OrderedDict
+
+import httpx
+from lxml import etree
+
+from search_crawl.crawl import router as crawl_router
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.env_config import EnvConfig
+
+from .schemas import WarmJob, WarmJobStatus, WarmRequest
+
+# bounds how many prefetched pages are held in memory at once
+BATCH_SIZE = 100
+
+
+class WarmingConfig(EnvConfig):
+    env_prefix = "CACHE_WARM_"
+
+    concurrency: int = 2
+    max_jobs: int = 100
+    max_sitemap_depth: int = 2
+
+
+class Warmer:
+    config: WarmingConfig
+    sem: asyncio.Semaphore
+    jobs: OrderedDict[str, WarmJob]
+    tasks: set[asyncio.Task[None]]
+
+    def __init__(self, config: WarmingConfig) -> None:
+        self.config = config
+        self.sem = asyncio.Semaphore(config.concurrency)
+        self.jobs = OrderedDict()
+        self.tasks = set()
+
+    def start(self, req: WarmRequest) -> WarmJob:
+        job = WarmJob()
+        self.jobs[job.id] = job
+        while len(self.jobs) > self.config.max_jobs:
+            self.jobs.popitem(last=False)
+
+        task = asyncio.create_task(self.run(job, req))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return job
+
+    async def run(self, job: WarmJob, req: WarmRequest) -> None:
+        job.status = WarmJobStatus.RUNNING
+        try:
+            urls = list(req.urls)
+            if req.sitemap_url is not None:
+                urls += await self.read_sitemap(req.sitemap_url)
+            urls = list(dict.fromkeys(urls))[: req.max_urls]
+            job.total = len(urls)
+
+            for i in range(0, len(urls), BATCH_SIZE):
+                await self.warm_batch(job, req, urls[i : i + BATCH_SIZE])
+            job.status = WarmJobStatus.DONE
+        except Exception as e:
+            job.status = WarmJobStatus.FAILED
+            job.error = repr(e)
+
+    async def warm_batch(self, job: WarmJob, req: WarmRequest, urls: list[str]) -> None:
+        # a fresh config per batch so prefetched pages are not kept around
+        cache_config = req.cache_config.model_copy(deep=True)
+        crawler = Crawler(crawl_router.browser, req.crawl_config, cache_config)
+        await crawler.prefetch(urls)
+
+        async def warm(url: str) -> None:
+            try:
+                results = await crawler.crawl(url, self.sem)
+            except Exception:
+                job.failed += 1
+                return
+            # failed pages are reported in the results instead of raised
+            if any(result.error is not None for result in results):
+                job.failed += 1
+            else:
+                job.completed += 1
+
+        await asyncio.gather(*(warm(url) for url in urls))
+
+    async def read_sitemap(self, sitemap_url: str, depth: int = 0) -> list[str]:
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            response = await client.get(sitemap_url, timeout=30)
+            response.raise_for_status()
+
+        root = etree.fromstring(response.content)
+        locs = [
+            str(loc).strip() for loc in root.xpath("//*[local-name()='loc']/text()")
+        ]
+        if etree.QName(root).localname != "sitemapindex":
+            return locs
+        if depth >= self.config.max_sitemap_depth:
+            return []
+
+        nested = await asyncio.gather(
+            *(self.read_sitemap(loc, depth + 1) for loc in locs)
+        )
+        return [url for urls in nested for url in urls]
+
+
+warmer: Warmer | None = None
+
+
+def get_warmer() -> Warmer:
+    global warmer  # noqa: PLW0603
+    if warmer is None:
+        warmer = Warmer(WarmingConfig.from_env())
+    return warmer
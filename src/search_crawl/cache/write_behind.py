@@ -0,0 +1,98 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from typing import NamedTuple
+
+from fastapi import FastAPI
+
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.body_store import put_bodies
+from search_crawl.env_config import EnvConfig
+
+
+class WriteBehindConfig(EnvConfig):
+    env_prefix = "CACHE_WRITE_BEHIND_"
+
+    enabled: bool = False
+    max_queue: int = 10_000
+    batch_size: int = 100
+
+
+class PendingWrite(NamedTuple):
+    cache_key: str
+    raw: bytes
+    ttl: int | None
+    body: str | None = None  # html stored under its digest before the entry
+
+
+async def store_writes(writes: Sequence[PendingWrite]) -> None:
+    await put_bodies(
+        [(write.body, write.ttl) for write in writes if write.body is not None]
+    )
+    await get_backend().set_many(
+        [(write.cache_key, write.raw, write.ttl) for write in writes]
+    )
+
+
+class WriteBehind:
+    config: WriteBehindConfig
+    queue: asyncio.Queue[PendingWrite]
+    flusher: asyncio.Task[None]
+
+    def __init__(self, config: WriteBehindConfig) -> None:
+        self.config = config
+        self.queue = asyncio.Queue(config.max_queue)
+        self.flusher = asyncio.create_task(self.flush_forever())
+
+    def submit(self, writes: Sequence[PendingWrite]) -> bool:
+        # a full queue makes the caller write inline instead of growing memory
+        if self.queue.maxsize - self.queue.qsize() < len(writes):
+            return False
+        try:
+            for write in writes:
+                self.queue.put_nowait(write)
+        except asyncio.QueueShutDown:
+            return False
+        return True
+
+    async def flush_forever(self) -> None:
+        while True:
+            try:
+                batch = [await self.queue.get()]
+            except asyncio.QueueShutDown:
+                return
+            while len(batch) < self.config.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            # a failed batch is dropped like any other lost cache write
+            with contextlib.suppress(Exception):
+                await store_writes(batch)
+
+    async def aclose(self) -> None:
+        # the flusher drains what is queued before it stops
+        self.queue.shutdown()
+        await self.flusher
+
+
+write_behind: WriteBehind | None = None
+
+
+async def submit_writes(writes: Sequence[PendingWrite]) -> None:
+    if write_behind is None or not write_behind.submit(writes):
+        await store_writes(writes)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
+    global write_behind  # noqa: PLW0603
+    config = WriteBehindConfig.from_env()
+    if not config.enabled:
+        yield
+        return
+
+    write_behind = WriteBehind(config)
+    try:
+        yield
+    finally:
+        await write_behind.aclose()
+        write_behind = None
@@ -1,40 +1,286 @@
-import json
-import os
-from collections.abc import Awaitable, Callable
-from functools import wraps
+import math
+import random
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import partial, wraps
 from typing import Any, cast
 
-import redis
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
-r: redis.Redis | None = None
+from search_crawl.cache.backend import get_backend
+from search_crawl.cache.body_store import attach_body, digest, resolve_bodies
+from search_crawl.cache.codec import CacheEntry, ValueFormat, get_codec
+from search_crawl.cache.memory import get_memory_cache
+from search_crawl.cache.namespace import (
+    REVALIDATED_NAMESPACES,
+    VALUE_FORMATS,
+    CacheNamespace,
+)
+from search_crawl.cache.policy import TTL_CLASSES, TTLClass, get_policy
+from search_crawl.cache.single_flight import get_single_flight
+from search_crawl.cache.stats import CacheOutcome, CacheTier, cache_stats
+from search_crawl.cache.write_behind import PendingWrite, submit_writes
 
-
-def get_redis() -> redis.Redis:
-    global r  # noqa: PLW0603
-    if r is None:
-        r = redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
-    return r
+# bounds how long batched writes stay invisible to other requests and workers
+BATCH_FLUSH_SIZE = 100
 
 
 class CacheConfig(BaseModel):
     readable: bool = True
     writable: bool = True
     ttl: int | None = 60 * 60 * 24
+    ttl_jitter: float = 0.1
+    stale_while_revalidate: int | None = None
+    revalidation_window: int | None = None
+    memory_namespaces: list[CacheNamespace] = [
+        CacheNamespace.SEARCH,
+        CacheNamespace.SCRAPE,
+        CacheNamespace.ARTIFACT,
+        CacheNamespace.ALIAS,
+        CacheNamespace.NEGATIVE,
+        CacheNamespace.RESPONSE,
+        CacheNamespace.CRAWL,
+    ]
+    redirect_aliases: bool = True
+    negative_cache: bool = True
+    response_cache: bool = True
+    only_if_cached: bool = False
+
+    _prefetched: dict[str, CacheEntry] = PrivateAttr(default_factory=dict)
+    _pending_writes: list[PendingWrite] | None = PrivateAttr(default=None)
 
     def wrap_with_cache[R: Any, **P](
-        self, cache_key: str, func: Callable[P, Awaitable[R]]
+        self,
+        namespace: CacheNamespace,
+        key: str,
+        func: Callable[P, Awaitable[R]],
+        revalidate: Callable[[CacheEntry], Awaitable[bool]] | None = None,
+        ttl_class: TTLClass | Callable[[R], TTLClass | None] | None = None,
     ) -> Callable[P, Awaitable[R]]:
+        cache_key = namespace.cache_key(key)
+        flight_key = self.flight_key(cache_key)
+
+        lookup = partial(self.read_fresh, namespace, cache_key)
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            r = get_redis()
-            if self.readable and (cached_value := r.get(cache_key)):
-                return cast(R, json.loads(cast(str, cached_value)))
-            else:
-                result = await func(*args, **kwargs)
+            async def fetch(stale_entry: CacheEntry | None) -> R:
+                if stale_entry is not None and await self.try_revalidate(
+                    namespace, stale_entry, revalidate
+                ):
+                    result = cast(R, stale_entry.value)
+                else:
+                    result = await func(*args, **kwargs)
                 if self.writable:
-                    r.set(cache_key, json.dumps(result, ensure_ascii=False), self.ttl)
-
+                    result_ttl_class = (
+                        ttl_class(result) if callable(ttl_class) else ttl_class
+                    )
+                    await self.write(namespace, cache_key, result, result_ttl_class)
                 return result
 
+            single_flight = get_single_flight()
+            entry = await self.read(namespace, cache_key) if self.readable else None
+            if self.only_if_cached:
+                return await self.serve_cached_only(namespace, entry, fetch)
+            if entry is not None:
+                if not entry.is_stale:
+                    cache_stats.record_outcome(namespace, CacheOutcome.HIT)
+                    return cast(R, entry.value)
+                if self.can_serve_stale(entry):
+                    cache_stats.record_outcome(namespace, CacheOutcome.STALE)
+                    single_flight.start(flight_key, partial(fetch, entry), lookup)
+                    return cast(R, entry.value)
+            cache_stats.record_outcome(namespace, CacheOutcome.MISS)
+            return await single_flight.do(flight_key, partial(fetch, entry), lookup)
+
         return wrapper
+
+    def flight_key(self, cache_key: str) -> str:
+        # callers that would write the result differently do not share a fetch
+        ttl = self.ttl if "ttl" in self.model_fields_set else "policy"
+        return (
+            f"{cache_key}|{self.writable}|{ttl}"
+            f"|{self.stale_while_revalidate_or_default()}"
+            f"|{self.revalidation_window_or_default()}"
+        )
+
+    async def read_fresh(self, namespace: CacheNamespace, cache_key: str) -> Any:  # noqa: ANN401
+        entry = await self.read(namespace, cache_key)
+        if entry is None or entry.is_stale:
+            return None
+        return entry.value
+
+    async def try_revalidate(
+        self,
+        namespace: CacheNamespace,
+        stale_entry: CacheEntry,
+        revalidate: Callable[[CacheEntry], Awaitable[bool]] | None,
+    ) -> bool:
+        if revalidate is None or not await revalidate(stale_entry):
+            return False
+        cache_stats.record_revalidation(namespace)
+        return True
+
+    async def serve_cached_only[R](
+        self,
+        namespace: CacheNamespace,
+        entry: CacheEntry | None,
+        fetch: Callable[[CacheEntry | None], Awaitable[R]],
+    ) -> R:
+        if entry is None:
+            cache_stats.record_outcome(namespace, CacheOutcome.MISS)
+            # func may only derive the value from other entries here, so the
+            # call is not shared with callers that are allowed to fetch
+            return await fetch(None)
+        outcome = CacheOutcome.STALE if entry.is_stale else CacheOutcome.HIT
+        cache_stats.record_outcome(namespace, outcome)
+        return cast(R, entry.value)
+
+    def can_serve_stale(self, entry: CacheEntry) -> bool:
+        stale_while_revalidate = self.stale_while_revalidate_or_default()
+        return (
+            stale_while_revalidate > 0
+            and entry.fresh_until + stale_while_revalidate > time.time()
+        )
+
+    def stale_while_revalidate_or_default(self) -> int:
+        # an explicit window in the request overrides the policy, None disables it
+        if "stale_while_revalidate" in self.model_fields_set:
+            return self.stale_while_revalidate or 0
+        return get_policy().stale_while_revalidate or 0
+
+    def revalidation_window_or_default(self) -> int:
+        # an explicit window in the request overrides the policy, None disables it
+        if "revalidation_window" in self.model_fields_set:
+            return self.revalidation_window or 0
+        return get_policy().revalidation_window or 0
+
+    def jittered_ttl(self, ttl_class: TTLClass) -> int | None:
+        # an explicit ttl in the request overrides the policy for successful results
+        explicit = "ttl" in self.model_fields_set and ttl_class != TTLClass.FAILURE
+        ttl = self.ttl if explicit else get_policy().ttl(ttl_class)
+        if ttl is None:
+            return None
+        jitter = random.uniform(0, self.ttl_jitter)  # noqa: S311
+        return max(1, round(ttl * (1 - jitter)))
+
+    async def read(
+        self, namespace: CacheNamespace, cache_key: str
+    ) -> CacheEntry | None:
+        if (entry := self._prefetched.get(cache_key)) is not None:
+            cache_stats.record_read(namespace, CacheTier.PREFETCH, 0, entry.size)
+            return entry
+
+        use_memory = namespace in self.memory_namespaces
+        memory = get_memory_cache()
+        if use_memory and (entry := memory.get(cache_key)) is not None:
+            cache_stats.record_read(namespace, CacheTier.MEMORY, 0, entry.size)
+            return entry
+
+        started_at = time.perf_counter()
+        cached_raw, remaining_ttl = await get_backend().get_with_ttl(cache_key)
+        if not cached_raw:
+            return None
+
+        entry = get_codec().decode(cached_raw)
+        resolved = await resolve_bodies({cache_key: entry})
+        if (entry := resolved.get(cache_key)) is None:
+            return None
+        cache_stats.record_read(
+            namespace, CacheTier.BACKEND, time.perf_counter() - started_at, entry.size
+        )
+        if use_memory:
+            memory.set(
+                cache_key,
+                entry,
+                entry.size,
+                remaining_ttl if remaining_ttl >= 0 else None,
+            )
+        return entry
+
+    async def write(
+        self,
+        namespace: CacheNamespace,
+        cache_key: str,
+        value: Any,  # noqa: ANN401
+        ttl_class: TTLClass | None = None,
+    ) -> None:
+        stored_at = time.time()
+        ttl_class = ttl_class or TTL_CLASSES[namespace]
+        fresh_ttl = self.jittered_ttl(ttl_class)
+        if fresh_ttl is None:
+            fresh_until, ttl = math.inf, None
+        elif ttl_class == TTLClass.FAILURE:
+            # failures are retried as soon as they expire, never served stale
+            fresh_until, ttl = stored_at + fresh_ttl, fresh_ttl
+        else:
+            fresh_until = stored_at + fresh_ttl
+            keep_stale_for = self.stale_while_revalidate_or_default()
+            if namespace in REVALIDATED_NAMESPACES:
+                keep_stale_for = max(
+                    keep_stale_for, self.revalidation_window_or_default()
+                )
+            ttl = fresh_ttl + keep_stale_for
+
+        codec = get_codec()
+        value_format = VALUE_FORMATS[namespace]
+        if value_format == ValueFormat.PAIR_REF:
+            url, html = value
+            raw = codec.encode(
+                (url, digest(html)), value_format, stored_at, fresh_until
+            )
+            entry = attach_body(codec.decode(raw), html)
+        else:
+            raw = codec.encode(value, value_format, stored_at, fresh_until)
+            entry = codec.decode(raw)
+        if not get_policy().admits(entry.size):
+            cache_stats.record_rejected_write(namespace)
+            return
+
+        started_at = time.perf_counter()
+        body = entry.value[1] if value_format == ValueFormat.PAIR_REF else None
+        pending_write = PendingWrite(cache_key, raw, ttl, body)
+        if self._pending_writes is not None:
+            self._pending_writes.append(pending_write)
+            # keep it readable by the rest of this request until it is flushed
+            self._prefetched[cache_key] = entry
+            if len(self._pending_writes) >= BATCH_FLUSH_SIZE:
+                await self.flush_writes()
+        else:
+            await submit_writes([pending_write])
+            self._prefetched.pop(cache_key, None)
+        cache_stats.record_write(namespace, time.perf_counter() - started_at, len(raw))
+        if namespace in self.memory_namespaces:
+            get_memory_cache().set(cache_key, entry, entry.size, ttl)
+
+    async def prefetch(self, cache_keys: list[str]) -> None:
+        if not self.readable or not cache_keys:
+            return
+
+        codec = get_codec()
+        cached_raws = await get_backend().mget(cache_keys)
+        entries = {
+            cache_key: codec.decode(cached_raw)
+            for cache_key, cached_raw in zip(cache_keys, cached_raws, strict=True)
+            if cached_raw
+        }
+        self._prefetched.update(await resolve_bodies(entries))
+
+    async def flush_writes(self) -> None:
+        if not self._pending_writes:
+            return
+        pending_writes, self._pending_writes = self._pending_writes, []
+        await submit_writes(pending_writes)
+        for pending_write in pending_writes:
+            self._prefetched.pop(pending_write.cache_key, None)
+
+    @asynccontextmanager
+    async def batch_writes(self) -> AsyncGenerator[None]:
+        self._pending_writes = []
+        try:
+            yield
+        finally:
+            pending_writes, self._pending_writes = self._pending_writes, None
+            if pending_writes:
+                await submit_writes(pending_writes)
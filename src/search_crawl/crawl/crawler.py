@@ -1,11 +1,49 @@
 import asyncio
+from typing import Any, NamedTuple
 
-from patchright.async_api import Browser, Error as PlaywrightError
+import httpx
+from lxml import html
+from patchright.async_api import (
+    Browser,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
+from search_crawl.cache.codec import CacheEntry
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.policy import TTLClass
+from search_crawl.cache.popularity import record_access
 from search_crawl.cache_config import CacheConfig
 
-from .schemas import CrawlConfig, CrawlScope, OutputFormat, ScrapeResult
-from .utils import URL, Navigation, Readable
+from .schemas import (
+    CrawlConfig,
+    CrawlScope,
+    OutputFormat,
+    ScrapeError,
+    ScrapeErrorKind,
+    ScrapeResult,
+)
+from .utils import URL, Navigation, Readable, get_pruning_config, prune_html
+
+# response header -> conditional request header
+VALIDATOR_HEADERS = {
+    "etag": "If-None-Match",
+    "last-modified": "If-Modified-Since",
+}
+
+
+class RawPage(NamedTuple):
+    url: str
+    html: str
+    validators: dict[str, str]
+
+
+class ScrapeFailedError(Exception):
+    error: ScrapeError
+
+    def __init__(self, error: ScrapeError) -> None:
+        super().__init__(error.message)
+        self.error = error
 
 
 class Crawler:
@@ -23,22 +61,90 @@ class Crawler:
         self.crawl_config = crawl_config
         self.cache_config = cache_config
 
+    def artifact_key(self, requested_url: str) -> str:
+        canonical_url = URL(requested_url).canonical
+        return f"{self.crawl_config.output_format}:{canonical_url}"
+
+    def crawl_key(self, requested_url: str) -> str:
+        config = self.crawl_config
+        canonical_url = URL(requested_url).canonical
+        return (
+            f"{config.crawl_scope}:{config.max_depth}:{config.max_pages}:"
+            f"{config.output_format}:{canonical_url}"
+        )
+
+    async def prefetch(self, requested_urls: list[str]) -> None:
+        await self.cache_config.prefetch(
+            [
+                namespace.cache_key(key)
+                for requested_url in requested_urls
+                for namespace, key in [
+                    (CacheNamespace.CRAWL, self.crawl_key(requested_url)),
+                    (CacheNamespace.ARTIFACT, self.artifact_key(requested_url)),
+                    (CacheNamespace.SCRAPE, URL(requested_url).canonical),
+                ]
+            ]
+        )
+
     async def crawl(
         self,
         requested_url: str,
         sem: asyncio.Semaphore,
     ) -> list[ScrapeResult]:
-        visited: list[URL] = []
+        results: list[ScrapeResult] | None = None
+
+        async def traverse_urls() -> list[str]:
+            nonlocal results
+            results = await self.traverse(requested_url, sem)
+            return [result.requested_url for result in results]
+
+        def crawl_ttl_class(_: list[str]) -> TTLClass | None:
+            # a failed page would otherwise stay out of the crawl for the full ttl
+            if results is not None and any(r.error is not None for r in results):
+                return TTLClass.FAILURE
+            return None
+
+        # a cached crawl only remembers which pages it reached, in order
+        cache_config = self.cache_config
+        if cache_config.only_if_cached:
+            # pages missing from the cache would cut the remembered crawl short
+            cache_config = cache_config.model_copy(update={"writable": False})
+        cached_traverse = cache_config.wrap_with_cache(
+            namespace=CacheNamespace.CRAWL,
+            key=self.crawl_key(requested_url),
+            func=traverse_urls,
+            ttl_class=crawl_ttl_class,
+        )
+        urls = await cached_traverse()
+        if results is not None:
+            return results
+
+        await self.prefetch(urls)
+
+        async def scrape(url: str) -> ScrapeResult:
+            async with sem:
+                return await self.scrape(url)
+
+        return list(await asyncio.gather(*(scrape(url) for url in urls)))
+
+    async def traverse(
+        self,
+        requested_url: str,
+        sem: asyncio.Semaphore,
+    ) -> list[ScrapeResult]:
+        # canonical urls, so page 1 matches its pagination base in one lookup
+        visited: set[str] = set()
         results: list[ScrapeResult] = []
 
         async def _crawl(_url: str, current_depth: int = 0) -> None:
             max_pages = self.crawl_config.max_pages
-            should_scrape_this = _url not in visited and (
+            canonical = URL(_url).canonical
+            should_scrape_this = canonical not in visited and (
                 max_pages is None or len(visited) < max_pages
             )
             if not should_scrape_this:
                 return
-            visited.append(URL(_url))
+            visited.add(canonical)
 
             async with sem:
                 result = await self.scrape(_url)
@@ -74,11 +180,27 @@ class Crawler:
         self,
         requested_url: str,
     ) -> ScrapeResult:
-        scrape_with_cache = self.cache_config.wrap_with_cache(
-            cache_key=f"scrape:{requested_url}",
-            func=self.scrape_raw,
+        if self.cache_config.readable:
+            # artifact hits count too, as they are derived from the scraped page
+            record_access(CacheNamespace.SCRAPE, URL(requested_url).canonical)
+        artifact_with_cache = self.cache_config.wrap_with_cache(
+            namespace=CacheNamespace.ARTIFACT,
+            key=self.artifact_key(requested_url),
+            func=self.scrape_artifact,
         )
-        url_str, raw_html = await scrape_with_cache(requested_url)
+        try:
+            artifact = await artifact_with_cache(requested_url)
+        except ScrapeFailedError as e:
+            return ScrapeResult(
+                requested_url=requested_url, url=requested_url, error=e.error
+            )
+        return ScrapeResult(requested_url=requested_url, **artifact)
+
+    async def scrape_artifact(
+        self,
+        requested_url: str,
+    ) -> dict[str, Any]:
+        url_str, raw_html = await self.scrape_raw_with_cache(requested_url)
         url = URL(url_str)
 
         readable = Readable(raw_html)
@@ -107,14 +229,169 @@ class Crawler:
             links=navigation.links,
             internal_links=navigation.internal_links,
             pagination_links=navigation.pagination_links,
+        ).model_dump(exclude={"requested_url"})
+
+    async def scrape_raw_with_cache(self, requested_url: str) -> tuple[str, str]:
+        cache_config = self.cache_config
+        cache_url = URL(requested_url).canonical
+        if cache_config.redirect_aliases and cache_config.readable:
+            alias = await cache_config.read(
+                CacheNamespace.ALIAS, CacheNamespace.ALIAS.cache_key(cache_url)
+            )
+            if alias is not None and not alias.is_stale:
+                cache_url = alias.value
+
+        async def scrape_raw_and_alias(requested_url: str) -> tuple[str, str]:
+            raw_page = await self.scrape_raw_or_fail_fast(requested_url, cache_url)
+            redirected_url = URL(raw_page.url).canonical
+            if cache_config.writable and raw_page.validators:
+                await cache_config.write(
+                    CacheNamespace.VALIDATORS,
+                    CacheNamespace.VALIDATORS.cache_key(redirected_url),
+                    raw_page.validators,
+                )
+            if (
+                cache_config.redirect_aliases
+                and cache_config.writable
+                and redirected_url != cache_url
+            ):
+                await cache_config.write(
+                    CacheNamespace.SCRAPE,
+                    CacheNamespace.SCRAPE.cache_key(redirected_url),
+                    (raw_page.url, raw_page.html),
+                )
+                await cache_config.write(
+                    CacheNamespace.ALIAS,
+                    CacheNamespace.ALIAS.cache_key(cache_url),
+                    redirected_url,
+                )
+            return raw_page.url, raw_page.html
+
+        scrape_with_cache = cache_config.wrap_with_cache(
+            namespace=CacheNamespace.SCRAPE,
+            key=cache_url,
+            func=scrape_raw_and_alias,
+            revalidate=self.revalidate,
+        )
+        return await scrape_with_cache(requested_url)
+
+    async def revalidate(self, stale_entry: CacheEntry) -> bool:
+        url_str, _ = stale_entry.value
+        validators_key = CacheNamespace.VALIDATORS.cache_key(URL(url_str).canonical)
+        validators = await self.cache_config.read(
+            CacheNamespace.VALIDATORS, validators_key
         )
+        if validators is None:
+            return False
+
+        headers = {
+            header: validators.value[name]
+            for name, header in VALIDATOR_HEADERS.items()
+            if name in validators.value
+        }
+        try:
+            async with (
+                httpx.AsyncClient(follow_redirects=True) as client,
+                # a changed page is rendered by the browser, so its body is not read
+                client.stream("GET", url_str, headers=headers, timeout=5) as response,
+            ):
+                status_code = response.status_code
+        except httpx.HTTPError:
+            return False
+
+        not_modified = status_code == httpx.codes.NOT_MODIFIED
+        if not_modified and self.cache_config.writable:
+            await self.cache_config.write(
+                CacheNamespace.VALIDATORS, validators_key, validators.value
+            )
+        return not_modified
+
+    async def scrape_raw_or_fail_fast(
+        self, requested_url: str, cache_url: str
+    ) -> RawPage:
+        cache_config = self.cache_config
+        negative_key = CacheNamespace.NEGATIVE.cache_key(cache_url)
+        if cache_config.negative_cache and cache_config.readable:
+            failure = await cache_config.read(CacheNamespace.NEGATIVE, negative_key)
+            if failure is not None and not failure.is_stale:
+                raise ScrapeFailedError(ScrapeError.model_validate(failure.value))
+        if cache_config.only_if_cached:
+            raise ScrapeFailedError(
+                ScrapeError(
+                    kind=ScrapeErrorKind.NOT_CACHED, message="Page is not cached"
+                )
+            )
 
-    async def scrape_raw(self, requested_url: str) -> tuple[str, str]:
+        try:
+            return await self.scrape_raw(requested_url)
+        except ScrapeFailedError as e:
+            if cache_config.negative_cache and cache_config.writable:
+                await cache_config.write(
+                    CacheNamespace.NEGATIVE, negative_key, e.error.model_dump()
+                )
+            raise
+
+    async def scrape_raw(self, requested_url: str) -> RawPage:
         page = await self.browser.new_page()
-        try:  # noqa: SIM105
-            await page.goto(requested_url, timeout=5000, wait_until="networkidle")
-        except PlaywrightError:
-            pass
-        raw_html = await page.content()
-        await page.close()
-        return page.url, raw_html
+        validators: dict[str, str] = {}
+        timed_out = False
+        try:
+            try:
+                response = await page.goto(
+                    requested_url, timeout=5000, wait_until="networkidle"
+                )
+            except PlaywrightTimeoutError:
+                # pages that never go idle still have usable content
+                response, timed_out = None, True
+            except PlaywrightError as e:
+                if (error := classify_error(e)) is not None:
+                    raise ScrapeFailedError(error) from e
+                response = None
+
+            if response is not None:
+                if response.status >= httpx.codes.BAD_REQUEST:
+                    raise ScrapeFailedError(
+                        ScrapeError(
+                            kind=ScrapeErrorKind.HTTP,
+                            status=response.status,
+                            message=response.status_text,
+                        )
+                    )
+                validators = {
+                    name: response.headers[name]
+                    for name in VALIDATOR_HEADERS
+                    if name in response.headers
+                }
+            raw_html = await page.content()
+        finally:
+            await page.close()
+
+        if timed_out and is_blank(raw_html):
+            raise ScrapeFailedError(
+                ScrapeError(
+                    kind=ScrapeErrorKind.TIMEOUT,
+                    message=f"Timed out without content: {requested_url}",
+                )
+            )
+        if get_pruning_config().enabled:
+            # pruned before caching, so every later parse reads less
+            raw_html = prune_html(raw_html)
+        return RawPage(page.url, raw_html, validators)
+
+
+def classify_error(error: PlaywrightError) -> ScrapeError | None:
+    message = error.message.splitlines()[0] if error.message else ""
+    if "net::ERR_NAME_NOT_RESOLVED" in message:
+        kind = ScrapeErrorKind.DNS
+    elif "net::ERR_TIMED_OUT" in message or "net::ERR_CONNECTION_TIMED_OUT" in message:
+        kind = ScrapeErrorKind.TIMEOUT
+    elif "net::ERR_" in message and "net::ERR_ABORTED" not in message:
+        kind = ScrapeErrorKind.CONNECTION
+    else:
+        # e.g. aborted navigations of downloads, which still leave a page behind
+        return None
+    return ScrapeError(kind=kind, message=message)
+
+
+def is_blank(raw_html: str) -> bool:
+    return not raw_html.strip() or not html.fromstring(raw_html).text_content().strip()
@@ -3,8 +3,10 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 from patchright.async_api import Browser, async_playwright
 
+from search_crawl.cache.response_cache import CachedResponseRoute
 from search_crawl.search.router import search
 
 from .crawler import Crawler, ScrapeResult
@@ -31,7 +33,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
         yield
 
 
-router = APIRouter(lifespan=lifespan)
+router = APIRouter(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    route_class=CachedResponseRoute,
+)
 
 
 @router.post("/crawl")
@@ -51,16 +57,21 @@ async def crawl_many(
     req: CrawlRequestWithUrls,
 ) -> list[list[ScrapeResult]]:
     sem = asyncio.Semaphore(req.crawl_config.concurrently)
-    return await asyncio.gather(
-        *(
-            Crawler(
-                browser,
-                req.crawl_config,
-                req.cache_config,
-            ).crawl(url, sem)
-            for url in req.urls
-        )
+    crawler = Crawler(
+        browser,
+        req.crawl_config,
+        req.cache_config,
     )
+    await crawler.prefetch(req.urls)
+
+    async def crawl_and_flush(url: str) -> list[ScrapeResult]:
+        results = await crawler.crawl(url, sem)
+        # pages of finished seeds are visible to others before the batch ends
+        await req.cache_config.flush_writes()
+        return results
+
+    async with req.cache_config.batch_writes():
+        return await asyncio.gather(*(crawl_and_flush(url) for url in req.urls))
 
 
 @router.post("/search-crawl")
@@ -70,7 +81,7 @@ async def search_crawl(
     search_results = await search(req.search)
     crawl_results = await crawl_many(
         CrawlRequestWithUrls(
-            **req.crawl.model_dump(),
+            **req.crawl.model_dump(exclude_unset=True),
             urls=[search_result.url for search_result in search_results],
         )
     )
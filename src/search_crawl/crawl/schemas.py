@@ -43,16 +43,31 @@ class CrawlRequestWithUrls(CrawlRequest):
     urls: list[str]
 
 
+class ScrapeErrorKind(StrEnum):
+    TIMEOUT = auto()
+    DNS = auto()
+    CONNECTION = auto()
+    HTTP = auto()
+    NOT_CACHED = auto()
+
+
+class ScrapeError(BaseModel):
+    kind: ScrapeErrorKind
+    status: int | None = None
+    message: str = ""
+
+
 class ScrapeResult(BaseModel):
     requested_url: str
     url: str
-    title: str
-    short_title: str
-    author: str
-    content: str
-    links: list[str]
-    internal_links: list[str]
-    pagination_links: list[str]
+    title: str = ""
+    short_title: str = ""
+    author: str = ""
+    content: str = ""
+    links: list[str] = []
+    internal_links: list[str] = []
+    pagination_links: list[str] = []
+    error: ScrapeError | None = None
 
 
 class SearchCrawlRequest(BaseModel):
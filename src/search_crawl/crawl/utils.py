@@ -9,10 +9,12 @@ from urllib.parse import (
     urlunsplit,
 )
 
-from lxml import html
+from lxml import etree, html
 from markitdown import MarkItDown, StreamInfo
 from readability import Document
 
+from search_crawl.env_config import EnvConfig
+
 
 class PaginationPattern:
     text = r"(p|pa|pag|page|pg|paging|pagination)([-_]?num)?"
@@ -27,6 +29,7 @@ class URL:
     with_pagination_base: str
     page: int | None
     normalized: str
+    canonical: str
 
     def __init__(self, url: str) -> None:
         parsed = urlsplit(url)
@@ -40,9 +43,8 @@ class URL:
             (parsed.scheme, parsed.netloc, pagination_basepath, "", "")
         )
 
-        matched = re.search(PaginationPattern.param, parsed.query) or re.search(
-            PaginationPattern.path, path
-        )
+        param_matched = re.search(PaginationPattern.param, parsed.query)
+        matched = param_matched or re.search(PaginationPattern.path, path)
         if matched:
             self.page = int(matched.group("num"))
         else:
@@ -53,6 +55,23 @@ class URL:
             (parsed.scheme, parsed.netloc, path, normalized_query, "")
         )
 
+        # page 1 is the same page as its pagination base
+        canonical_path, canonical_query = path, parsed.query
+        if self.page == 1 and param_matched:
+            start, end = param_matched.span()
+            canonical_query = parsed.query[:start] + parsed.query[end:]
+        elif self.page == 1:
+            canonical_path = pagination_basepath
+        self.canonical = urlunsplit(
+            (
+                parsed.scheme,
+                parsed.netloc,
+                canonical_path,
+                self.normalize_query(canonical_query),
+                "",
+            )
+        )
+
     def normalize_query(self, query: str) -> str:
         query_params = parse_qsl(query, keep_blank_values=True)
         normalized_query = urlencode(sorted(query_params))
@@ -77,7 +96,7 @@ class URL:
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.normalized)
+        return hash(self.canonical)
 
     def is_pagination_of(self, other: Self) -> bool:
         return (
@@ -86,6 +105,48 @@ class URL:
         )
 
 
+class HTMLPruningConfig(EnvConfig):
+    env_prefix = "HTML_PRUNING_"
+
+    enabled: bool = False
+
+
+pruning_config: HTMLPruningConfig | None = None
+
+
+def get_pruning_config() -> HTMLPruningConfig:
+    global pruning_config  # noqa: PLW0603
+    if pruning_config is None:
+        pruning_config = HTMLPruningConfig.from_env()
+    return pruning_config
+
+
+# never part of readable content or links, but often most of a rendered DOM
+PRUNED_TAGS = ["script", "style", "noscript", "svg", "template"]
+# event handlers and data-* attributes such as serialized hydration state
+PRUNED_ATTRIBUTE_PREFIXES = ("on", "data-")
+# lxml reports a default doctype for documents that declare none
+DOCTYPE = r"\s*(<!--.*?-->\s*)*<!doctype"
+
+
+def prune_html(raw_html: str) -> str:
+    if not raw_html.strip():
+        return raw_html
+    doc = html.document_fromstring(raw_html)
+    for element in list(doc.iter(*PRUNED_TAGS, etree.Comment)):
+        element.drop_tree()
+    for element in doc.iter(etree.Element):
+        for name in [
+            name
+            for name in element.attrib
+            if name.startswith(PRUNED_ATTRIBUTE_PREFIXES)
+        ]:
+            del element.attrib[name]
+    has_doctype = re.match(DOCTYPE, raw_html, re.IGNORECASE | re.DOTALL)
+    doctype = doc.getroottree().docinfo.doctype if has_doctype else None
+    return html.tostring(doc, encoding="unicode", doctype=doctype)
+
+
 class Readable(Document):
     raw_html: str
     markitdown: MarkItDown
@@ -0,0 +1,19 @@
+import os
+from typing import ClassVar, Self
+
+from pydantic import BaseModel
+
+
+class EnvConfig(BaseModel):
+    env_prefix: ClassVar[str]
+
+    @classmethod
+    def from_env(cls) -> Self:
+        return cls.model_validate(
+            {
+                name: value
+                for name in cls.model_fields
+                if (value := os.environ.get(f"{cls.env_prefix}{name.upper()}"))
+                is not None
+            }
+        )
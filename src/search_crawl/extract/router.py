@@ -33,7 +33,7 @@ async def search_crawl_extract(
     search_results = await search(req.search)
     crawl_results = await crawl_many(
         CrawlRequestWithUrls(
-            **req.crawl.model_dump(),
+            **req.crawl.model_dump(exclude_unset=True),
             urls=[search_result.url for search_result in search_results],
         )
     )
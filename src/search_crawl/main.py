@@ -1,6 +1,9 @@
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
+from .cache.backend import lifespan as cache_lifespan
+from .cache.router import router as cache_router
+from .cache.stats import cache_stats_headers
 from .crawl.router import router as crawl_router
 from .extract.router import router as extract_router
 from .healthz.router import router as healthz_router
@@ -9,6 +12,7 @@ from .search.router import router as search_router
 
 def main() -> FastAPI:
     app = FastAPI(
+        lifespan=cache_lifespan,
         license_info={
             "name": "WTFPL",
             "identifier": "WTFPL",
@@ -18,6 +22,8 @@ def main() -> FastAPI:
     app.include_router(search_router)
     app.include_router(crawl_router)
     app.include_router(extract_router)
+    app.include_router(cache_router)
+    app.middleware("http")(cache_stats_headers)
     simplify_client_method_names(app)
     return app
 
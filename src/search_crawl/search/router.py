@@ -1,14 +1,22 @@
 import os
 
 import httpx
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.policy import TTLClass
+from search_crawl.cache.popularity import record_access
+from search_crawl.cache.response_cache import CachedResponseRoute
 
 from .schemas import (
     SearchRequest,
     SearchResult,
 )
 
-router = APIRouter()
+router = APIRouter(
+    default_response_class=ORJSONResponse, route_class=CachedResponseRoute
+)
 
 
 @router.post("/search")
@@ -22,9 +30,15 @@ async def search(
 async def search_with_cache(
     req: SearchRequest,
 ) -> list[dict]:
+    if req.cache_config.readable:
+        record_access(CacheNamespace.SEARCH, req.cache_key)
     cached_search = req.cache_config.wrap_with_cache(
-        cache_key=f"search:{req.cache_key}",
-        func=searxng,
+        namespace=CacheNamespace.SEARCH,
+        key=req.cache_key,
+        func=not_cached if req.cache_config.only_if_cached else searxng,
+        ttl_class=(
+            TTLClass.RECENT_SEARCH if req.time_range == "day" else TTLClass.SEARCH
+        ),
     )
     results = await cached_search(req)
 
@@ -43,3 +57,9 @@ async def searxng(
             params=req.searxng_request,
         )
         return response.json()["results"]
+
+
+async def not_cached(
+    req: SearchRequest,  # noqa: ARG001
+) -> list[dict]:
+    raise HTTPException(status_code=504, detail="Search results are not cached")
@@ -0,0 +1,130 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+
+from search_crawl.cache.backends.base import MISSING, NO_EXPIRY, CacheBackend, Eviction
+from search_crawl.cache.backends.memory import MemoryBackend, MemoryBackendConfig
+from search_crawl.cache.backends.sqlite import SQLiteBackend, SQLiteCacheConfig
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def backend(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> AsyncGenerator[CacheBackend]:
+    if request.param == "memory":
+        backend = MemoryBackend(MemoryBackendConfig())
+    else:
+        backend = SQLiteBackend(
+            SQLiteCacheConfig(path=str(tmp_path / "cache.sqlite3"), sweep_interval=0)
+        )
+    yield backend
+    await backend.aclose()
+
+
+async def test_set_and_get(backend: CacheBackend) -> None:
+    await backend.set("a", b"1", None)
+    await backend.set_many([("b", b"2", 60), ("c", b"3", None)])
+
+    assert await backend.get("a") == b"1"
+    assert await backend.mget(["a", "missing", "b"]) == [b"1", None, b"2"]
+    assert await backend.get_with_ttl("b") == (b"2", 60)
+    assert await backend.ttl("c") == NO_EXPIRY
+    assert await backend.ttl("missing") == MISSING
+
+
+async def test_set_nx(backend: CacheBackend) -> None:
+    assert await backend.set("a", b"1", None, nx=True)
+    assert not await backend.set("a", b"2", None, nx=True)
+    assert await backend.get("a") == b"1"
+
+
+async def test_set_many_nx_or_extend(backend: CacheBackend) -> None:
+    await backend.set_many([("a", b"1", 10), ("b", b"2", 100), ("c", b"3", None)])
+    await backend.set_many_nx_or_extend(
+        [("a", b"x", 100), ("b", b"x", 10), ("c", b"x", 10), ("d", b"4", 10)]
+    )
+    assert await backend.mget(["a", "b", "c", "d"]) == [b"1", b"2", b"3", b"4"]
+    assert [await backend.ttl(key) for key in "abcd"] == [100, 100, NO_EXPIRY, 10]
+
+    await backend.set_many_nx_or_extend([("a", b"x", None)])
+    assert await backend.get_with_ttl("a") == (b"1", NO_EXPIRY)
+
+
+async def test_expiry(backend: CacheBackend) -> None:
+    await backend.set("a", b"1", 0.05)
+    await backend.set("b", b"2", 0.05)
+    await backend.expire("b", None)
+    await asyncio.sleep(0.1)
+
+    assert not await backend.exists("a")
+    assert await backend.set("a", b"3", None, nx=True)
+    assert await backend.get("b") == b"2"
+
+
+async def test_delete(backend: CacheBackend) -> None:
+    await backend.set("a", b"1", None)
+    await backend.delete("a")
+    assert await backend.get("a") is None
+
+    await backend.set_many([("b", b"2", None), ("c", b"3", None), ("d", b"4", None)])
+    await backend.delete_many(["b", "c", "missing"])
+    assert await backend.mget(["b", "c", "d"]) == [None, None, b"4"]
+
+
+async def test_sqlite_sweep(tmp_path: Path) -> None:
+    backend = SQLiteBackend(
+        SQLiteCacheConfig(path=str(tmp_path / "cache.sqlite3"), sweep_interval=0)
+    )
+    await backend.set_many([(str(i), b"x", 0.01) for i in range(5)])
+    await backend.set("kept", b"x", None)
+    await asyncio.sleep(0.05)
+
+    assert await backend.sweep() == 5
+    assert await backend.get("kept") == b"x"
+    await backend.aclose()
+
+
+@pytest.mark.parametrize("eviction", list(Eviction))
+async def test_memory_budget(eviction: Eviction) -> None:
+    backend = MemoryBackend(MemoryBackendConfig(max_bytes=30, eviction=eviction))
+    await backend.set_many([("a", b"a" * 10, None), ("b", b"b" * 10, None)])
+    await backend.get("a")
+    await backend.get("a")
+    await backend.get("b")
+    await backend.set("c", b"c" * 10, None)
+    await backend.get("c")
+    await backend.set("d", b"d" * 10, None)
+
+    survivor, evicted = ("c", "a") if eviction == Eviction.LRU else ("a", "c")
+    assert backend.total_bytes <= 30
+    assert await backend.get(evicted) is None
+    assert await backend.get(survivor) is not None
+    assert await backend.get("d") is not None
+
+
+async def test_sqlite_budget(tmp_path: Path) -> None:
+    backend = SQLiteBackend(
+        SQLiteCacheConfig(
+            path=str(tmp_path / "cache.sqlite3"), sweep_interval=0, max_bytes=30
+        )
+    )
+    await backend.set_many([(key, b"x" * 10, None) for key in "abcd"])
+    await backend.get("a")
+    await backend.flush_touches()
+
+    assert await backend.evict() == 2
+    assert await backend.mget(list("abcd")) == [b"x" * 10, None, None, b"x" * 10]
+    await backend.aclose()
+
+
+async def test_scan(backend: CacheBackend) -> None:
+    keys = [f"scrape:{i:04}" for i in range(2500)]
+    await backend.set_many([(key, b"x", None) for key in keys])
+    await backend.set_many([("search:a", b"x", None), ("scrape;", b"x", None)])
+    await backend.set("scrape:expired", b"x", 0.01)
+    await asyncio.sleep(0.02)
+
+    scanned = [key async for batch in backend.scan("scrape:") for key in batch]
+    assert sorted(scanned) == keys
@@ -0,0 +1,64 @@
+import pytest
+
+from search_crawl import cache_config as cache_config_module
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+
+SEARCH = CacheNamespace.SEARCH
+
+
+async def test_prefetched_entries_are_read_without_the_backend(
+    memory_backend: MemoryBackend,
+) -> None:
+    await CacheConfig(memory_namespaces=[]).write(SEARCH, SEARCH.cache_key("a"), [1])
+    config = CacheConfig(memory_namespaces=[])
+    await config.prefetch([SEARCH.cache_key("a"), SEARCH.cache_key("missing")])
+    await memory_backend.delete(SEARCH.cache_key("a"))
+
+    entry = await config.read(SEARCH, SEARCH.cache_key("a"))
+    assert entry is not None
+    assert entry.value == [1]
+    assert await config.read(SEARCH, SEARCH.cache_key("missing")) is None
+
+
+async def test_unreadable_config_does_not_prefetch(
+    memory_backend: MemoryBackend,
+) -> None:
+    await CacheConfig(memory_namespaces=[]).write(SEARCH, SEARCH.cache_key("a"), [1])
+    config = CacheConfig(readable=False, memory_namespaces=[])
+    await config.prefetch([SEARCH.cache_key("a")])
+    await memory_backend.delete(SEARCH.cache_key("a"))
+    assert await config.read(SEARCH, SEARCH.cache_key("a")) is None
+
+
+async def test_batched_writes_land_after_the_block(
+    memory_backend: MemoryBackend,
+) -> None:
+    config = CacheConfig(memory_namespaces=[])
+    async with config.batch_writes():
+        await config.write(SEARCH, SEARCH.cache_key("a"), [1])
+        entry = await config.read(SEARCH, SEARCH.cache_key("a"))
+        assert entry is not None
+        assert entry.value == [1]
+        assert await memory_backend.get(SEARCH.cache_key("a")) is None
+    assert await memory_backend.get(SEARCH.cache_key("a")) is not None
+
+
+async def test_batched_writes_are_flushed_in_chunks(
+    memory_backend: MemoryBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache_config_module, "BATCH_FLUSH_SIZE", 2)
+    config = CacheConfig(memory_namespaces=[])
+    keys = [SEARCH.cache_key(key) for key in "abc"]
+    async with config.batch_writes():
+        for key in keys:
+            await config.write(SEARCH, key, [key])
+        assert [await memory_backend.get(key) is not None for key in keys] == [
+            True,
+            True,
+            False,
+        ]
+
+        await config.flush_writes()
+        assert await memory_backend.get(keys[2]) is not None
@@ -0,0 +1,49 @@
+from search_crawl.cache.backends.base import NO_EXPIRY
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.body_store import digest, put_bodies
+from search_crawl.cache.codec import get_codec
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+
+SCRAPE = CacheNamespace.SCRAPE
+BODY = CacheNamespace.BODY
+HTML = "<html><body>shared</body></html>"
+
+
+async def test_identical_pages_share_one_body(memory_backend: MemoryBackend) -> None:
+    config = CacheConfig(memory_namespaces=[])
+    for url in ["https://a.com", "https://b.com"]:
+        await config.write(SCRAPE, SCRAPE.cache_key(url), (url, HTML))
+
+    bodies = [
+        key async for keys in memory_backend.scan(BODY.cache_key("")) for key in keys
+    ]
+    assert bodies == [BODY.cache_key(digest(HTML))]
+    for url in ["https://a.com", "https://b.com"]:
+        raw = await memory_backend.get(SCRAPE.cache_key(url))
+        assert raw is not None
+        assert get_codec().decode(raw).value == [url, digest(HTML)]
+
+
+async def test_refresh_extends_the_body_ttl(memory_backend: MemoryBackend) -> None:
+    [body_digest] = await put_bodies([(HTML, 10)])
+    cache_key = BODY.cache_key(body_digest)
+    assert await memory_backend.ttl(cache_key) == 10
+
+    await put_bodies([(HTML, 100), (HTML, 10)])
+    assert await memory_backend.ttl(cache_key) == 100
+    await put_bodies([(HTML, None)])
+    assert await memory_backend.ttl(cache_key) == NO_EXPIRY
+
+
+async def test_page_without_its_body_is_a_miss(memory_backend: MemoryBackend) -> None:
+    config = CacheConfig(memory_namespaces=[])
+    await config.write(
+        SCRAPE, SCRAPE.cache_key("https://a.com"), ("https://a.com", HTML)
+    )
+    await memory_backend.delete(BODY.cache_key(digest(HTML)))
+
+    reader = CacheConfig(memory_namespaces=[])
+    assert await reader.read(SCRAPE, SCRAPE.cache_key("https://a.com")) is None
+    await reader.prefetch([SCRAPE.cache_key("https://a.com")])
+    assert await reader.read(SCRAPE, SCRAPE.cache_key("https://a.com")) is None
@@ -0,0 +1,56 @@
+import json
+import math
+import struct
+import time
+
+import pytest
+
+from search_crawl.cache.codec import CacheCodec, CompressionConfig, ValueFormat
+
+
+@pytest.fixture
+def codec() -> CacheCodec:
+    return CacheCodec(CompressionConfig(level=6, min_bytes=64))
+
+
+def test_pair_roundtrip(codec: CacheCodec) -> None:
+    value = ("https://example.com/", "<html>" + "日本語 " * 100 + "</html>")
+    raw = codec.encode(value, ValueFormat.PAIR, 0, math.inf)
+    assert codec.decode(raw).value == list(value)
+    assert len(raw) < len(value[1].encode())
+
+
+def test_json_roundtrip(codec: CacheCodec) -> None:
+    value = [{"url": "https://example.com/", "title": "example"}]
+    raw = codec.encode(value, ValueFormat.JSON, 0, math.inf)
+    assert codec.decode(raw).value == value
+
+
+def test_small_value_is_not_compressed(codec: CacheCodec) -> None:
+    value = ["https://example.com/", "<html></html>"]
+    raw = codec.encode(value, ValueFormat.PAIR, 0, math.inf)
+    assert raw.endswith(b"<html></html>")
+    assert codec.decode(raw).value == value
+
+
+def test_timestamps_roundtrip(codec: CacheCodec) -> None:
+    now = time.time()
+    fresh = codec.decode(codec.encode([], ValueFormat.JSON, now, now + 60))
+    assert fresh.stored_at == now
+    assert not fresh.is_stale
+
+    stale = codec.decode(codec.encode([], ValueFormat.JSON, now - 60, now - 1))
+    assert stale.is_stale
+
+
+def test_decodes_legacy_json_entry(codec: CacheCodec) -> None:
+    value = ["https://example.com/", "<html>日本語</html>"]
+    raw = json.dumps(value, ensure_ascii=False).encode()
+    assert codec.decode(raw).value == value
+
+
+def test_decodes_stdlib_json_payload(codec: CacheCodec) -> None:
+    value = [{"title": "日本語", "score": 1.5, "content": None}]
+    payload = json.dumps(value, ensure_ascii=False).encode()
+    raw = b"\x00sc\x02j-" + struct.pack(">dd", 0, math.inf) + payload
+    assert codec.decode(raw).value == value
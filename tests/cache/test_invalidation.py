@@ -0,0 +1,56 @@
+import math
+import time
+
+import pytest
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.codec import ValueFormat, get_codec
+from search_crawl.cache.invalidation import Invalidator
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.schemas import InvalidationRequest
+
+KEYS = [
+    CacheNamespace.SCRAPE.cache_key("https://a.com/x"),
+    CacheNamespace.SCRAPE.cache_key("https://docs.a.com/y"),
+    CacheNamespace.SCRAPE.cache_key("https://ba.com/z"),
+    CacheNamespace.ARTIFACT.cache_key("markdown:https://a.com/x"),
+    CacheNamespace.SEARCH.cache_key("a.com"),
+]
+
+
+@pytest.fixture(autouse=True)
+async def seed(memory_backend: MemoryBackend) -> None:
+    now = time.time()
+    for i, key in enumerate(KEYS):
+        # the first entries are the oldest
+        stored_at = now - 3600 * (len(KEYS) - i)
+        raw = get_codec().encode([], ValueFormat.JSON, stored_at, math.inf)
+        await memory_backend.set(key, raw, None)
+
+
+async def test_invalidate_domain(memory_backend: MemoryBackend) -> None:
+    result = await Invalidator(InvalidationRequest(domain="A.com")).run()
+    assert result.deleted == 3
+    assert set(memory_backend.entries) == {KEYS[2], KEYS[4]}
+
+
+async def test_invalidate_prefix(memory_backend: MemoryBackend) -> None:
+    result = await Invalidator(
+        InvalidationRequest(
+            namespaces=[CacheNamespace.SCRAPE], prefix="https://docs.a.com/"
+        )
+    ).run()
+    assert (result.scanned, result.deleted) == (1, 1)
+    assert KEYS[1] not in memory_backend.entries
+
+
+async def test_invalidate_older_than(memory_backend: MemoryBackend) -> None:
+    result = await Invalidator(InvalidationRequest(older_than=3 * 3600 - 60)).run()
+    assert result.deleted == 3
+    assert set(memory_backend.entries) == set(KEYS[3:])
+
+
+def test_artifact_keys_are_versioned() -> None:
+    key = CacheNamespace.ARTIFACT.cache_key("markdown:https://a.com/x")
+    assert not key.startswith("artifact:")
+    assert CacheNamespace.ARTIFACT.strip_prefix(key) == "markdown:https://a.com/x"
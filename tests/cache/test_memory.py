@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from search_crawl.cache.memory import MemoryCache
+
+
+def test_get_returns_stored_value() -> None:
+    cache = MemoryCache(max_bytes=100, max_ttl=60)
+    cache.set("a", ["value"], size=10, ttl=None)
+    assert cache.get("a") == ["value"]
+    assert cache.get("b") is None
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = MemoryCache(max_bytes=30, max_ttl=60)
+    cache.set("a", "a", size=10, ttl=None)
+    cache.set("b", "b", size=10, ttl=None)
+    cache.set("c", "c", size=10, ttl=None)
+    cache.get("a")
+    cache.set("d", "d", size=10, ttl=None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.total_bytes == 30
+
+
+def test_rejects_value_larger_than_budget() -> None:
+    cache = MemoryCache(max_bytes=10, max_ttl=60)
+    cache.set("a", "a", size=11, ttl=None)
+    assert cache.get("a") is None
+    assert cache.total_bytes == 0
+
+
+def test_expires_with_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = MemoryCache(max_bytes=100, max_ttl=60)
+    cache.set("a", "a", size=1, ttl=5)
+    cache.set("b", "b", size=1, ttl=None)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("b") is None
@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.policy import CachePolicyConfig, TTLClass, get_policy
+from search_crawl.cache.single_flight import get_single_flight
+from search_crawl.cache_config import CacheConfig
+from tests.conftest import Clock
+
+
+def test_ttl_classes() -> None:
+    policy = CachePolicyConfig(search_ttl=100, recent_search_ttl=10, page_ttl=None)
+    assert policy.ttl(TTLClass.SEARCH) == 100
+    assert policy.ttl(TTLClass.RECENT_SEARCH) == 10
+    assert policy.ttl(TTLClass.PAGE) is None
+
+
+def test_admits_values_up_to_max_size() -> None:
+    policy = CachePolicyConfig(max_value_bytes=10)
+    assert policy.admits(10)
+    assert not policy.admits(11)
+    assert CachePolicyConfig(max_value_bytes=None).admits(10**9)
+
+
+def test_explicit_ttl_overrides_policy() -> None:
+    recent_search_ttl = CachePolicyConfig().recent_search_ttl
+    assert CacheConfig(ttl_jitter=0).jittered_ttl(TTLClass.RECENT_SEARCH) == (
+        recent_search_ttl
+    )
+    assert CacheConfig(ttl=5, ttl_jitter=0).jittered_ttl(TTLClass.RECENT_SEARCH) == 5
+    assert CacheConfig(ttl=None).jittered_ttl(TTLClass.RECENT_SEARCH) is None
+
+
+@pytest.mark.usefixtures("memory_backend")
+async def test_stale_value_is_served_while_it_is_refreshed(
+    monkeypatch: pytest.MonkeyPatch, clock: Clock
+) -> None:
+    single_flight = get_single_flight()
+    started: list[asyncio.Future[object]] = []
+    start = single_flight.start
+
+    def record_start(
+        key: str,
+        func: Callable[[], Awaitable[object]],
+        lookup: Callable[[], Awaitable[object]],
+    ) -> asyncio.Future[object]:
+        started.append(start(key, func, lookup))
+        return started[-1]
+
+    monkeypatch.setattr(single_flight, "start", record_start)
+    calls = 0
+
+    async def search() -> list[int]:
+        nonlocal calls
+        calls += 1
+        return [calls]
+
+    cached_search = CacheConfig(memory_namespaces=[], ttl_jitter=0).wrap_with_cache(
+        CacheNamespace.SEARCH, "stale", search
+    )
+    assert await cached_search() == [1]
+
+    policy = get_policy()
+    clock.advance(policy.search_ttl or 0)
+    assert await cached_search() == [1]
+    assert await started[-1] == [2]
+    assert await cached_search() == [2]
+    assert calls == 2
+
+    clock.advance((policy.search_ttl or 0) + (policy.stale_while_revalidate or 0))
+    assert await cached_search() == [3]
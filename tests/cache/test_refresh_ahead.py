@@ -0,0 +1,129 @@
+import time
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from search_crawl.cache import backend as cache_backend
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.codec import ValueFormat, get_codec
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.popularity import Popularity
+from search_crawl.cache.refresh_ahead import RefreshAhead, RefreshAheadConfig
+from search_crawl.cache.stats import cache_stats, recording_outcomes
+from search_crawl.crawl import router as crawl_router
+from search_crawl.search import router as search_router
+from search_crawl.search.schemas import ENGINE_PRESETS, EnginePresetKey, SearchRequest
+from tests.conftest import FakeRenderer
+
+SCRAPE = CacheNamespace.SCRAPE
+SEARCH = CacheNamespace.SEARCH
+
+
+@pytest.fixture
+async def refresh_ahead(
+    memory_backend: MemoryBackend,  # noqa: ARG001
+) -> AsyncGenerator[RefreshAhead]:
+    refresh_ahead = RefreshAhead(
+        RefreshAheadConfig(interval=3600, lead_time=60, min_hits=2),
+        Popularity(max_keys=100),
+    )
+    yield refresh_ahead
+    await refresh_ahead.aclose()
+
+
+async def store(url: str, fresh_for: float) -> None:
+    raw = get_codec().encode(
+        [url, "<html></html>"], ValueFormat.PAIR, 0, time.time() + fresh_for
+    )
+    await cache_backend.get_backend().set(SCRAPE.cache_key(url), raw, None)
+
+
+def test_popularity_decay() -> None:
+    popularity = Popularity(max_keys=2)
+    for url, hits in [("a", 8), ("b", 4), ("c", 6)]:
+        for _ in range(hits):
+            popularity.record(SCRAPE, url)
+    assert popularity.hottest(2, min_hits=1) == [(SCRAPE, "a"), (SCRAPE, "c")]
+
+    popularity.decay(0.25)
+    assert popularity.hits == {(SCRAPE, "a"): 2, (SCRAPE, "c"): 1.5}
+
+
+async def test_due_keys_are_hot_and_about_to_expire(
+    refresh_ahead: RefreshAhead,
+) -> None:
+    await store("https://expiring.com", 30)
+    await store("https://fresh.com", 3600)
+    await store("https://cold.com", 30)
+    for url, hits in [
+        ("https://expiring.com", 3),
+        ("https://fresh.com", 3),
+        ("https://evicted.com", 2),
+        ("https://cold.com", 1),
+    ]:
+        for _ in range(hits):
+            refresh_ahead.popularity.record(SCRAPE, url)
+
+    assert await refresh_ahead.due() == [
+        (SCRAPE, "https://expiring.com"),
+        (SCRAPE, "https://evicted.com"),
+    ]
+
+
+async def test_recently_failed_pages_are_not_due(
+    refresh_ahead: RefreshAhead,
+) -> None:
+    for url in ["https://failing.com", "https://failed-long-ago.com"]:
+        for _ in range(3):
+            refresh_ahead.popularity.record(SCRAPE, url)
+    for url, fresh_for in [
+        ("https://failing.com", 30),
+        ("https://failed-long-ago.com", -30),
+    ]:
+        raw = get_codec().encode(
+            {"kind": "dns"}, ValueFormat.JSON, 0, time.time() + fresh_for
+        )
+        await cache_backend.get_backend().set(
+            CacheNamespace.NEGATIVE.cache_key(url), raw, None
+        )
+
+    assert await refresh_ahead.due() == [(SCRAPE, "https://failed-long-ago.com")]
+
+
+async def test_refresh_rewrites_the_page(
+    refresh_ahead: RefreshAhead,
+    renderer: FakeRenderer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(crawl_router, "browser", None, raising=False)
+    await store("https://a.com", 30)
+
+    await refresh_ahead.refresh(SCRAPE, "https://a.com")
+    raw = await cache_backend.get_backend().get(SCRAPE.cache_key("https://a.com"))
+    assert raw is not None
+    assert get_codec().decode(raw).fresh_until > time.time() + 3600
+    assert renderer.rendered == ["https://a.com"]
+
+
+async def test_refresh_reruns_the_search(
+    refresh_ahead: RefreshAhead, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    searched: list[SearchRequest] = []
+
+    async def searxng(req: SearchRequest) -> list[dict]:
+        searched.append(req)
+        return [{"url": "https://a.com"}]
+
+    monkeypatch.setattr(search_router, "searxng", searxng)
+    req = SearchRequest(q="日本語", time_range="day")
+    outcomes = dict(cache_stats.namespaces[SEARCH].outcomes)
+
+    await refresh_ahead.refresh(SEARCH, req.cache_key)
+    # a refresh is not a miss of any client request
+    assert cache_stats.namespaces[SEARCH].outcomes == outcomes
+    assert recording_outcomes.get()
+    assert [r.cache_key for r in searched] == [req.cache_key]
+    assert searched[0].engines == sorted(ENGINE_PRESETS[EnginePresetKey.general])
+    raw = await cache_backend.get_backend().get(SEARCH.cache_key(req.cache_key))
+    assert raw is not None
+    assert get_codec().decode(raw).value == [{"url": "https://a.com"}]
@@ -0,0 +1,113 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.response_cache import CachedResponseRoute
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.schemas import SearchCrawlRequest
+
+
+class EchoRequest(BaseModel):
+    text: str
+    repeat: int = 1
+    cache_config: CacheConfig = CacheConfig()
+
+
+calls: list[EchoRequest] = []
+router = APIRouter(route_class=CachedResponseRoute)
+
+
+@router.post("/echo")
+def echo(req: EchoRequest) -> list[str]:
+    calls.append(req)
+    return [req.text] * req.repeat
+
+
+@router.post("/search-crawl")
+def search_crawl(req: SearchCrawlRequest) -> list[str]:
+    calls.append(EchoRequest(text=req.search.q))
+    return [req.search.q]
+
+
+app = FastAPI()
+app.include_router(router)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls(memory_backend: MemoryBackend) -> MemoryBackend:
+    calls.clear()
+    return memory_backend
+
+
+def test_identical_requests_are_served_from_cache() -> None:
+    client = TestClient(app)
+    first = client.post("/echo", json={"text": "a"})
+    second = client.post("/echo", json={"repeat": 1, "text": "a"})
+    assert first.json() == second.json() == ["a"]
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert len(calls) == 1
+
+    client.post("/echo", json={"text": "a", "repeat": 2})
+    assert len(calls) == 2
+
+
+def test_if_none_match() -> None:
+    client = TestClient(app)
+    etag = client.post("/echo", json={"text": "b"}).headers["ETag"]
+
+    response = client.post(
+        "/echo", json={"text": "b"}, headers={"If-None-Match": f'W/"x", {etag}'}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    response = client.post(
+        "/echo", json={"text": "b"}, headers={"If-None-Match": '"x"'}
+    )
+    assert response.status_code == 200
+
+
+def test_response_cache_can_be_disabled() -> None:
+    client = TestClient(app)
+    body = {"text": "c", "cache_config": {"response_cache": False}}
+    client.post("/echo", json=body)
+    response = client.post("/echo", json=body)
+    assert "ETag" not in response.headers
+    assert len(calls) == 2
+
+
+def test_invalid_body_is_rejected() -> None:
+    assert TestClient(app).post("/echo", json={}).status_code == 422
+
+
+@pytest.mark.parametrize(
+    "crawl_cache_config",
+    [
+        {"readable": False},
+        {"writable": False},
+        {"response_cache": False},
+        {"only_if_cached": True},
+    ],
+)
+def test_any_step_can_bypass_the_response_cache(
+    crawl_cache_config: dict[str, bool],
+) -> None:
+    client = TestClient(app)
+    body = {"search": {"q": "d"}, "crawl": {"cache_config": crawl_cache_config}}
+    client.post("/search-crawl", json=body)
+    response = client.post("/search-crawl", json=body)
+    assert response.json() == ["d"]
+    assert "ETag" not in response.headers
+    assert len(calls) == 2
+
+
+def test_combined_requests_are_served_from_cache() -> None:
+    client = TestClient(app)
+    body = {"search": {"q": "e"}}
+    client.post("/search-crawl", json=body)
+    response = client.post("/search-crawl", json=body)
+    assert "ETag" in response.headers
+    assert len(calls) == 1
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.single_flight import (
+    DistributedLock,
+    SingleFlight,
+    SingleFlightConfig,
+)
+from search_crawl.cache_config import CacheConfig
+
+
+async def test_concurrent_calls_share_one_fetch() -> None:
+    single_flight = SingleFlight(SingleFlightConfig())
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def lookup() -> str | None:
+        return None
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", fetch, lookup) for _ in range(5))
+    )
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert single_flight.inflight == {}
+
+
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    single_flight = SingleFlight(SingleFlightConfig())
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def lookup() -> str | None:
+        return None
+
+    first = asyncio.create_task(single_flight.do("key", fetch, lookup))
+    second = asyncio.create_task(single_flight.do("key", fetch, lookup))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+
+
+async def test_distributed_lock(memory_backend: MemoryBackend) -> None:
+    lock = DistributedLock("key", ttl=1, poll_interval=0.01)
+    other = DistributedLock("key", ttl=1, poll_interval=0.01)
+    assert await lock.acquire()
+    assert not await other.acquire()
+
+    await other.release()
+    assert await memory_backend.exists("lock:key")
+
+    waiter = asyncio.create_task(other.wait_released())
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+    await lock.release()
+    await asyncio.wait_for(waiter, 1)
+    assert await other.acquire()
+
+
+@pytest.mark.usefixtures("memory_backend")
+async def test_callers_writing_differently_do_not_share_a_fetch() -> None:
+    calls = 0
+
+    async def search() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [calls]
+
+    configs = [
+        CacheConfig(memory_namespaces=[]),
+        CacheConfig(memory_namespaces=[]),
+        CacheConfig(memory_namespaces=[], writable=False),
+        CacheConfig(memory_namespaces=[], ttl=60),
+    ]
+    await asyncio.gather(
+        *(
+            config.wrap_with_cache(CacheNamespace.SEARCH, "shared", search)()
+            for config in configs
+        )
+    )
+    assert calls == 3
@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.router import router as cache_router
+from search_crawl.cache.stats import cache_stats_headers
+from search_crawl.search import router as search_router
+from search_crawl.search.schemas import SearchRequest
+
+app = FastAPI()
+app.include_router(search_router.router)
+app.include_router(cache_router)
+app.middleware("http")(cache_stats_headers)
+
+
+@pytest.fixture(autouse=True)
+def fake_searxng(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_backend: MemoryBackend,  # noqa: ARG001
+) -> None:
+    async def searxng(req: SearchRequest) -> list[dict]:
+        return [
+            {
+                "url": f"https://{req.q}.com",
+                "title": req.q,
+                "content": None,
+                "img_src": None,
+            }
+        ]
+
+    monkeypatch.setattr(search_router, "searxng", searxng)
+
+
+def namespace_stats(client: TestClient, namespace: str) -> dict[str, Any]:
+    return client.get("/cache/stats").json()["namespaces"][namespace]
+
+
+def test_miss_then_hit() -> None:
+    client = TestClient(app)
+    before = namespace_stats(client, "response")
+
+    first = client.post("/search", json={"q": "miss-then-hit"})
+    assert first.headers["X-Cache"] == "MISS"
+    assert first.headers["X-Cache-Miss"] == "2"  # the response and the search
+    second = client.post("/search", json={"q": "miss-then-hit"})
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["X-Cache-Hit"] == "1"
+    assert second.json() == first.json()
+
+    after = namespace_stats(client, "response")
+    assert after["outcomes"]["miss"] - before["outcomes"]["miss"] == 1
+    assert after["outcomes"]["hit"] - before["outcomes"]["hit"] == 1
+    assert after["tier_hits"]["memory"] - before["tier_hits"]["memory"] == 1
+    assert after["written_bytes"]["count"] - before["written_bytes"]["count"] == 1
+    assert after["write_latency"]["count"] - before["write_latency"]["count"] == 1
+    assert after["hit_ratio"] is not None
+
+
+def test_backend_reads_record_latency_and_size() -> None:
+    client = TestClient(app)
+    body = {
+        "q": "backend-read",
+        "cache_config": {"response_cache": False, "memory_namespaces": []},
+    }
+    client.post("/search", json=body)
+    before = namespace_stats(client, "search")
+
+    response = client.post("/search", json=body)
+    assert response.headers["X-Cache"] == "HIT"
+
+    after = namespace_stats(client, "search")
+    assert after["tier_hits"]["backend"] - before["tier_hits"]["backend"] == 1
+    assert after["read_latency"]["count"] - before["read_latency"]["count"] == 1
+    assert after["read_bytes"]["count"] - before["read_bytes"]["count"] == 1
+    assert after["read_bytes"]["sum"] > before["read_bytes"]["sum"]
@@ -0,0 +1,88 @@
+import gzip
+from collections.abc import AsyncIterator
+
+import pytest
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.warc import export_scrape, import_scrape, warc_record
+from search_crawl.cache_config import CacheConfig
+
+PAGES = {
+    "https://a.com": ("https://a.com/", "<html><body>a</body></html>"),
+    "https://b.com/x": ("https://b.com/x", "<html><body>b ü</body></html>"),
+}
+
+
+pytestmark = pytest.mark.usefixtures("memory_backend")
+
+
+async def chunked(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def read_page(key: str) -> list[str] | None:
+    config = CacheConfig(memory_namespaces=[])
+    entry = await config.read(
+        CacheNamespace.SCRAPE, CacheNamespace.SCRAPE.cache_key(key)
+    )
+    return None if entry is None else entry.value
+
+
+@pytest.mark.parametrize("compress", [True, False])
+async def test_round_trip(memory_backend: MemoryBackend, *, compress: bool) -> None:
+    config = CacheConfig(memory_namespaces=[])
+    for key, page in PAGES.items():
+        await config.write(
+            CacheNamespace.SCRAPE, CacheNamespace.SCRAPE.cache_key(key), page
+        )
+    await config.write(
+        CacheNamespace.VALIDATORS,
+        CacheNamespace.VALIDATORS.cache_key("https://a.com"),
+        {"etag": '"abc"'},
+    )
+
+    archive = b"".join([chunk async for chunk in export_scrape(compress=compress)])
+    assert archive.startswith(b"\x1f\x8b") == compress
+    memory_backend.entries.clear()
+
+    result = await import_scrape(chunked(archive))
+    assert (result.imported, result.skipped) == (2, 0)
+    for key, page in PAGES.items():
+        assert await read_page(key) == list(page)
+    validators = await config.read(
+        CacheNamespace.VALIDATORS, CacheNamespace.VALIDATORS.cache_key("https://a.com")
+    )
+    assert validators is not None
+    assert validators.value == {"etag": '"abc"'}
+
+
+async def test_imports_foreign_records() -> None:
+    body = gzip.compress(b"<html><body>hello</body></html>")
+    chunked_body = b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body)
+    http = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+        b"Content-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n\r\n" + chunked_body
+    )
+    records = [
+        ({"WARC-Type": "request", "WARC-Target-URI": "https://c.com/"}, b"GET /"),
+        ({"WARC-Type": "response", "WARC-Target-URI": "https://c.com/"}, http),
+        (
+            {"WARC-Type": "response", "WARC-Target-URI": "https://c.com/missing"},
+            b"HTTP/1.1 404 Not Found\r\n\r\n",
+        ),
+    ]
+    archive = b"".join(gzip.compress(warc_record(*record)) for record in records)
+
+    result = await import_scrape(chunked(archive))
+    assert (result.imported, result.skipped) == (1, 1)
+    assert await read_page("https://c.com") == [
+        "https://c.com/",
+        "<html><body>hello</body></html>",
+    ]
+
+
+async def test_rejects_non_warc_input() -> None:
+    with pytest.raises(ValueError, match="Expected a WARC record"):
+        await import_scrape(chunked(b"<html></html>"))
@@ -0,0 +1,138 @@
+import asyncio
+from functools import partial
+
+import httpx
+import pytest
+
+from search_crawl.cache import warming
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.schemas import WarmJob, WarmJobStatus, WarmRequest
+from search_crawl.cache.warming import Warmer, WarmingConfig
+from search_crawl.crawl import router as crawl_router
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import ScrapeError, ScrapeErrorKind, ScrapeResult
+
+DEAD = "https://dead.com/"
+SITEMAPS = {
+    "https://a.com/sitemap.xml": (
+        "sitemapindex",
+        ["https://a.com/s1.xml", "https://a.com/s2.xml"],
+    ),
+    "https://a.com/s1.xml": ("urlset", ["https://a.com/1", "https://a.com/2"]),
+    "https://a.com/s2.xml": ("urlset", ["https://a.com/2", "https://a.com/3"]),
+    "https://a.com/nested.xml": ("sitemapindex", ["https://a.com/sitemap.xml"]),
+}
+
+
+def sitemap_response(request: httpx.Request) -> httpx.Response:
+    if str(request.url) not in SITEMAPS:
+        return httpx.Response(404)
+    root, locs = SITEMAPS[str(request.url)]
+    entry = "sitemap" if root == "sitemapindex" else "url"
+    entries = "".join(f"<{entry}><loc> {loc} </loc></{entry}>" for loc in locs)
+    return httpx.Response(
+        200,
+        text=f'<{root} xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"{entries}</{root}>",
+    )
+
+
+@pytest.fixture(autouse=True)
+def fake_crawl(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_backend: MemoryBackend,  # noqa: ARG001
+) -> list[str]:
+    monkeypatch.setattr(crawl_router, "browser", None, raising=False)
+
+    crawled: list[str] = []
+
+    async def crawl(
+        _: Crawler, requested_url: str, sem: asyncio.Semaphore
+    ) -> list[ScrapeResult]:
+        async with sem:
+            crawled.append(requested_url)
+        error = ScrapeError(kind=ScrapeErrorKind.DNS) if requested_url == DEAD else None
+        return [
+            ScrapeResult(requested_url=requested_url, url=requested_url, error=error)
+        ]
+
+    monkeypatch.setattr(Crawler, "crawl", crawl)
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        partial(httpx.AsyncClient, transport=httpx.MockTransport(sitemap_response)),
+    )
+    return crawled
+
+
+async def test_read_sitemap() -> None:
+    warmer = Warmer(WarmingConfig())
+    assert await warmer.read_sitemap("https://a.com/s1.xml") == [
+        "https://a.com/1",
+        "https://a.com/2",
+    ]
+    assert await warmer.read_sitemap("https://a.com/sitemap.xml") == [
+        "https://a.com/1",
+        "https://a.com/2",
+        "https://a.com/2",
+        "https://a.com/3",
+    ]
+
+
+async def test_nested_sitemaps_beyond_max_depth_are_skipped() -> None:
+    warmer = Warmer(WarmingConfig(max_sitemap_depth=1))
+    assert len(await warmer.read_sitemap("https://a.com/sitemap.xml")) == 4
+    assert await warmer.read_sitemap("https://a.com/nested.xml") == []
+
+
+async def test_urls_are_deduplicated_and_limited(fake_crawl: list[str]) -> None:
+    job = WarmJob()
+    req = WarmRequest(
+        urls=["https://a.com/3", "https://a.com/1"],
+        sitemap_url="https://a.com/sitemap.xml",
+        max_urls=3,
+    )
+    await Warmer(WarmingConfig()).run(job, req)
+    assert sorted(fake_crawl) == [
+        "https://a.com/1",
+        "https://a.com/2",
+        "https://a.com/3",
+    ]
+    assert (job.total, job.completed, job.failed) == (3, 3, 0)
+
+
+async def test_pages_are_prefetched_per_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    prefetched: list[list[str]] = []
+
+    async def prefetch(_: Crawler, requested_urls: list[str]) -> None:
+        prefetched.append(requested_urls)
+
+    monkeypatch.setattr(Crawler, "prefetch", prefetch)
+    monkeypatch.setattr(warming, "BATCH_SIZE", 2)
+    urls = [f"https://a.com/{i}" for i in range(5)]
+    await Warmer(WarmingConfig()).run(WarmJob(), WarmRequest(urls=urls))
+    assert prefetched == [urls[:2], urls[2:4], urls[4:]]
+
+
+async def test_job_status() -> None:
+    warmer = Warmer(WarmingConfig(max_jobs=1))
+    job = warmer.start(WarmRequest(sitemap_url="https://a.com/s1.xml"))
+    assert job.status == WarmJobStatus.PENDING
+    await asyncio.gather(*warmer.tasks)
+    assert job.status == WarmJobStatus.DONE
+    assert (job.total, job.completed) == (2, 2)
+
+    failed = warmer.start(WarmRequest(sitemap_url="https://a.com/missing.xml"))
+    await asyncio.gather(*warmer.tasks)
+    assert failed.status == WarmJobStatus.FAILED
+    assert failed.error is not None
+    assert list(warmer.jobs) == [failed.id]
+
+
+async def test_failed_pages_are_counted_as_failed() -> None:
+    job = WarmJob()
+    await Warmer(WarmingConfig()).run(
+        job, WarmRequest(urls=["https://a.com/", DEAD, "https://b.com/"])
+    )
+    assert job.status == WarmJobStatus.DONE
+    assert (job.total, job.completed, job.failed) == (3, 2, 1)
@@ -0,0 +1,46 @@
+import pytest
+
+from search_crawl.cache import write_behind
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.write_behind import WriteBehind, WriteBehindConfig
+from search_crawl.cache_config import CacheConfig
+
+PAGE = ("https://a.com/", "<html><body>a</body></html>")
+
+
+pytestmark = pytest.mark.usefixtures("memory_backend")
+
+
+async def read_page(config: CacheConfig) -> list[str] | None:
+    entry = await config.read(
+        CacheNamespace.SCRAPE, CacheNamespace.SCRAPE.cache_key(PAGE[0])
+    )
+    return None if entry is None else entry.value
+
+
+async def test_writes_are_flushed_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = WriteBehind(WriteBehindConfig(enabled=True))
+    monkeypatch.setattr(write_behind, "write_behind", queue)
+    config = CacheConfig(memory_namespaces=[])
+
+    cache_key = CacheNamespace.SCRAPE.cache_key(PAGE[0])
+    await config.write(CacheNamespace.SCRAPE, cache_key, PAGE)
+    assert queue.queue.qsize() == 1
+    assert await read_page(config) is None
+
+    await queue.aclose()
+    assert await read_page(config) == list(PAGE)
+
+
+async def test_full_queue_writes_inline(monkeypatch: pytest.MonkeyPatch) -> None:
+    queue = WriteBehind(WriteBehindConfig(enabled=True, max_queue=1))
+    monkeypatch.setattr(write_behind, "write_behind", queue)
+    config = CacheConfig(memory_namespaces=[])
+
+    await config.write(CacheNamespace.SEARCH, CacheNamespace.SEARCH.cache_key("q"), [])
+    cache_key = CacheNamespace.SCRAPE.cache_key(PAGE[0])
+    await config.write(CacheNamespace.SCRAPE, cache_key, PAGE)
+    assert await read_page(config) == list(PAGE)
+    await queue.aclose()
@@ -1,8 +1,13 @@
+import time
 from collections.abc import AsyncGenerator
 from enum import StrEnum
 
 import pytest
 
+from search_crawl.cache import backend as cache_backend
+from search_crawl.cache.backends.memory import MemoryBackend, MemoryBackendConfig
+from search_crawl.crawl.crawler import Crawler, RawPage, ScrapeFailedError
+from search_crawl.crawl.schemas import ScrapeError, ScrapeErrorKind
 from search_crawl_client import (
     ApiClient,
     CacheConfig,
@@ -35,3 +40,66 @@ class SiteEnum(StrEnum):
     COUNTRY = "https://www.scrapethissite.com/pages/simple/"
     PRODUCTS = "https://web-scraping.dev/products"
     HOCKEY = "https://www.scrapethissite.com/pages/forms/?per_page=100"
+
+
+@pytest.fixture
+def memory_backend(monkeypatch: pytest.MonkeyPatch) -> MemoryBackend:
+    backend = MemoryBackend(MemoryBackendConfig())
+    monkeypatch.setattr(cache_backend, "backend", backend)
+    return backend
+
+
+class FakeRenderer:
+    html: str
+    validators: dict[str, str]
+    redirects: dict[str, str]
+    failing: set[str]
+    rendered: list[str]
+
+    def __init__(self) -> None:
+        self.html = "<html><body><p>rendered</p></body></html>"
+        self.validators = {}
+        self.redirects = {}
+        self.failing = set()
+        self.rendered = []
+
+    async def scrape_raw(self, requested_url: str) -> RawPage:
+        self.rendered.append(requested_url)
+        if requested_url in self.failing:
+            raise ScrapeFailedError(ScrapeError(kind=ScrapeErrorKind.TIMEOUT))
+        url = self.redirects.get(requested_url, requested_url)
+        return RawPage(url, self.html, dict(self.validators))
+
+
+@pytest.fixture
+def renderer(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_backend: MemoryBackend,  # noqa: ARG001
+) -> FakeRenderer:
+    renderer = FakeRenderer()
+
+    async def scrape_raw(_: Crawler, requested_url: str) -> RawPage:
+        return await renderer.scrape_raw(requested_url)
+
+    monkeypatch.setattr(Crawler, "scrape_raw", scrape_raw)
+    return renderer
+
+
+class Clock:
+    now: float
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock.time)
+    return clock
@@ -0,0 +1,52 @@
+from typing import cast
+
+import pytest
+from patchright.async_api import Browser
+
+from search_crawl.cache import backend as cache_backend
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig, OutputFormat
+from tests.conftest import FakeRenderer
+
+URL = "https://a.com/post"
+HTML = """<html><head><title>Post</title></head><body><article>
+<h1>Post</h1><p>A paragraph long enough to be kept as the main content.</p>
+</article></body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def rendered(renderer: FakeRenderer) -> list[str]:
+    renderer.html = HTML
+    return renderer.rendered
+
+
+def crawler(output_format: OutputFormat) -> Crawler:
+    return Crawler(
+        cast(Browser, None),
+        CrawlConfig(output_format=output_format),
+        CacheConfig(memory_namespaces=[]),
+    )
+
+
+async def test_other_formats_reuse_the_rendered_page(rendered: list[str]) -> None:
+    markdown = await crawler(OutputFormat.FULL_MARKDOWN).scrape(URL)
+    html = await crawler(OutputFormat.FULL_HTML).scrape(URL)
+    assert rendered == [URL]
+    assert markdown.content != html.content
+    assert "<title>Post</title>" in html.content
+
+
+async def test_each_format_has_its_own_artifact() -> None:
+    keys = {
+        output_format: crawler(output_format).artifact_key(URL)
+        for output_format in OutputFormat
+    }
+    assert len(set(keys.values())) == len(OutputFormat)
+
+    for output_format in OutputFormat:
+        await crawler(output_format).scrape(URL)
+    backend = cache_backend.get_backend()
+    for key in keys.values():
+        assert await backend.get(CacheNamespace.ARTIFACT.cache_key(key)) is not None
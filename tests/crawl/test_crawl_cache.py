@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+from patchright.async_api import Browser
+
+from search_crawl.cache.backends.memory import MemoryBackend
+from search_crawl.cache.policy import get_policy
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import Crawler, ScrapeFailedError
+from search_crawl.crawl.schemas import (
+    CrawlConfig,
+    ScrapeError,
+    ScrapeErrorKind,
+    ScrapeResult,
+)
+from tests.conftest import Clock
+
+PAGINATION = {
+    "https://a.com/list": ["https://a.com/list?page=2", "https://a.com/list?page=3"],
+    # page 1 and a trailing slash are the same page as the list itself
+    "https://a.com/list?page=2": [
+        "https://a.com/list?page=1",
+        "https://a.com/list?page=3",
+    ],
+    "https://a.com/list?page=3": ["https://a.com/list/", "https://a.com/list?page=2"],
+}
+
+
+@pytest.fixture(autouse=True)
+def fake_site(
+    monkeypatch: pytest.MonkeyPatch,
+    memory_backend: MemoryBackend,  # noqa: ARG001
+) -> list[str]:
+    traversed: list[str] = []
+    traverse = Crawler.traverse
+
+    async def scrape_artifact(_: Crawler, requested_url: str) -> dict[str, Any]:
+        return ScrapeResult(
+            requested_url=requested_url,
+            url=requested_url,
+            pagination_links=PAGINATION[requested_url],
+        ).model_dump(exclude={"requested_url"})
+
+    async def counted_traverse(
+        self: Crawler, requested_url: str, sem: asyncio.Semaphore
+    ) -> list[ScrapeResult]:
+        traversed.append(requested_url)
+        return await traverse(self, requested_url, sem)
+
+    monkeypatch.setattr(Crawler, "scrape_artifact", scrape_artifact)
+    monkeypatch.setattr(Crawler, "traverse", counted_traverse)
+    return traversed
+
+
+async def crawl(crawl_config: CrawlConfig) -> list[ScrapeResult]:
+    crawler = Crawler(
+        cast(Browser, None), crawl_config, CacheConfig(memory_namespaces=[])
+    )
+    return await crawler.crawl("https://a.com/list", asyncio.Semaphore(2))
+
+
+async def test_repeated_crawl_skips_traversal(fake_site: list[str]) -> None:
+    config = CrawlConfig(max_depth=3)
+    first = await crawl(config)
+    second = await crawl(config)
+    assert [r.requested_url for r in first] == [r.requested_url for r in second]
+    assert len(second) == len(PAGINATION)
+    assert fake_site == ["https://a.com/list"]
+
+
+async def test_crawl_config_is_part_of_the_key(fake_site: list[str]) -> None:
+    await crawl(CrawlConfig(max_depth=3))
+    limited = await crawl(CrawlConfig(max_depth=3, max_pages=1))
+    assert len(limited) == 1
+    assert len(fake_site) == 2
+
+
+async def test_traversal_visits_each_canonical_url_once() -> None:
+    results = await crawl(CrawlConfig(max_depth=3))
+    assert sorted(r.requested_url for r in results) == sorted(PAGINATION)
+
+
+async def test_failed_crawl_is_retried_after_the_failure_ttl(
+    monkeypatch: pytest.MonkeyPatch, clock: Clock
+) -> None:
+    failing = {"https://a.com/list"}
+    scrape_artifact = Crawler.scrape_artifact
+
+    async def flaky_scrape_artifact(
+        self: Crawler, requested_url: str
+    ) -> dict[str, Any]:
+        if requested_url in failing:
+            raise ScrapeFailedError(ScrapeError(kind=ScrapeErrorKind.TIMEOUT))
+        return await scrape_artifact(self, requested_url)
+
+    monkeypatch.setattr(Crawler, "scrape_artifact", flaky_scrape_artifact)
+    config = CrawlConfig(max_depth=3)
+    [failed] = await crawl(config)
+    assert failed.error is not None
+
+    failing.clear()
+    clock.advance(get_policy().failure_ttl)
+    recovered = await crawl(config)
+    assert sorted(r.requested_url for r in recovered) == sorted(PAGINATION)
+    assert all(r.error is None for r in recovered)
@@ -0,0 +1,47 @@
+import asyncio
+from typing import cast
+
+import pytest
+from patchright.async_api import Browser
+
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig, OutputFormat, ScrapeErrorKind
+from tests.conftest import FakeRenderer
+
+HTML = "<html><body><article><h1>Cached</h1><p>content</p></article></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def rendered(renderer: FakeRenderer) -> list[str]:
+    renderer.html = HTML
+    return renderer.rendered
+
+
+def crawler(output_format: OutputFormat, **cache_config: bool) -> Crawler:
+    return Crawler(
+        cast(Browser, None),
+        CrawlConfig(max_depth=0, output_format=output_format),
+        CacheConfig(memory_namespaces=[], **cache_config),
+    )
+
+
+async def test_only_if_cached(rendered: list[str]) -> None:
+    sem = asyncio.Semaphore(2)
+    await crawler(OutputFormat.FULL_MARKDOWN).crawl("https://a.com/", sem)
+    assert rendered == ["https://a.com/"]
+
+    # a new output format is parsed from the cached page without rendering it
+    offline = crawler(OutputFormat.FULL_HTML, only_if_cached=True)
+    [cached] = await offline.crawl("https://a.com/", sem)
+    [missing] = await offline.crawl("https://b.com/", sem)
+    assert "<h1>Cached</h1>" in cached.content
+    assert cached.error is None
+    assert missing.error is not None
+    assert missing.error.kind == ScrapeErrorKind.NOT_CACHED
+    assert rendered == ["https://a.com/"]
+
+    # the miss is neither remembered as a failure nor as a crawl result
+    [fetched] = await crawler(OutputFormat.FULL_HTML).crawl("https://b.com/", sem)
+    assert fetched.error is None
+    assert rendered == ["https://a.com/", "https://b.com/"]
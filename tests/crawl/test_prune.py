@@ -0,0 +1,118 @@
+from typing import cast
+
+import pytest
+from patchright.async_api import Browser
+
+from search_crawl.cache.namespace import CacheNamespace, parser_fingerprint
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl import utils
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig
+from search_crawl.crawl.utils import URL, Navigation, Readable, prune_html
+
+HTML = """<!DOCTYPE html>
+<html><head><title>Article - Site</title><meta name="author" content="Jane">
+<style>p { color: red }</style>
+<script id="__NEXT_DATA__" type="application/json">{"props": {"page": 1}}</script>
+</head><body onload="init()" data-state='{"user": null}'>
+<!-- rendered by the server -->
+<svg><symbol id="icon"><path d="M0 0h24v24H0z"/></symbol></svg>
+<article class="post"><h1>Article</h1>
+<p>First paragraph with <a href="/about">a link</a>.<script>track()</script></p>
+<noscript><p>Enable JavaScript</p></noscript>
+<a href="/list?page=2">next</a></article>
+</body></html>"""
+
+
+def test_prune_html() -> None:
+    pruned = prune_html(HTML)
+    for removed in [
+        "<script",
+        "<style",
+        "<svg",
+        "<noscript",
+        "<!--",
+        "onload",
+        "data-",
+    ]:
+        assert removed not in pruned
+    assert pruned.startswith("<!DOCTYPE html>")
+    assert len(pruned) < len(HTML)
+
+
+def test_prune_html_keeps_what_parsing_needs() -> None:
+    url = URL("https://a.com/list")
+    pruned = prune_html(HTML)
+    assert Navigation(pruned, url).links == Navigation(HTML, url).links
+
+    readable, pruned_readable = Readable(HTML), Readable(pruned)
+    assert pruned_readable.title() == readable.title()
+    assert pruned_readable.author() == readable.author()
+    assert "First paragraph with [a link](/about)" in pruned_readable.md
+
+
+def test_prune_blank_html() -> None:
+    assert prune_html("") == ""
+
+
+def test_prune_html_adds_no_doctype() -> None:
+    assert prune_html("<html><body><p>a</p></body></html>") == (
+        "<html><body><p>a</p></body></html>"
+    )
+    assert prune_html("<!-- a -->\n<!doctype html><p>a</p>").startswith(
+        "<!DOCTYPE html>\n"
+    )
+
+
+class FakeResponse:
+    status = 200
+    headers: dict[str, str] = {}  # noqa: RUF012
+
+
+class FakePage:
+    url = "https://a.com/list"
+
+    async def goto(self, *_: object, **__: object) -> FakeResponse:
+        return FakeResponse()
+
+    async def content(self) -> str:
+        return HTML
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeBrowser:
+    async def new_page(self) -> FakePage:
+        return FakePage()
+
+
+@pytest.mark.usefixtures("memory_backend")
+@pytest.mark.parametrize("enabled", ["true", "false"])
+async def test_rendered_pages_are_pruned_before_caching(
+    monkeypatch: pytest.MonkeyPatch, enabled: str
+) -> None:
+    monkeypatch.setenv("HTML_PRUNING_ENABLED", enabled)
+    monkeypatch.setattr(utils, "pruning_config", None)
+    crawler = Crawler(
+        cast(Browser, FakeBrowser()), CrawlConfig(), CacheConfig(memory_namespaces=[])
+    )
+
+    expected = prune_html(HTML) if enabled == "true" else HTML
+    assert (await crawler.scrape_raw(FakePage.url)).html == expected
+    await crawler.scrape_raw_with_cache(FakePage.url)
+    entry = await CacheConfig(memory_namespaces=[]).read(
+        CacheNamespace.SCRAPE, CacheNamespace.SCRAPE.cache_key(FakePage.url)
+    )
+    assert entry is not None
+    assert entry.value[1] == expected
+
+
+def test_pruning_is_part_of_the_parser_fingerprint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(utils, "pruning_config", None)
+    fingerprint = parser_fingerprint()
+    monkeypatch.setenv("HTML_PRUNING_ENABLED", "true")
+    monkeypatch.setattr(utils, "pruning_config", None)
+    assert parser_fingerprint() != fingerprint
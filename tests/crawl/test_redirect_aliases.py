@@ -0,0 +1,46 @@
+from typing import cast
+
+from patchright.async_api import Browser
+
+from search_crawl.cache import backend as cache_backend
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig
+from tests.conftest import FakeRenderer
+
+A = "https://a.com/old"
+B = "https://a.com/new"
+
+
+def crawler(*, redirect_aliases: bool = True) -> Crawler:
+    return Crawler(
+        cast(Browser, None),
+        CrawlConfig(),
+        CacheConfig(memory_namespaces=[], redirect_aliases=redirect_aliases),
+    )
+
+
+async def test_redirect_target_is_served_from_the_alias(
+    renderer: FakeRenderer,
+) -> None:
+    renderer.redirects = {A: B}
+    assert (await crawler().scrape_raw_with_cache(A))[0] == B
+
+    assert (await crawler().scrape_raw_with_cache(B))[0] == B
+    assert (await crawler().scrape_raw_with_cache(A))[0] == B
+    assert renderer.rendered == [A]
+    alias = await cache_backend.get_backend().get(CacheNamespace.ALIAS.cache_key(A))
+    assert alias is not None
+
+
+async def test_disabled_redirect_aliases_are_not_written(
+    renderer: FakeRenderer,
+) -> None:
+    renderer.redirects = {A: B}
+    await crawler(redirect_aliases=False).scrape_raw_with_cache(A)
+
+    assert (await crawler(redirect_aliases=False).scrape_raw_with_cache(B))[0] == B
+    assert renderer.rendered == [A, B]
+    backend = cache_backend.get_backend()
+    assert await backend.get(CacheNamespace.ALIAS.cache_key(A)) is None
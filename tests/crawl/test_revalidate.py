@@ -0,0 +1,153 @@
+from collections.abc import AsyncIterator, Callable
+from functools import partial
+from typing import cast
+
+import httpx
+import pytest
+from patchright.async_api import Browser
+
+from search_crawl.cache import backend as cache_backend, policy as policy_module
+from search_crawl.cache.codec import CacheEntry, get_codec
+from search_crawl.cache.namespace import CacheNamespace
+from search_crawl.cache.policy import CachePolicyConfig, get_policy
+from search_crawl.cache_config import CacheConfig
+from search_crawl.crawl.crawler import Crawler
+from search_crawl.crawl.schemas import CrawlConfig
+from tests.conftest import Clock, FakeRenderer
+
+URL = "https://a.com/page"
+ETAG = '"v1"'
+
+
+def serve(
+    monkeypatch: pytest.MonkeyPatch,
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        partial(httpx.AsyncClient, transport=httpx.MockTransport(record)),
+    )
+    return requests
+
+
+async def read(namespace: CacheNamespace) -> CacheEntry:
+    raw = await cache_backend.get_backend().get(namespace.cache_key(URL))
+    assert raw is not None
+    return get_codec().decode(raw)
+
+
+async def scrape(
+    cache_config: CacheConfig | None = None,
+) -> tuple[str, str]:
+    crawler = Crawler(
+        cast(Browser, None),
+        CrawlConfig(),
+        cache_config or CacheConfig(memory_namespaces=[]),
+    )
+    url, html = await crawler.scrape_raw_with_cache(URL)
+    return url, html
+
+
+def expire(clock: Clock) -> None:
+    # past the stale-while-revalidate window too, so the page is not served as is
+    policy = get_policy()
+    clock.advance((policy.page_ttl or 0) + (policy.stale_while_revalidate or 0))
+
+
+async def scrape_stale_page(renderer: FakeRenderer, clock: Clock) -> tuple[str, str]:
+    renderer.html = "<html>old</html>"
+    renderer.validators = {"etag": ETAG}
+    await scrape()
+
+    renderer.html = "<html>new</html>"
+    renderer.validators = {"etag": '"v2"'}
+    expire(clock)
+    return await scrape()
+
+
+async def test_not_modified_page_is_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch, renderer: FakeRenderer, clock: Clock
+) -> None:
+    requests = serve(monkeypatch, lambda _: httpx.Response(304))
+
+    assert await scrape_stale_page(renderer, clock) == (URL, "<html>old</html>")
+    assert renderer.rendered == [URL]
+    assert [r.headers["If-None-Match"] for r in requests] == [ETAG]
+    assert not (await read(CacheNamespace.SCRAPE)).is_stale
+    validators = await read(CacheNamespace.VALIDATORS)
+    assert not validators.is_stale
+    assert validators.value == {"etag": ETAG}
+
+
+async def test_modified_page_is_rendered(
+    monkeypatch: pytest.MonkeyPatch, renderer: FakeRenderer, clock: Clock
+) -> None:
+    downloaded: list[bytes] = []
+
+    async def body() -> AsyncIterator[bytes]:
+        downloaded.append(b"<html>new</html>")
+        yield downloaded[-1]
+
+    serve(monkeypatch, lambda _: httpx.Response(200, content=body()))
+
+    assert await scrape_stale_page(renderer, clock) == (URL, "<html>new</html>")
+    assert renderer.rendered == [URL, URL]
+    assert downloaded == []
+    assert (await read(CacheNamespace.VALIDATORS)).value == {"etag": '"v2"'}
+
+
+async def test_unreachable_origin_falls_back_to_rendering(
+    monkeypatch: pytest.MonkeyPatch, renderer: FakeRenderer, clock: Clock
+) -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    serve(monkeypatch, refuse)
+
+    assert await scrape_stale_page(renderer, clock) == (URL, "<html>new</html>")
+    assert renderer.rendered == [URL, URL]
+
+
+async def test_pages_expire_after_the_revalidation_window(
+    monkeypatch: pytest.MonkeyPatch, renderer: FakeRenderer, clock: Clock
+) -> None:
+    requests = serve(monkeypatch, lambda _: httpx.Response(304))
+    renderer.validators = {"etag": ETAG}
+    await scrape()
+
+    policy = get_policy()
+    clock.advance((policy.page_ttl or 0) + (policy.revalidation_window or 0))
+    await scrape()
+    assert renderer.rendered == [URL, URL]
+    assert requests == []
+
+
+@pytest.mark.parametrize("disabled_by", ["policy", "request"])
+async def test_revalidation_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+    renderer: FakeRenderer,
+    clock: Clock,
+    disabled_by: str,
+) -> None:
+    requests = serve(monkeypatch, lambda _: httpx.Response(304))
+    renderer.validators = {"etag": ETAG}
+    cache_config = CacheConfig(memory_namespaces=[])
+    if disabled_by == "policy":
+        monkeypatch.setattr(
+            policy_module, "policy", CachePolicyConfig(revalidation_window=0)
+        )
+    else:
+        cache_config = CacheConfig(memory_namespaces=[], revalidation_window=None)
+    await scrape(cache_config)
+
+    expire(clock)
+    await scrape(cache_config)
+    assert renderer.rendered == [URL, URL]
+    assert requests == []
@@ -0,0 +1,28 @@
+import pytest
+from patchright.async_api import Error as PlaywrightError
+
+from search_crawl.crawl.crawler import classify_error, is_blank
+from search_crawl.crawl.schemas import ScrapeErrorKind
+
+
+@pytest.mark.parametrize(
+    ("message", "kind"),
+    [
+        ("net::ERR_NAME_NOT_RESOLVED at https://a.invalid/", ScrapeErrorKind.DNS),
+        ("net::ERR_CONNECTION_TIMED_OUT at https://a.com/", ScrapeErrorKind.TIMEOUT),
+        ("net::ERR_CONNECTION_REFUSED at https://a.com/", ScrapeErrorKind.CONNECTION),
+        ("net::ERR_ABORTED at https://a.com/file.pdf", None),
+        ("Navigation interrupted", None),
+    ],
+)
+def test_classify_error(message: str, kind: ScrapeErrorKind | None) -> None:
+    error = classify_error(PlaywrightError(message + "\nCall log:\n  - navigating"))
+    assert (error and error.kind) == kind
+    if error is not None:
+        assert error.message == message
+
+
+def test_is_blank() -> None:
+    assert is_blank("")
+    assert is_blank("<html><head></head><body></body></html>")
+    assert not is_blank("<html><body><p>hello</p></body></html>")
@@ -104,3 +104,18 @@ def test_sorted_params_equals_unsorted_params(example_url: str) -> None:
 def test_with_slash_equals_without_slash(example_url: str) -> None:
     assert URL(f"{example_url}/a?page=1") == URL(f"{example_url}/a/?page=1")
     assert URL(f"{example_url}/a?page=1") == f"{example_url}/a/?page=1"
+
+
+def test_canonical(example_url: str) -> None:
+    assert URL(f"{example_url}/a/").canonical == f"{example_url}/a"
+    assert URL(f"{example_url}/a?z=9&b=2").canonical == f"{example_url}/a?b=2&z=9"
+    assert URL(f"{example_url}/a?page=1").canonical == f"{example_url}/a"
+    assert URL(f"{example_url}/a?b=2&page=1").canonical == f"{example_url}/a?b=2"
+    assert URL(f"{example_url}/a/page/1").canonical == f"{example_url}/a"
+    assert URL(f"{example_url}/a?page=2").canonical == f"{example_url}/a?page=2"
+    assert URL(f"{example_url}/a/page/2").canonical == f"{example_url}/a/page/2"
+
+
+def test_page1_hashes_as_toppage(example_url: str) -> None:
+    assert hash(URL(f"{example_url}/a?page=1")) == hash(URL(f"{example_url}/a"))
+    assert hash(URL(f"{example_url}/a/p/1")) == hash(URL(f"{example_url}/a/"))